@@ -1,41 +1,87 @@
 import logging
-from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 import allure
-from playwright.sync_api import sync_playwright
 
-from configs.settings import DEFAULT_CONFIGURATION_FILE
+from configs.settings import DEFAULT_CONFIGURATION_FILE, TEST_APP_URL
+from framework.execution.workers import EngineSlots, get_worker_dir, get_worker_id
 from framework.logger import logger
-from framework.ui.browser.browser import Browser
-from framework.ui.browser.window import DEFAULT_VIEWPORT_SIZE
-from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.browser.browser_server import DEFAULT_ENDPOINT_FILE
+from framework.ui.constants.browsers import BrowserType
+
+# Browser modules are imported by the fixtures that need them, so unit-only runs start without them
+if TYPE_CHECKING:
+    from playwright.sync_api import Playwright
+
+    from framework.api.api_client import ApiClient
+    from framework.api.data_seeder import DataSeeder
+    from framework.ui.browser.browser import Browser
+    from framework.ui.browser.browser_pool import BrowserPool
 
 PROJECT_ROOT_DIR = Path(__file__).parent.resolve()
 
+pytest_plugins = [
+    "framework.plugins.parallel",
+    "framework.plugins.scheduling",
+    "framework.plugins.impact",
+    "framework.plugins.matrix",
+    "framework.plugins.visual",
+    "framework.plugins.attachments",
+    "framework.plugins.retries",
+    "framework.plugins.loaders",
+    "framework.plugins.memory",
+]
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright: 'Playwright', pytestconfig: pytest.Config) -> 'BrowserPool':
+    """Browsers launched once per worker process and reused by all its tests."""
+    from framework.ui.browser.browser_pool import BrowserPool
+
+    endpoint_file = None if pytestconfig.getoption("--no-browser-server") else \
+        PROJECT_ROOT_DIR / pytestconfig.getoption("--browser-server-endpoint")
+    pool = BrowserPool(playwright, headless=pytestconfig.getoption("--headless"), server_endpoint_file=endpoint_file,
+                       reuse_contexts=pytestconfig.getoption("--context-reuse"))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def ui_browser_type(pytestconfig: pytest.Config) -> BrowserType:
+    """Browser engine of the test, parametrized per engine with --browser-matrix."""
+    return BrowserType(pytestconfig.getoption("--browser-type"))
+
+
+@pytest.fixture
+def ui_browser(browser_pool: 'BrowserPool', ui_browser_type: BrowserType, engine_slots: EngineSlots) -> 'Browser':
+    """Framework `Browser` wrapping a fresh context and page from the worker's browser pool."""
+    from framework.ui.browser.browser import Browser
+
+    with engine_slots.acquire(ui_browser_type.value):
+        context = browser_pool.acquire_context(ui_browser_type)
+        page = context.pages[0] if context.pages else context.new_page()
+        yield Browser(page)
+        browser_pool.release_context(context)
 
-class BrowserType(Enum):
-    CHROMIUM = "chromium"
-    FIREFOX = "firefox"
-    WEBKIT = "webkit"
 
+@pytest.fixture
+def api(ui_browser: 'Browser', pytestconfig: pytest.Config) -> 'ApiClient':
+    """API client of the test's browser context, relative paths resolved against --base-url or the test app URL."""
+    client = ui_browser.api
+    client.base_url = pytestconfig.getoption("base_url") or TEST_APP_URL
+    return client
 
-def _get_browser(playwright: sync_playwright, browser_type: BrowserType, headless: bool = False) -> Browser:
-    browser_map = {
-        BrowserType.FIREFOX: playwright.firefox,
-        BrowserType.WEBKIT: playwright.webkit,
-        BrowserType.CHROMIUM: playwright.chromium
-    }
-    browser = browser_map.get(browser_type, playwright.chromium)
-    browser_instance = browser.launch(headless=headless)
-    context = browser_instance.new_context(viewport=DEFAULT_VIEWPORT_SIZE)
-    context.set_default_timeout(WaitTimeoutsMs.WAIT_PAGE_LOAD)
 
-    page = context.new_page()
+@pytest.fixture
+def seed_data(api: 'ApiClient') -> 'DataSeeder':
+    """Create test data through the API, deleted again after the test."""
+    from framework.api.data_seeder import DataSeeder
 
-    custom_browser = Browser(page)
-    return custom_browser
+    seeder = DataSeeder(api)
+    yield seeder
+    seeder.cleanup()
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -44,12 +90,23 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption("--headless", action="store_true", help="Run browser in headless mode")
     parser.addoption("--config", default=DEFAULT_CONFIGURATION_FILE,
                      help="Path to config file relative to the project root directory")
+    parser.addoption("--browser-server-endpoint", default=str(DEFAULT_ENDPOINT_FILE),
+                     help="Endpoint file of a running browser server to connect to instead of launching a browser")
+    parser.addoption("--no-browser-server", action="store_true",
+                     help="Always launch a local browser, even if a browser server is running")
+    parser.addoption("--context-reuse", action="store_true",
+                     help="Reset and reuse browser contexts between tests instead of creating a new one per test. "
+                          "Contexts left with exposed bindings or storage that could not be cleared are replaced; "
+                          "permissions are cleared but not verified, init scripts are neither removed nor detected")
 
 
 @pytest.hookimpl(tryfirst=True)
-def pytest_configure():
-    logger.setup_logger()
-    logging.info("Test logging successfully configured for test execution.")
+def pytest_collection_finish(session: pytest.Session) -> None:
+    """Set up file logging once the tests are known: collection-only and unit-only runs write no log files."""
+    if session.config.option.collectonly or all(item.get_closest_marker("unit") for item in session.items):
+        return
+    logger.setup_logger(logs_directory=get_worker_dir(logger.LOGS_DIRECTORY))
+    logging.info(f"Test logging successfully configured for test execution (worker: '{get_worker_id()}').")
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from playwright.sync_api import APIRequestContext, APIResponse, BrowserContext
+
+from framework.utils import http_utils
+
+logger = logging.getLogger(__name__)
+
+# API clients, one per browser context
+_clients: 'weakref.WeakKeyDictionary[BrowserContext, ApiClient]' = weakref.WeakKeyDictionary()
+
+DEFAULT_CONCURRENCY = 8
+
+
+class _PlaywrightInternalsError(Exception):
+    """Playwright internals used for concurrent requests are not as expected."""
+
+
+@dataclass
+class ApiRequest:
+    """One request of a bulk `ApiClient.fetch_all`."""
+    method: str
+    path: str
+    params: Optional[Dict[str, Any]] = None
+    data: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class ApiClient:
+    """
+    HTTP client for test setup and cleanup through the API instead of UI flows.
+
+    Created for a browser context, it wraps the context's `APIRequestContext`: requests share the cookies of
+    the browser (a session logged in through the UI is logged in for the API and the other way round),
+    and its connections are kept alive for all requests of the context. Relative paths are resolved against
+    `base_url`, or against the context's own base URL if none is set.
+    """
+
+    def __init__(self, request_context: APIRequestContext, base_url: Optional[str] = None):
+        self._request = request_context
+        self.base_url = base_url
+        self._headers: Dict[str, str] = {}
+
+    @classmethod
+    def for_context(cls, context: BrowserContext) -> 'ApiClient':
+        """Return the API client of the browser context, creating it on first use."""
+        client = _clients.get(context)
+        if client is None:
+            client = _clients[context] = cls(context.request)
+        return client
+
+    @property
+    def request_context(self) -> APIRequestContext:
+        return self._request
+
+    def set_basic_authentication(self, user: str, password: str) -> None:
+        """
+        Send basic HTTP authentication with every request of this client.
+
+        :param user: Username for authentication.
+        :param password: Password for authentication.
+        """
+        logger.info("Set API basic authentication header")
+        self._headers["Authorization"] = http_utils.generate_basic_auth_header(user, password)
+
+    def set_headers(self, headers: Dict[str, str]) -> None:
+        """Send the given headers with every request of this client."""
+        self._headers.update(headers)
+
+    def get(self, path: str, **kwargs: Any) -> APIResponse:
+        return self.fetch("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> APIResponse:
+        return self.fetch("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> APIResponse:
+        return self.fetch("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs: Any) -> APIResponse:
+        return self.fetch("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> APIResponse:
+        return self.fetch("DELETE", path, **kwargs)
+
+    def fetch(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, data: Any = None,
+              headers: Optional[Dict[str, str]] = None, fail_on_status_code: bool = True,
+              timeout: Optional[float] = None) -> APIResponse:
+        """
+        Send a request.
+
+        :param method: HTTP method.
+        :param path: Path relative to the base URL, or an absolute URL.
+        :param params: Query parameters.
+        :param data: Request body, serialized as JSON if it is a dict or a list.
+        :param headers: Headers of this request, in addition to the client's headers.
+        :param fail_on_status_code: Whether to raise on 4xx and 5xx responses.
+        :param timeout: Request timeout in milliseconds, Playwright's default if not set.
+        :return: The response.
+        """
+        url = self.get_url(path)
+        logger.info(f"API {method} '{url}'")
+        start = time.monotonic()
+        response = self._request.fetch(url, method=method, params=params, data=data,
+                                       headers={**self._headers, **(headers or {})},
+                                       fail_on_status_code=fail_on_status_code, timeout=timeout)
+        logger.debug(f"API {method} '{url}': {response.status} in {(time.monotonic() - start) * 1000:.0f} ms")
+        return response
+
+    def fetch_all(self, requests: Sequence[ApiRequest], concurrency: int = DEFAULT_CONCURRENCY,
+                  fail_on_status_code: bool = True,
+                  return_exceptions: bool = False) -> List[Union[APIResponse, BaseException]]:
+        """
+        Send requests concurrently, at most `concurrency` at a time, over the connections of this client.
+
+        All requests are completed before a failure is raised.
+
+        The sync API cannot send requests concurrently: they are awaited together on Playwright's event loop
+        through its implementation objects, which are not part of the public API (Playwright is pinned in
+        requirements.txt). If those internals are not available, the requests are sent one at a time.
+
+        :param requests: The requests to send.
+        :param concurrency: Maximum number of requests in flight.
+        :param fail_on_status_code: Whether to raise if any request gets a 4xx or 5xx response.
+        :param return_exceptions: Whether to return the errors in place of the failed responses instead of raising.
+        :return: The responses (or errors), in the order of the requests.
+        """
+        if not requests:
+            return []
+        logger.info(f"API bulk: {len(requests)} requests, {concurrency} at a time")
+        start = time.monotonic()
+        try:
+            results = self._fetch_concurrently(requests, concurrency, fail_on_status_code)
+        except _PlaywrightInternalsError as e:
+            logger.warning(f"API bulk: sending requests one at a time, {e}")
+            results = []
+            for request in requests:
+                try:
+                    results.append(self.fetch(request.method, request.path, params=request.params, data=request.data,
+                                              headers=request.headers, fail_on_status_code=fail_on_status_code))
+                except Exception as error:
+                    results.append(error)
+        logger.debug(f"API bulk: {len(requests)} requests in {(time.monotonic() - start) * 1000:.0f} ms")
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.error(f"API bulk: {len(errors)} of {len(requests)} requests failed")
+            if not return_exceptions:
+                raise errors[0]
+        return results
+
+    def _fetch_concurrently(self, requests: Sequence[ApiRequest], concurrency: int,
+                            fail_on_status_code: bool) -> List[Any]:
+        try:
+            from playwright._impl._sync_base import mapping
+
+            impl = self._request._impl_obj
+            run = self._request._sync
+        except (ImportError, AttributeError) as e:
+            raise _PlaywrightInternalsError(f"Playwright internals not available: {e}") from e
+
+        async def fetch_all() -> List[Any]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch_one(request: ApiRequest) -> Any:
+                async with semaphore:
+                    return await impl.fetch(self.get_url(request.path), method=request.method, params=request.params,
+                                            data=request.data, headers={**self._headers, **request.headers},
+                                            failOnStatusCode=fail_on_status_code)
+
+            return await asyncio.gather(*(fetch_one(request) for request in requests), return_exceptions=True)
+
+        return [result if isinstance(result, BaseException) else mapping.from_impl(result)
+                for result in run(fetch_all())]
+
+    def get_url(self, path: str) -> str:
+        """Return the URL of a path, resolved against `base_url` if set."""
+        if not self.base_url or "://" in path:
+            return path
+        return f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
@@ -0,0 +1,106 @@
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from framework.api.api_client import DEFAULT_CONCURRENCY, ApiClient, ApiRequest
+
+logger = logging.getLogger(__name__)
+
+
+class DataSeeder:
+    """
+    Creates test data through the API and deletes it again after the test.
+
+    Each created record registers its cleanup request. `cleanup` deletes the records in the reverse order of
+    creation (records created by one `create_many` call are deleted together, concurrently), so records
+    depending on earlier ones are deleted first.
+    """
+
+    def __init__(self, api: ApiClient, id_field: str = "id"):
+        """
+        :param api: The client to send the requests with.
+        :param id_field: Field of the created records holding their id, used in the default cleanup path.
+        """
+        self._api = api
+        self._id_field = id_field
+        self._cleanups: List[List[ApiRequest]] = []
+
+    @property
+    def pending_cleanups(self) -> int:
+        return sum(len(batch) for batch in self._cleanups)
+
+    def create(self, path: str, data: Any, cleanup_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create a record with a POST request and register its deletion.
+
+        :param path: Collection path (e.g. '/api/users').
+        :param data: The record to create.
+        :param cleanup_path: Path to DELETE at cleanup, formatted with the created record's fields
+            (e.g. '/api/users/{username}'). Defaults to '<path>/{<id_field>}'.
+        :return: The created record, as returned by the API.
+        """
+        return self.create_many(path, [data], cleanup_path)[0]
+
+    def create_many(self, path: str, items: Sequence[Any], cleanup_path: Optional[str] = None,
+                    concurrency: int = DEFAULT_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        Create records with concurrent POST requests and register their deletion.
+
+        :param path: Collection path (e.g. '/api/users').
+        :param items: The records to create.
+        :param cleanup_path: Path to DELETE at cleanup, see `create`.
+        :param concurrency: Maximum number of requests in flight.
+        :return: The created records, in the order of the items.
+        :raises RuntimeError: If any record was not created, or its cleanup path cannot be built from the response.
+            The deletion of the other records is registered first.
+        """
+        logger.info(f"Seed {len(items)} records at '{path}'")
+        requests = [ApiRequest("POST", path, data=item) for item in items]
+        results = self._api.fetch_all(requests, concurrency, fail_on_status_code=False, return_exceptions=True)
+
+        # Cleanups of the records that were created are registered before any failure is raised
+        template = cleanup_path or f"{path.rstrip('/')}/{{{self._id_field}}}"
+        records, cleanups, errors = [], [], []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                errors.append(f"#{index}: {result}")
+                continue
+            if not result.ok:
+                errors.append(f"#{index}: {result.status} {result.status_text}")
+                continue
+            try:
+                record = result.json()
+                cleanups.append(ApiRequest("DELETE", template.format(**record)))
+            except (ValueError, TypeError, KeyError, IndexError) as e:
+                # Created, but cannot be deleted without its id
+                errors.append(f"#{index}: no cleanup path '{template}' in the response ({type(e).__name__}: {e})")
+                continue
+            records.append(record)
+        if cleanups:
+            self._cleanups.append(cleanups)
+
+        if errors:
+            raise RuntimeError(f"Seeding {len(errors)} of {len(items)} records at '{path}' failed: "
+                               f"{'; '.join(errors)}")
+        return records
+
+    def add_cleanup(self, method: str, path: str) -> None:
+        """Register a cleanup request for data created some other way (e.g. through the UI)."""
+        self._cleanups.append([ApiRequest(method, path)])
+
+    def cleanup(self, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """
+        Send the registered cleanup requests, newest batch first. Failures are logged and do not stop the cleanup.
+
+        :param concurrency: Maximum number of requests in flight.
+        """
+        while self._cleanups:
+            batch = self._cleanups.pop()
+            try:
+                responses = self._api.fetch_all(batch, concurrency, fail_on_status_code=False)
+            except Exception as e:
+                logger.warning(f"Cleanup of {len(batch)} records failed: {e}")
+                continue
+            for request, response in zip(batch, responses):
+                # Already deleted records (e.g. by the test itself) are fine
+                if not response.ok and response.status != 404:
+                    logger.warning(f"Cleanup {request.method} '{request.path}' failed: {response.status}")
@@ -0,0 +1,211 @@
+import gzip
+import hashlib
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGORITHM = "sha256"
+CHUNK_SIZE_BYTES = 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+# Text attachments from this size on are stored gzip-compressed (smaller ones stay viewable in the report)
+DEFAULT_COMPRESS_MIN_SIZE_BYTES = 256 * 1024
+COMPRESSED_MIME_TYPE = "application/gzip"
+TEXT_EXTENSIONS = frozenset({"txt", "log", "csv", "tsv", "json", "xml", "html", "yaml", "uri", "svg"})
+ATTACHMENT_SUFFIX = "-attachment"
+
+
+@contextmanager
+def _atomic_file(path: pathlib.Path) -> Iterator[BinaryIO]:
+    """Binary file written under a temporary name and renamed to `path` once complete."""
+    descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            yield file
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+@dataclass
+class AttachmentStats:
+    """Counters of an `AttachmentStore` run."""
+    attached: int = 0
+    stored: int = 0
+    attached_bytes: int = 0
+    stored_bytes: int = 0
+
+    def __str__(self) -> str:
+        return (f"{self.attached} attachments ({self.attached_bytes} bytes) stored as "
+                f"{self.stored} files ({self.stored_bytes} bytes)")
+
+
+class AttachmentStore:
+    """
+    Content-addressed attachment files: each attachment is named after the hash of its content,
+    so identical attachments (e.g. the same screenshot in hundreds of tests) are written once per results
+    directory and shared by all the reports referring to them.
+
+    The hash is computed by the caller, writing (and compressing) happens on a background thread pool.
+    Files are written to a temporary name and renamed, so parallel workers storing the same content is harmless.
+    """
+
+    def __init__(self, directory: Union[str, pathlib.Path],
+                 compress_min_size: Optional[int] = DEFAULT_COMPRESS_MIN_SIZE_BYTES,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        :param directory: The allure results directory.
+        :param compress_min_size: Size in bytes from which text attachments are compressed, None to never compress.
+        :param max_workers: Number of background writer threads.
+        """
+        self._dir = pathlib.Path(directory)
+        self._compress_min_size = compress_min_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="attachments")
+        self._lock = threading.Lock()
+        self._stored: Set[str] = set()
+        self._writes: List[Tuple[str, Future]] = []
+        self.stats = AttachmentStats()
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self._dir
+
+    def put_data(self, body: Union[str, bytes], extension: str) -> Tuple[str, bool]:
+        """
+        Store attachment content.
+
+        :param body: The content, strings are stored in UTF-8.
+        :param extension: File extension of the attachment type.
+        :return: The file name of the stored content and whether it is compressed.
+        """
+        data = body.encode("utf-8") if isinstance(body, str) else bytes(body)
+        digest = hashlib.new(HASH_ALGORITHM, data).hexdigest()
+        return self._put(digest, extension, len(data), lambda path, compress: self._write_data(path, data, compress))
+
+    def put_file(self, source: Union[str, pathlib.Path], extension: str) -> Tuple[str, bool]:
+        """
+        Store the content of an attachment file, hashed in chunks.
+
+        :param source: The file to attach.
+        :param extension: File extension of the attachment type.
+        :return: The file name of the stored content and whether it is compressed.
+        """
+        hasher = hashlib.new(HASH_ALGORITHM)
+        size = 0
+        with open(source, "rb") as file:
+            while chunk := file.read(CHUNK_SIZE_BYTES):
+                hasher.update(chunk)
+                size += len(chunk)
+        return self._put(hasher.hexdigest(), extension, size,
+                         lambda path, compress: self._write_file(path, pathlib.Path(source), compress))
+
+    def _put(self, digest: str, extension: str, size: int, write) -> Tuple[str, bool]:
+        compress = (self._compress_min_size is not None and extension in TEXT_EXTENSIONS
+                    and size >= self._compress_min_size)
+        file_name = f"{digest}{ATTACHMENT_SUFFIX}.{extension}{'.gz' if compress else ''}"
+        with self._lock:
+            self.stats.attached += 1
+            self.stats.attached_bytes += size
+            if file_name in self._stored:
+                return file_name, compress
+            self._stored.add(file_name)
+            path = self._dir / file_name
+            # Files already there were stored by another worker or an earlier run into the same directory
+            if not path.exists():
+                self.stats.stored += 1
+                self.stats.stored_bytes += size
+                self._writes.append((file_name, self._executor.submit(write, path, compress)))
+        return file_name, compress
+
+    @staticmethod
+    def _write_data(path: pathlib.Path, data: bytes, compress: bool) -> None:
+        with _atomic_file(path) as file:
+            file.write(gzip.compress(data, compresslevel=6) if compress else data)
+
+    @staticmethod
+    def _write_file(path: pathlib.Path, source: pathlib.Path, compress: bool) -> None:
+        with _atomic_file(path) as file, open(source, "rb") as source_file:
+            if compress:
+                with gzip.GzipFile(fileobj=file, mode="wb", compresslevel=6) as compressed:
+                    shutil.copyfileobj(source_file, compressed, CHUNK_SIZE_BYTES)
+            else:
+                shutil.copyfileobj(source_file, file, CHUNK_SIZE_BYTES)
+
+    def flush(self) -> None:
+        """Wait for all pending writes, logging the failed ones."""
+        with self._lock:
+            writes, self._writes = self._writes, []
+        for file_name, future in writes:
+            error = future.exception()
+            if error:
+                logger.error(f"Failed to write attachment '{file_name}': {error}")
+
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown(wait=True)
+        logger.info(f"Allure attachments: {self.stats}")
+
+
+class DeduplicatingAllureFileLogger(AllureFileLogger):
+    """
+    Allure results writer storing attachments in an `AttachmentStore`.
+
+    Allure names every attachment after a new UUID before it reaches the writer, so the writer remembers
+    which content-addressed file each UUID name was stored as, and points the attachments of results
+    and containers to the shared files when they are written.
+    """
+
+    def __init__(self, report_dir: Union[str, pathlib.Path], store: AttachmentStore):
+        super().__init__(report_dir)
+        self._store = store
+        self._sources: Dict[str, Tuple[str, bool]] = {}
+
+    @property
+    def store(self) -> AttachmentStore:
+        return self._store
+
+    @hookimpl
+    def report_result(self, result):
+        self._link_attachments(result)
+        self._report_item(result)
+
+    @hookimpl
+    def report_container(self, container):
+        self._link_attachments(container)
+        self._report_item(container)
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        self._sources[file_name] = self._store.put_file(source, self._get_extension(file_name))
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self._sources[file_name] = self._store.put_data(body, self._get_extension(file_name))
+
+    @staticmethod
+    def _get_extension(file_name: str) -> str:
+        return file_name.rsplit(".", 1)[-1] if "." in file_name else "attach"
+
+    def _link_attachments(self, item) -> None:
+        """Point the attachments of a result or container, its steps and fixtures to the stored files."""
+        for attachment in getattr(item, "attachments", None) or []:
+            stored = self._sources.pop(attachment.source, None)
+            if stored:
+                attachment.source, compressed = stored
+                if compressed:
+                    attachment.type = COMPRESSED_MIME_TYPE
+        for child_name in ("steps", "befores", "afters"):
+            for child in getattr(item, child_name, None) or []:
+                self._link_attachments(child)
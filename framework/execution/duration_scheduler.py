@@ -0,0 +1,55 @@
+from itertools import cycle
+
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+# A worker needs the next test to be known before it runs the current one.
+WORKER_QUEUE_SIZE = 2
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    pytest-xdist scheduler for collections ordered longest-first.
+
+    The default `load` scheduler sends consecutive chunks of the collection to each worker, which would hand
+    all the longest tests to the first worker. This one keeps a short queue per worker and gives the next
+    pending test to whichever worker frees up first, which is the longest-processing-time-first heuristic.
+    """
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+
+        nodes = cycle(self.nodes)
+        for _ in range(min(len(self.pending), WORKER_QUEUE_SIZE * len(self.nodes))):
+            self._send_tests(next(nodes), 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            num_send = WORKER_QUEUE_SIZE - len(self.node2pending[node])
+            if num_send > 0:
+                self._send_tests(node, num_send)
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
@@ -0,0 +1,123 @@
+import heapq
+import json
+import logging
+import os
+import pathlib
+import statistics
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_FILE = "durations.json"
+# Below this share of tests with history, a makespan prediction is mostly made of fallback estimates
+MIN_KNOWN_SHARE_FOR_PREDICTION = 0.5
+DEFAULT_SMOOTHING = 0.3
+DEFAULT_FALLBACK_ESTIMATE = 10.0
+
+
+class DurationHistory:
+    """
+    Per-test duration history, smoothed with an exponentially weighted moving average.
+
+    Keys are pytest node ids, values are estimated durations in seconds. Tests without history
+    get a fallback estimate: the median of known durations, or `DEFAULT_FALLBACK_ESTIMATE` if the history is empty.
+    """
+
+    def __init__(self, path: Union[pathlib.Path, str] = DEFAULT_HISTORY_FILE, smoothing: float = DEFAULT_SMOOTHING,
+                 fallback_estimate: Optional[float] = None):
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"Smoothing factor must be in (0, 1], got: {smoothing}")
+
+        self._path = pathlib.Path(path)
+        self._smoothing = smoothing
+        self._fallback_estimate = fallback_estimate
+        self._durations: Dict[str, float] = {}
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._durations)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._durations
+
+    def load(self) -> 'DurationHistory':
+        """Load durations from the history file, ignoring a missing or corrupted file."""
+        if not self._path.is_file():
+            logger.debug(f"Duration history '{self._path}' not found, starting with an empty history")
+            return self
+
+        try:
+            self._durations = {str(k): float(v) for k, v in json.loads(self._path.read_text(encoding="utf-8")).items()}
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring corrupted duration history '{self._path}': {e}")
+            self._durations = {}
+        return self
+
+    def save(self) -> None:
+        """Write durations to the history file atomically."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        tmp_path.write_text(json.dumps(self._durations, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self._path)
+
+    def update(self, node_id: str, duration: float) -> None:
+        """
+        Blend a new measured duration into the test's estimate.
+
+        :param node_id: pytest node id.
+        :param duration: Measured duration in seconds.
+        """
+        previous = self._durations.get(node_id)
+        if previous is None:
+            self._durations[node_id] = duration
+        else:
+            self._durations[node_id] = self._smoothing * duration + (1 - self._smoothing) * previous
+
+    def fallback_estimate(self) -> float:
+        """Return the estimate used for tests without history."""
+        if self._fallback_estimate is not None:
+            return self._fallback_estimate
+        if self._durations:
+            return statistics.median(self._durations.values())
+        return DEFAULT_FALLBACK_ESTIMATE
+
+    def estimate(self, node_id: str) -> float:
+        """Return the estimated duration of a test in seconds."""
+        duration = self._durations.get(node_id)
+        return self.fallback_estimate() if duration is None else duration
+
+    def known_share(self, node_ids: Sequence[str]) -> float:
+        """Return the share of the given tests that have a recorded duration, 0 for no tests."""
+        if not node_ids:
+            return 0.0
+        return sum(node_id in self._durations for node_id in node_ids) / len(node_ids)
+
+    def order_longest_first(self, node_ids: Iterable[str]) -> List[str]:
+        """
+        Order tests by estimated duration, longest first. Ties keep their original order.
+
+        :param node_ids: pytest node ids in collection order.
+        :return: Reordered node ids.
+        """
+        fallback = self.fallback_estimate()
+        indexed = list(enumerate(node_ids))
+        indexed.sort(key=lambda pair: (-self._durations.get(pair[1], fallback), pair[0]))
+        return [node_id for _, node_id in indexed]
+
+
+def predict_makespan(durations: Sequence[float], workers: int = 1) -> float:
+    """
+    Predict the wall time of running tests in the given order on `workers` parallel workers,
+    each worker taking the next test as soon as it is free (list scheduling).
+
+    :param durations: Estimated test durations in execution order.
+    :param workers: Number of parallel workers.
+    :return: Predicted makespan in seconds.
+    """
+    worker_loads = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heapreplace(worker_loads, worker_loads[0] + duration)
+    return max(worker_loads)
@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import pathlib
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMPACT_MAP_FILE = ".impact_map.json"
+# Changes to these files never affect test outcomes
+IGNORED_SUFFIXES = (".md",)
+IGNORED_DIRECTORIES = (".github/",)
+TEST_FILE_PREFIX = "test_"
+
+
+class ImpactRecorder:
+    """
+    Records which page objects, elements and locators each test touches.
+
+    Fed by the `@action`/`@step` decorators and `BasePage` construction. Recording is off by default,
+    in which case `record` costs a single attribute check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._root_dir = pathlib.Path.cwd()
+        self._current_test: Optional[str] = None
+        self._files: Dict[str, Set[str]] = defaultdict(set)
+        self._classes: Dict[str, Set[str]] = defaultdict(set)
+        self._locators: Dict[str, Set[str]] = defaultdict(set)
+        self._class_sources: Dict[type, List[Tuple[str, str]]] = {}
+
+    def enable(self, root_dir: Union[pathlib.Path, str]) -> None:
+        """Start recording, source files are stored relative to `root_dir`."""
+        self._root_dir = pathlib.Path(root_dir).resolve()
+        self.enabled = True
+
+    def start_test(self, node_id: str) -> None:
+        # Tests touching nothing still get an (empty) record, so they are not treated as new
+        self._current_test = node_id
+        self._files[node_id] = set()
+        self._classes[node_id] = set()
+        self._locators[node_id] = set()
+
+    def stop_test(self) -> None:
+        self._current_test = None
+
+    def record(self, obj: Any) -> None:
+        """
+        Record that the current test used `obj` (a page object or an element).
+
+        :param obj: Instance whose class hierarchy and locator should be attributed to the current test.
+        """
+        if not self.enabled or self._current_test is None:
+            return
+
+        for class_name, source_file in self._get_class_sources(type(obj)):
+            self._classes[self._current_test].add(class_name)
+            self._files[self._current_test].add(source_file)
+
+        locator = getattr(obj, "_locator_input", None)
+        if isinstance(locator, str):
+            self._locators[self._current_test].add(locator)
+
+    def records(self) -> Dict[str, Dict[str, List[str]]]:
+        """Return the recorded data per test node id."""
+        return {
+            node_id: {
+                "files": sorted(self._files[node_id]),
+                "classes": sorted(self._classes[node_id]),
+                "locators": sorted(self._locators[node_id]),
+            }
+            for node_id in set(self._files) | set(self._locators)
+        }
+
+    def _get_class_sources(self, cls: type) -> List[Tuple[str, str]]:
+        """Return (qualified class name, project-relative source file) for the class and its project bases."""
+        sources = self._class_sources.get(cls)
+        if sources is None:
+            sources = []
+            for klass in cls.__mro__:
+                source_file = self._relative_source(klass)
+                if source_file:
+                    sources.append((f"{klass.__module__}.{klass.__qualname__}", source_file))
+            self._class_sources[cls] = sources
+        return sources
+
+    def _relative_source(self, cls: type) -> Optional[str]:
+        module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if not module_file:
+            return None
+        try:
+            return pathlib.Path(module_file).resolve().relative_to(self._root_dir).as_posix()
+        except ValueError:
+            # Class from a third-party package or the standard library
+            return None
+
+
+impact_recorder = ImpactRecorder()
+
+
+class ImpactMap:
+    """
+    Persistent test -> touched files/classes/locators map, used to select tests affected by a change.
+    """
+
+    def __init__(self, path: Union[pathlib.Path, str] = DEFAULT_IMPACT_MAP_FILE):
+        self._path = pathlib.Path(path)
+        self._records: Dict[str, Dict[str, List[str]]] = {}
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self._path
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._records
+
+    def load(self) -> 'ImpactMap':
+        """Load the map from its file, ignoring a missing or corrupted file."""
+        if self._path.is_file():
+            try:
+                self._records = json.loads(self._path.read_text(encoding="utf-8"))
+            except ValueError as e:
+                logger.warning(f"Ignoring corrupted impact map '{self._path}': {e}")
+                self._records = {}
+        return self
+
+    def merge_and_save(self, records: Dict[str, Dict[str, List[str]]]) -> None:
+        """
+        Merge new records into the map file. Safe to call from several xdist workers at once.
+
+        :param records: Records to add, replacing previous records of the same tests.
+        """
+        with FileLock(f"{self._path}.lock"):
+            self.load()
+            self._records.update(records)
+            tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+            tmp_path.write_text(json.dumps(self._records, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+
+    def known_files(self) -> Set[str]:
+        """Return all source files touched by at least one recorded test."""
+        return {file for record in self._records.values() for file in record.get("files", [])}
+
+    def select(self, node_ids: Iterable[str], changed_files: Iterable[str],
+               changed_locators: Iterable[str] = ()) -> List[str]:
+        """
+        Select the tests affected by the given changes.
+
+        A test is selected if its own file changed, if it has no record yet, or if it touched a changed
+        file or locator. A change to a source file no recorded test touched (e.g. `conftest.py` or settings)
+        cannot be attributed, so every test is selected.
+
+        :param node_ids: Candidate pytest node ids.
+        :param changed_files: Changed files relative to the project root, POSIX separators.
+        :param changed_locators: Changed locator strings.
+        :return: Selected node ids, in the original order.
+        """
+        node_ids = list(node_ids)
+        changed_files = {f for f in changed_files if not self._is_ignored(f)}
+        changed_locators = set(changed_locators)
+        unmapped_files = {
+            f for f in changed_files - self.known_files()
+            if not pathlib.PurePosixPath(f).name.startswith(TEST_FILE_PREFIX)
+        }
+        if unmapped_files:
+            logger.info(f"Changes not covered by the impact map, selecting all tests: {sorted(unmapped_files)}")
+            return node_ids
+
+        selected = []
+        for node_id in node_ids:
+            record = self._records.get(node_id)
+            if (record is None
+                    or node_id.split("::")[0] in changed_files
+                    or changed_files.intersection(record.get("files", []))
+                    or changed_locators.intersection(record.get("locators", []))):
+                selected.append(node_id)
+        return selected
+
+    @staticmethod
+    def _is_ignored(file: str) -> bool:
+        return file.endswith(IGNORED_SUFFIXES) or file.startswith(IGNORED_DIRECTORIES)
+
+
+def get_changed_files(since: str, root_dir: Union[pathlib.Path, str] = ".") -> List[str]:
+    """
+    Return files changed since a git revision, including uncommitted and untracked files.
+
+    :param since: Git revision to compare the working tree with (e.g. 'origin/main').
+    :param root_dir: Repository directory.
+    :return: Changed file paths relative to the repository root.
+    """
+    commands = [
+        ["git", "diff", "--name-only", since],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    changed = set()
+    for command in commands:
+        output = subprocess.run(command, cwd=root_dir, check=True, capture_output=True, text=True).stdout
+        changed.update(line.strip() for line in output.splitlines() if line.strip())
+    return sorted(changed)
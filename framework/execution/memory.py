@@ -0,0 +1,273 @@
+import json
+import logging
+import os
+import pathlib
+import time
+import tracemalloc
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from playwright.sync_api import CDPSession, Error as PlaywrightError, Page
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+PROC_DIR = pathlib.Path("/proc")
+# Command line marker of the Playwright driver process, which is not part of the browsers' memory
+DRIVER_PROCESS_MARKER = "run-driver"
+TRACEMALLOC_FRAMES = 5
+
+JS_HEAP_JS = "() => performance.memory ? performance.memory.usedJSHeapSize : null"
+
+
+@dataclass
+class MemoryThresholds:
+    """Growth during one test above which the test is flagged, in bytes."""
+    python: int = 20 * MB
+    browser_rss: int = 100 * MB
+    js_heap: int = 20 * MB
+
+
+@dataclass
+class MemorySample:
+    """Memory usage at one test boundary. Values are None when they cannot be measured."""
+    test: str
+    phase: str
+    time: float
+    python_bytes: int
+    browser_rss_bytes: Optional[int] = None
+    js_heap_bytes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def js_heap_total(self) -> int:
+        return sum(self.js_heap_bytes.values())
+
+
+@dataclass
+class MemoryDelta:
+    """Memory growth during one test."""
+    test: str
+    python: int
+    browser_rss: Optional[int]
+    js_heap: Optional[int]
+    exceeded: List[str] = field(default_factory=list)
+    top_allocations: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        values = [f"Python {self.python / MB:+.1f} MB"]
+        if self.browser_rss is not None:
+            values.append(f"browser RSS {self.browser_rss / MB:+.1f} MB")
+        if self.js_heap is not None:
+            values.append(f"JS heap {self.js_heap / MB:+.1f} MB")
+        lines = [", ".join(values)]
+        if self.top_allocations:
+            lines.append("Top Python allocations:")
+            lines.extend(f"  {allocation}" for allocation in self.top_allocations)
+        return "\n".join(lines)
+
+
+def get_descendant_pids(pid: int, proc_dir: pathlib.Path = PROC_DIR) -> Set[int]:
+    """Return the ids of all processes started by a process, directly or not, read from `/proc`."""
+    children: Dict[int, List[int]] = {}
+    for stat_file in proc_dir.glob("[0-9]*/stat"):
+        try:
+            # The command name in parentheses may contain spaces, the fields after it do not
+            fields = stat_file.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat_file.parent.name))
+
+    descendants: Set[int] = set()
+    pending = [pid]
+    while pending:
+        for child in children.get(pending.pop(), []):
+            if child not in descendants:
+                descendants.add(child)
+                pending.append(child)
+    return descendants
+
+
+def get_rss_bytes(pid: int, proc_dir: pathlib.Path = PROC_DIR) -> int:
+    """Return the resident set size of a process, 0 if it is gone."""
+    try:
+        for line in (proc_dir / str(pid) / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def get_browser_rss_bytes(proc_dir: pathlib.Path = PROC_DIR) -> Optional[int]:
+    """
+    Return the total resident set size of the browser processes launched by this process.
+
+    Browsers are the descendants of this process, except the Playwright driver. Browsers of a browser server
+    are not started by this process and are not included.
+
+    :return: The RSS in bytes, None without `/proc` (not Linux).
+    """
+    if not proc_dir.is_dir():
+        return None
+    total = 0
+    for pid in get_descendant_pids(os.getpid(), proc_dir):
+        try:
+            command_line = (proc_dir / str(pid) / "cmdline").read_bytes()
+        except OSError:
+            continue
+        if DRIVER_PROCESS_MARKER.encode() not in command_line:
+            total += get_rss_bytes(pid, proc_dir)
+    return total
+
+
+class MemoryMonitor:
+    """
+    Samples Python, browser process and JS heap memory at test boundaries, to find tests leaking memory
+    into long sessions with reused browsers and contexts.
+
+    Off by default: `tracemalloc` slows down Python code while it traces allocations.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.thresholds = MemoryThresholds()
+        self.top_allocations = 10
+        self._series_file: Optional[pathlib.Path] = None
+        self._start_sample: Optional[MemorySample] = None
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._cdp_sessions: 'weakref.WeakKeyDictionary[Page, Optional[CDPSession]]' = weakref.WeakKeyDictionary()
+        # Stable page names for the time series, URLs change while a test runs
+        self._page_names: 'weakref.WeakKeyDictionary[Page, str]' = weakref.WeakKeyDictionary()
+        self.flagged: List[MemoryDelta] = []
+
+    def enable(self, series_file: Union[pathlib.Path, str], thresholds: Optional[MemoryThresholds] = None,
+               top_allocations: int = 10) -> None:
+        """
+        Start tracing Python allocations and sampling at test boundaries.
+
+        :param series_file: JSON lines file the samples are appended to.
+        :param thresholds: Growth during one test above which the test is flagged.
+        :param top_allocations: Number of top Python allocation sites reported for flagged tests.
+        """
+        self._series_file = pathlib.Path(series_file)
+        self._series_file.parent.mkdir(parents=True, exist_ok=True)
+        self._series_file.write_text("")
+        self.thresholds = thresholds or MemoryThresholds()
+        self.top_allocations = top_allocations
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.enabled = True
+
+    def disable(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = False
+
+    def start_test(self, test: str, pages: Iterable[Page] = ()) -> None:
+        self._start_sample = self.sample(test, "start", pages)
+        self._start_snapshot = self._take_snapshot()
+
+    def stop_test(self, test: str, pages: Iterable[Page] = ()) -> Optional[MemoryDelta]:
+        """
+        Sample the end of a test and compare it with its start.
+
+        :return: The memory growth during the test, None if its start was not sampled.
+        """
+        start, start_snapshot = self._start_sample, self._start_snapshot
+        self._start_sample = self._start_snapshot = None
+        end = self.sample(test, "end", pages)
+        if start is None or start.test != test:
+            return None
+
+        common_pages = start.js_heap_bytes.keys() & end.js_heap_bytes.keys()
+        delta = MemoryDelta(
+            test=test,
+            python=end.python_bytes - start.python_bytes,
+            browser_rss=end.browser_rss_bytes - start.browser_rss_bytes
+            if end.browser_rss_bytes is not None and start.browser_rss_bytes is not None else None,
+            js_heap=sum(end.js_heap_bytes[page] - start.js_heap_bytes[page] for page in common_pages)
+            if common_pages else None,
+        )
+        for name in ("python", "browser_rss", "js_heap"):
+            value = getattr(delta, name)
+            if value is not None and value > getattr(self.thresholds, name):
+                delta.exceeded.append(name)
+
+        if delta.exceeded:
+            if start_snapshot is not None:
+                delta.top_allocations = self._get_top_allocations(start_snapshot)
+            self.flagged.append(delta)
+            logger.warning(f"Memory growth of {test} above the threshold ({', '.join(delta.exceeded)}): "
+                           f"{delta.summary()}")
+        return delta
+
+    def sample(self, test: str, phase: str, pages: Iterable[Page] = ()) -> MemorySample:
+        """Measure the current memory usage and append it to the time series."""
+        sample = MemorySample(test=test, phase=phase, time=time.time(),
+                              python_bytes=tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+                              browser_rss_bytes=get_browser_rss_bytes())
+        for page in pages:
+            heap = self.get_js_heap_bytes(page)
+            if heap is not None:
+                sample.js_heap_bytes[self._get_page_name(page)] = heap
+
+        if self._series_file is not None:
+            with self._series_file.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(sample)) + "\n")
+        return sample
+
+    def get_js_heap_bytes(self, page: Page) -> Optional[int]:
+        """
+        Return the used JS heap of a page: exact from CDP metrics on Chromium, from `performance.memory` otherwise.
+
+        :return: The heap size in bytes, None if the browser does not report it or the page is closed.
+        """
+        if page.is_closed():
+            return None
+        try:
+            session = self._get_cdp_session(page)
+            if session is not None:
+                metrics = session.send("Performance.getMetrics")["metrics"]
+                return next(int(metric["value"]) for metric in metrics if metric["name"] == "JSHeapUsedSize")
+            return page.evaluate(JS_HEAP_JS)
+        except (PlaywrightError, StopIteration) as e:
+            logger.debug(f"JS heap of '{page.url}' not available: {e}")
+            return None
+
+    def _get_page_name(self, page: Page) -> str:
+        name = self._page_names.get(page)
+        if name is None:
+            name = self._page_names[page] = f"page-{len(self._page_names) + 1}"
+        return name
+
+    def _get_cdp_session(self, page: Page) -> Optional[CDPSession]:
+        if page not in self._cdp_sessions:
+            session = None
+            try:
+                session = page.context.new_cdp_session(page)
+                session.send("Performance.enable")
+            except PlaywrightError:
+                # Not Chromium
+                session = None
+            self._cdp_sessions[page] = session
+        return self._cdp_sessions[page]
+
+    @staticmethod
+    def _take_snapshot() -> Optional[tracemalloc.Snapshot]:
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ])
+
+    def _get_top_allocations(self, start_snapshot: tracemalloc.Snapshot) -> List[str]:
+        end_snapshot = self._take_snapshot()
+        if end_snapshot is None:
+            return []
+        stats = end_snapshot.compare_to(start_snapshot, "lineno")
+        return [str(stat) for stat in stats[:self.top_allocations] if stat.size_diff > 0]
+
+
+memory_monitor = MemoryMonitor()
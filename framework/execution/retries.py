@@ -0,0 +1,229 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from framework.ui.constants.elements import ElementType
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Maximum time a test may spend retrying steps (failed attempts and backoff waits)
+DEFAULT_RETRY_BUDGET_MS = 30000
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how often a failed `@action`/`@step` is retried.
+
+    :param exceptions: Exception classes the policy applies to.
+    :param element_types: Element types the policy applies to, empty for every element and page step.
+    :param max_attempts: Maximum number of attempts, including the first one.
+    :param backoff_ms: Wait before the first retry.
+    :param backoff_factor: Multiplier of the wait for each further retry.
+    :param max_backoff_ms: Upper limit of the wait between attempts.
+    :param idempotent_only: Retry only steps marked idempotent. Disable only for exceptions raised before the
+        action takes effect (e.g. actionability timeouts), which are then retried for any single element
+        `@action`. `@step`s, which may run several actions, are only retried when marked idempotent.
+    """
+    exceptions: Tuple[Type[BaseException], ...]
+    element_types: Tuple[ElementType, ...] = ()
+    max_attempts: int = 3
+    backoff_ms: int = 250
+    backoff_factor: float = 2.0
+    max_backoff_ms: int = 2000
+    idempotent_only: bool = True
+
+    def matches(self, error: BaseException, element_type: Optional[ElementType], idempotent: bool,
+                single_action: bool = False) -> bool:
+        return (isinstance(error, self.exceptions)
+                and (not self.element_types or element_type in self.element_types)
+                and (idempotent or (single_action and not self.idempotent_only)))
+
+    def get_backoff_ms(self, retry: int) -> int:
+        """Return the wait before the given retry (1 for the first retry)."""
+        return int(min(self.backoff_ms * self.backoff_factor ** (retry - 1), self.max_backoff_ms))
+
+
+DEFAULT_RETRY_POLICIES = (
+    # Driver errors, timeouts included, may happen after the input was dispatched: a click or submit that reached
+    # the page but timed out afterwards would run twice, so only idempotent actions and steps are retried
+    RetryPolicy(exceptions=(PlaywrightError,)),
+)
+
+# Opt-in: retry a timeout of any single element action once. Playwright usually raises timeouts from its
+# actionability checks, before dispatching any input, but a timeout after the input would repeat the action.
+# `@step`s are still only retried when marked idempotent.
+ACTION_TIMEOUT_POLICY = RetryPolicy(exceptions=(PlaywrightTimeoutError,), max_attempts=2, idempotent_only=False)
+
+
+@dataclass
+class RetryRecord:
+    """One retry of a step."""
+    step: str
+    attempt: int
+    error: str
+    backoff_ms: int
+
+    def __str__(self) -> str:
+        return f"{self.step}: attempt {self.attempt} after {self.error}"
+
+
+@dataclass
+class RetryStats:
+    """Retries of one test."""
+    records: List[RetryRecord] = field(default_factory=list)
+    spent_ms: float = 0
+    budget_exhausted: bool = False
+
+    def summary(self) -> str:
+        lines = [f"{len(self.records)} step retries, {self.spent_ms:.0f} ms spent"
+                 + (" (retry budget exhausted)" if self.budget_exhausted else "")]
+        lines.extend(f"  {record}" for record in self.records)
+        return "\n".join(lines)
+
+
+class RetryEngine:
+    """
+    Retries failed `@action`/`@step` calls according to registered retry policies.
+
+    Retrying a single flaky interaction is much cheaper than rerunning a whole test. All retries of a test
+    share a time budget, so a broken page fails the test instead of retrying each of its steps. A retry only
+    starts if the budget also covers another attempt as long as the failed one (a full timeout for timeouts).
+    Registered policies are off by default; steps with their own policy are retried either way.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.budget_ms = DEFAULT_RETRY_BUDGET_MS
+        self._policies: List[RetryPolicy] = []
+        self._stats = RetryStats()
+
+    @property
+    def policies(self) -> List[RetryPolicy]:
+        return list(self._policies)
+
+    @property
+    def stats(self) -> RetryStats:
+        return self._stats
+
+    def enable(self, policies: Sequence[RetryPolicy] = DEFAULT_RETRY_POLICIES,
+               budget_ms: int = DEFAULT_RETRY_BUDGET_MS) -> None:
+        """Start retrying with the given policies, each test may spend up to `budget_ms` on retries."""
+        self._policies = list(policies)
+        self.budget_ms = budget_ms
+        self.enabled = True
+
+    def register(self, policy: RetryPolicy, first: bool = False) -> None:
+        """
+        Add a retry policy. The first registered policy matching a failure is used.
+
+        :param policy: The policy to add.
+        :param first: Whether to add it before the already registered policies.
+        """
+        self._policies.insert(0 if first else len(self._policies), policy)
+
+    def clear(self) -> None:
+        self._policies.clear()
+
+    def start_test(self) -> None:
+        self._stats = RetryStats()
+
+    def stop_test(self) -> RetryStats:
+        stats, self._stats = self._stats, RetryStats()
+        return stats
+
+    def find_policy(self, error: BaseException, element_type: Optional[ElementType] = None,
+                    idempotent: bool = False, single_action: bool = False) -> Optional[RetryPolicy]:
+        """Return the first registered policy matching a failure, or None if it must not be retried."""
+        if not self.enabled:
+            return None
+        return next((policy for policy in self._policies
+                     if policy.matches(error, element_type, idempotent, single_action)), None)
+
+    def run(self, func: Callable[[], T], step_text: str, owner: Any = None, idempotent: bool = False,
+            policy: Optional[RetryPolicy] = None, single_action: bool = False) -> T:
+        """
+        Call a step, retrying it on failures matching its own policy or a registered one.
+
+        :param func: The step to call.
+        :param step_text: Step description for the log.
+        :param owner: Element or page object the step belongs to, its type selects the policy.
+        :param idempotent: Whether the step can be repeated after it took (partial) effect.
+        :param policy: Policy of this step, used instead of the registered ones.
+        :param single_action: Whether the step is one element `@action`, not a `@step` that may run several.
+        :return: The step result.
+        """
+        element_type = getattr(owner, "_type", None)
+        attempt = 1
+        retry_start = None
+        while True:
+            attempt_start = time.monotonic()
+            try:
+                result = func()
+            except Exception as e:
+                if getattr(e, "_step_retried", False):
+                    # Already retried by a nested step, retrying the outer step would multiply the attempts
+                    raise
+                step_policy = self._get_step_policy(e, element_type, idempotent, single_action, policy)
+                if step_policy is None:
+                    raise
+
+                now = time.monotonic()
+                if retry_start is not None:
+                    self._stats.spent_ms += (now - retry_start) * 1000
+                backoff_ms = step_policy.get_backoff_ms(attempt)
+                # The next attempt may take as long as the failed one, e.g. the whole action timeout
+                expected_attempt_ms = (now - attempt_start) * 1000
+                error = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+                if (attempt >= step_policy.max_attempts
+                        or self._stats.spent_ms + backoff_ms + expected_attempt_ms > self.budget_ms):
+                    if attempt < step_policy.max_attempts:
+                        self._stats.budget_exhausted = True
+                        logger.warning(f"Retry budget of {self.budget_ms} ms exhausted, not retrying '{step_text}'")
+                    if attempt > 1:
+                        logger.warning(f"Step '{step_text}' failed after {attempt} attempts")
+                        self._mark_retried(e)
+                    raise
+
+                attempt += 1
+                logger.warning(f"Retry {attempt - 1}/{step_policy.max_attempts - 1} of '{step_text}' "
+                               f"in {backoff_ms} ms after {error}")
+                self._stats.records.append(RetryRecord(step_text, attempt, error, backoff_ms))
+                retry_start = now
+                self._wait(owner, backoff_ms)
+                continue
+
+            if retry_start is not None:
+                self._stats.spent_ms += (time.monotonic() - retry_start) * 1000
+                logger.info(f"Step '{step_text}' passed on attempt {attempt}")
+            return result
+
+    def _get_step_policy(self, error: BaseException, element_type: Optional[ElementType], idempotent: bool,
+                         single_action: bool, policy: Optional[RetryPolicy]) -> Optional[RetryPolicy]:
+        if policy is not None:
+            return policy if policy.matches(error, element_type, idempotent, single_action) else None
+        return self.find_policy(error, element_type, idempotent, single_action)
+
+    @staticmethod
+    def _wait(owner: Any, delay_ms: int) -> None:
+        page = getattr(owner, "_page", None)
+        if page is not None:
+            # Keeps the driver processing events while waiting
+            page.wait_for_timeout(delay_ms)
+        else:
+            time.sleep(delay_ms / 1000)
+
+    @staticmethod
+    def _mark_retried(error: BaseException) -> None:
+        try:
+            error._step_retried = True
+        except AttributeError:
+            pass
+
+
+retry_engine = RetryEngine()
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import pathlib
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Union
+
+from filelock import FileLock, Timeout
+
+logger = logging.getLogger(__name__)
+
+XDIST_WORKER_ENV = "PYTEST_XDIST_WORKER"
+XDIST_WORKER_COUNT_ENV = "PYTEST_XDIST_WORKER_COUNT"
+MASTER_WORKER_ID = "master"
+
+
+def get_worker_id() -> str:
+    """
+    Return the id of the current pytest-xdist worker.
+
+    :return: Worker id (e.g. 'gw0'), or 'master' when tests are not distributed.
+    """
+    return os.environ.get(XDIST_WORKER_ENV, MASTER_WORKER_ID)
+
+
+def get_worker_count() -> int:
+    """Return the number of pytest-xdist workers, 1 when tests are not distributed."""
+    return int(os.environ.get(XDIST_WORKER_COUNT_ENV, 1))
+
+
+def is_xdist_worker() -> bool:
+    """Check if the current process is a pytest-xdist worker."""
+    return XDIST_WORKER_ENV in os.environ
+
+
+def get_worker_dir(base_dir: Union[pathlib.Path, str]) -> pathlib.Path:
+    """
+    Return a per-worker subdirectory of `base_dir`, so parallel workers do not share output files.
+
+    :param base_dir: Base output directory (e.g. 'logs').
+    :return: `base_dir/<worker_id>` for xdist workers, `base_dir` otherwise.
+    """
+    base_dir = pathlib.Path(base_dir)
+    return base_dir / get_worker_id() if is_xdist_worker() else base_dir
+
+
+def get_shared_dir(base_temp: Union[pathlib.Path, str]) -> pathlib.Path:
+    """
+    Return a directory visible to all workers of the run.
+
+    :param base_temp: The worker's pytest base temp directory (`tmp_path_factory.getbasetemp()`).
+    :return: The common parent of the workers' base temp directories for xdist workers, `base_temp` otherwise.
+    """
+    base_temp = pathlib.Path(base_temp)
+    return base_temp.parent if is_xdist_worker() else base_temp
+
+
+class SharedResources:
+    """
+    Session resources built once and shared by all pytest-xdist workers.
+
+    Values are stored as JSON files in a directory visible to every worker and guarded by a file lock:
+    the first worker builds the value, the others wait for the lock and read the stored result.
+
+    **Usage**
+    storage_state = shared_resources.get_or_create("admin_storage_state", lambda: login_as_admin())
+    """
+
+    def __init__(self, root_dir: Union[pathlib.Path, str]):
+        self._root_dir = pathlib.Path(root_dir)
+        self._root_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def root_dir(self) -> pathlib.Path:
+        return self._root_dir
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the value stored under `key`, building it with `factory` if no worker has done it yet.
+
+        :param key: Unique resource name, used as the file name.
+        :param factory: Callable returning a JSON-serializable value.
+        :return: The shared value.
+        """
+        data_file = self._root_dir / f"{key}.json"
+        with FileLock(f"{data_file}.lock"):
+            if data_file.is_file():
+                logger.debug(f"Reuse shared resource '{key}' from '{data_file}'")
+                return json.loads(data_file.read_text(encoding="utf-8"))
+
+            logger.info(f"Build shared resource '{key}' on worker '{get_worker_id()}'")
+            value = factory()
+            data_file.write_text(json.dumps(value), encoding="utf-8")
+            return value
+
+    def invalidate(self, key: str) -> None:
+        """Remove the stored value, so the next `get_or_create` call rebuilds it."""
+        data_file = self._root_dir / f"{key}.json"
+        with FileLock(f"{data_file}.lock"):
+            data_file.unlink(missing_ok=True)
+
+
+class EngineSlots:
+    """
+    Cross-worker semaphore limiting how many tests use the same browser engine at once.
+
+    Each engine has `limit` slots, each slot is a lock file in a directory shared by all workers.
+
+    **Usage**
+    with engine_slots.acquire("webkit"):
+        run_test()
+    """
+
+    POLL_INTERVAL_SEC = 0.1
+
+    def __init__(self, root_dir: Union[pathlib.Path, str], limit: Optional[int] = None):
+        if limit is not None and limit < 1:
+            raise ValueError(f"Engine slot limit must be positive, got: {limit}")
+
+        self._root_dir = pathlib.Path(root_dir)
+        self._root_dir.mkdir(parents=True, exist_ok=True)
+        self._limit = limit
+
+    @contextmanager
+    def acquire(self, engine: str) -> Iterator[None]:
+        """
+        Hold one of the engine's slots for the duration of the block, waiting for a free one.
+
+        :param engine: Browser engine name.
+        """
+        if self._limit is None:
+            yield
+            return
+
+        lock = self._wait_for_slot(engine)
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _wait_for_slot(self, engine: str) -> FileLock:
+        waited = False
+        while True:
+            for slot in range(self._limit):
+                lock = FileLock(str(self._root_dir / f"{engine}-{slot}.lock"))
+                try:
+                    lock.acquire(timeout=0)
+                    return lock
+                except Timeout:
+                    continue
+            if not waited:
+                logger.debug(f"All {self._limit} '{engine}' slot(s) busy, waiting for a free one")
+                waited = True
+            time.sleep(self.POLL_INTERVAL_SEC)
@@ -1,16 +1,18 @@
+import json
 import logging
 import logging.config
+import os
 import pathlib
 import sys
+import tempfile
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-import yaml
-
 DEFAULT_CONFIG_FILE = pathlib.Path(__file__).parent / 'log_config.yaml'
 
 LOGS_DIRECTORY = pathlib.Path('logs')
-LOGS_DIRECTORY.mkdir(exist_ok=True)
+# Parsed logging configuration, reused while the YAML file is unchanged
+CONFIG_CACHE_FILE = LOGS_DIRECTORY / '.log_config_cache.json'
 
 DATETIME_FORMAT = "%Y-%m-%d %H-%M-%S"
 
@@ -27,25 +29,68 @@ def generate_log_filename(file_name: str = "test.log") -> str:
     return f"{timestamp}_{file_name}"
 
 
-def load_config(config_path: pathlib.Path) -> Dict[str, Any]:
+def load_config(config_path: pathlib.Path, cache_file: Optional[pathlib.Path] = CONFIG_CACHE_FILE) -> Dict[str, Any]:
     """
     Load and parse the YAML logging configuration file.
 
+    The parsed configuration is cached as JSON, keyed by the YAML file's path and modification time,
+    so later runs and other xdist workers neither import nor run the YAML parser.
+
     :param config_path: Path to the YAML logging config file.
+    :param cache_file: Path to the parsed configuration cache, None to always parse the YAML file.
     :return: Parsed configuration as a dictionary.
     """
     if not config_path.exists():
         raise FileNotFoundError(f"Logger config file '{config_path}' not found")
 
+    cache_key = {"source": str(config_path.resolve()), "mtime_ns": config_path.stat().st_mtime_ns}
+    if cache_file:
+        cached = _read_config_cache(cache_file, cache_key)
+        if cached is not None:
+            return cached
+
+    import yaml  # Deferred: only needed when the cache is missing or stale
+
     with config_path.open('rt') as f:
-        return yaml.safe_load(f)
+        try:
+            config = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            logging.error(f"Error parsing YAML config file: {e}")
+            raise
 
+    if cache_file:
+        _write_config_cache(cache_file, cache_key, config)
+    return config
+
+
+def _read_config_cache(cache_file: pathlib.Path, cache_key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        with cache_file.open('rt') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cache.get("config") if cache.get("key") == cache_key else None
 
-def update_log_filenames(config: Dict[str, Any]) -> None:
+
+def _write_config_cache(cache_file: pathlib.Path, cache_key: Dict[str, Any], config: Dict[str, Any]) -> None:
+    # Written to a temporary file first, so parallel workers never read a partially written cache
+    try:
+        data = json.dumps({"key": cache_key, "config": config})
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(descriptor, 'wt') as f:
+            f.write(data)
+        os.replace(temp_path, cache_file)
+    except (OSError, TypeError) as e:
+        logging.debug(f"Logger config cache '{cache_file}' was not written: {e}")
+
+
+def update_log_filenames(config: Dict[str, Any], logs_directory: pathlib.Path = LOGS_DIRECTORY) -> None:
     """
     Update the log filenames in the configuration, generating dynamic names based on the timestamp.
 
     :param config: Updated logging configuration.
+    :param logs_directory: Directory to write the log files to.
     """
     log_handlers = config.get("handlers")
     if log_handlers:
@@ -53,18 +98,21 @@ def update_log_filenames(config: Dict[str, Any]) -> None:
             output_file = handler.get("filename")
             if output_file:
                 # Dynamically generate log file names
-                handler["filename"] = LOGS_DIRECTORY.joinpath(generate_log_filename(output_file))
+                handler["filename"] = logs_directory.joinpath(generate_log_filename(output_file))
 
 
-def setup_logger(config_path: pathlib.Path = DEFAULT_CONFIG_FILE) -> None:
+def setup_logger(config_path: pathlib.Path = DEFAULT_CONFIG_FILE,
+                 logs_directory: pathlib.Path = LOGS_DIRECTORY) -> None:
     """
     Configure logging using a YAML configuration file.
 
     :param config_path: Path to the YAML logging config file.
+    :param logs_directory: Directory to write the log files to (e.g. a per-worker subdirectory).
     """
     try:
         config = load_config(config_path)
-        update_log_filenames(config)
+        logs_directory.mkdir(parents=True, exist_ok=True)
+        update_log_filenames(config, logs_directory)
         logging.config.dictConfig(config)
 
         sys.excepthook = unhandled_exception_handler
@@ -73,10 +121,6 @@ def setup_logger(config_path: pathlib.Path = DEFAULT_CONFIG_FILE) -> None:
         logging.error(f"Logger config file was not found: {e}")
         raise
 
-    except yaml.YAMLError as e:
-        logging.error(f"Error parsing YAML config file: {e}")
-        raise
-
 
 def unhandled_exception_handler(exc_type: type, exc_value: Exception, exc_traceback: Optional[Any]) -> None:
     """Global unhandled exception handler."""
@@ -0,0 +1,50 @@
+"""
+Content-addressed Allure attachments: identical attachments are written once and shared by all reports.
+"""
+import pathlib
+
+import allure_commons
+import pytest
+from allure_commons.logger import AllureFileLogger
+
+from framework.execution.attachments import (DEFAULT_COMPRESS_MIN_SIZE_BYTES, AttachmentStore,
+                                             DeduplicatingAllureFileLogger)
+from framework.execution.workers import is_xdist_worker
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("attachments", "Allure attachments")
+    group.addoption("--no-attachment-dedup", action="store_true",
+                    help="Write every Allure attachment to its own file instead of sharing identical ones")
+    group.addoption("--attachment-compress-min-size", type=int, default=DEFAULT_COMPRESS_MIN_SIZE_BYTES,
+                    metavar="BYTES", help="Size from which text attachments are stored gzip-compressed, "
+                                          "negative to never compress")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--no-attachment-dedup"):
+        return
+    file_logger = next((plugin for plugin in allure_commons.plugin_manager.get_plugins()
+                        if type(plugin) is AllureFileLogger), None)
+    if file_logger is None:
+        return
+
+    report_dir = pathlib.Path(config.option.allure_report_dir)
+    # xdist workers report to `<alluredir>/gw<N>/` (merged after the run): attachments go straight to the shared
+    # directory, so content attached by several workers is stored once too
+    attachments_dir = report_dir.parent if is_xdist_worker() else report_dir
+    compress_min_size = config.getoption("--attachment-compress-min-size")
+    store = AttachmentStore(attachments_dir, compress_min_size=compress_min_size if compress_min_size >= 0 else None)
+    dedup_logger = DeduplicatingAllureFileLogger(report_dir, store)
+    file_logger_name = allure_commons.plugin_manager.get_name(file_logger)
+    allure_commons.plugin_manager.unregister(file_logger)
+    allure_commons.plugin_manager.register(dedup_logger)
+
+    def restore_file_logger() -> None:
+        # Runs before allure-pytest's own cleanup, which unregisters its file logger by name
+        store.close()
+        allure_commons.plugin_manager.unregister(dedup_logger)
+        allure_commons.plugin_manager.register(file_logger, name=file_logger_name)
+
+    config.add_cleanup(restore_file_logger)
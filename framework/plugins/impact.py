@@ -0,0 +1,77 @@
+"""
+Page-object-aware test impact analysis: record what each test touches, then run only affected tests.
+"""
+import logging
+import pathlib
+from typing import List
+
+import pytest
+
+from framework.execution.impact import DEFAULT_IMPACT_MAP_FILE, ImpactMap, get_changed_files, impact_recorder
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("impact", "Test impact selection")
+    group.addoption("--impact-record", action="store_true",
+                    help="Record page objects, elements and locators touched by each test into the impact map")
+    group.addoption("--impact-map", default=DEFAULT_IMPACT_MAP_FILE,
+                    help="Path to the impact map file")
+    group.addoption("--impact-changed", action="append", default=[], metavar="PATH",
+                    help="Run only tests affected by this changed file (can be repeated)")
+    group.addoption("--impact-changed-locator", action="append", default=[], metavar="LOCATOR",
+                    help="Run only tests that used this changed locator (can be repeated)")
+    group.addoption("--impact-since", default=None, metavar="GIT_REF",
+                    help="Run only tests affected by files changed since the given git revision")
+
+
+def _get_impact_map(config: pytest.Config) -> ImpactMap:
+    return ImpactMap(config.rootpath / config.getoption("--impact-map"))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--impact-record"):
+        impact_recorder.enable(config.rootpath)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem):
+    if not impact_recorder.enabled:
+        yield
+        return
+
+    impact_recorder.start_test(item.nodeid)
+    try:
+        yield
+    finally:
+        impact_recorder.stop_test()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    changed_files = [pathlib.PurePath(path).as_posix() for path in config.getoption("--impact-changed")]
+    changed_locators = config.getoption("--impact-changed-locator")
+    since = config.getoption("--impact-since")
+    if since:
+        changed_files.extend(get_changed_files(since, config.rootpath))
+    if not changed_files and not changed_locators:
+        return
+
+    impact_map = _get_impact_map(config).load()
+    selected_ids = set(impact_map.select([item.nodeid for item in items], changed_files, changed_locators))
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected_ids]
+    logger.info(f"Impact selection: {len(items)} selected, {len(deselected)} deselected")
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if not impact_recorder.enabled:
+        return
+
+    records = impact_recorder.records()
+    if records:
+        impact_map = _get_impact_map(session.config)
+        impact_map.merge_and_save(records)
+        logger.debug(f"Saved impact records of {len(records)} tests to '{impact_map.path}'")
@@ -0,0 +1,63 @@
+"""
+Loader watching: extra loader selectors from the command line and a report of the time spent waiting for loaders.
+"""
+import logging
+from typing import Set
+
+import pytest
+
+from framework.ui.browser.loaders import loader_wait_stats, register_loader_selectors
+
+logger = logging.getLogger(__name__)
+
+LOADER_WAIT_PROPERTY = "loader_wait_ms"
+
+# Total loader wait time of the session when the test's current phase started
+phase_start_wait_key = pytest.StashKey[float]()
+
+
+class LoaderWaitReport:
+    """Sum the loader wait times reported by the tests, on the xdist controller as well as without xdist."""
+
+    def __init__(self):
+        self.tests: Set[str] = set()
+        self.total_ms = 0.0
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        wait_ms = sum(value for name, value in report.user_properties if name == LOADER_WAIT_PROPERTY)
+        if wait_ms:
+            self.tests.add(report.nodeid)
+            self.total_ms += wait_ms
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.total_ms:
+            return
+        terminalreporter.write_sep("-", "loader waits")
+        terminalreporter.write_line(f"Waited {self.total_ms / 1000:.1f}s for loaders in {len(self.tests)} test(s)")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("loaders", "Loader watching")
+    group.addoption("--loader-selector", action="append", default=[], metavar="SELECTOR",
+                    help="CSS selector of a loader that actions should wait for (can be repeated)")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    register_loader_selectors(*config.getoption("--loader-selector"))
+    config.pluginmanager.register(LoaderWaitReport(), "loader_wait_report")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    item.stash[phase_start_wait_key] = loader_wait_stats.total_ms
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report = outcome.get_result()
+    wait_ms = loader_wait_stats.total_ms - item.stash.get(phase_start_wait_key, loader_wait_stats.total_ms)
+    item.stash[phase_start_wait_key] = loader_wait_stats.total_ms
+    if wait_ms > 0:
+        report.user_properties.append((LOADER_WAIT_PROPERTY, round(wait_ms)))
+        logger.debug(f"{item.nodeid} waited {wait_ms:.0f} ms for loaders during {call.when}")
@@ -0,0 +1,114 @@
+"""
+Cross-browser matrix: run browser tests against several engines in one session and one report.
+
+Tests using the framework's `ui_browser` fixture are parametrized with `ui_browser_type`. Tests using
+pytest-playwright's `page` fixture are parametrized by pytest-playwright itself with `browser_name`,
+from the `--browser` values the matrix sets.
+"""
+import itertools
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import pytest
+
+from framework.execution.workers import EngineSlots, get_shared_dir
+from framework.ui.constants.browsers import BrowserType
+
+logger = logging.getLogger(__name__)
+
+BROWSER_TYPE_FIXTURE = "ui_browser_type"
+# Session-scoped parameter of pytest-playwright's browser fixtures (`browser`, `context`, `page`)
+PLAYWRIGHT_BROWSER_FIXTURE = "browser_name"
+ENGINE_SLOTS_DIR = "engine_slots"
+
+
+def _parse_matrix(value: Optional[str]) -> List[BrowserType]:
+    if not value:
+        return []
+    try:
+        return [BrowserType(name.strip()) for name in value.split(",") if name.strip()]
+    except ValueError as e:
+        raise pytest.UsageError(f"Invalid --browser-matrix value '{value}': {e}")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("matrix", "Cross-browser matrix")
+    group.addoption("--browser-matrix", default=None, metavar="ENGINES",
+                    help="Comma-separated browser types to run every browser test against, "
+                         "e.g. 'chromium,firefox,webkit'. Overrides --browser-type and --browser")
+    group.addoption("--matrix-max-per-engine", type=int, default=None, metavar="N",
+                    help="Maximum number of tests running at once on the same engine across all workers")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    browser_types = _parse_matrix(config.getoption("--browser-matrix"))
+    if browser_types and hasattr(config.option, "browser"):
+        # pytest-playwright parametrizes `browser_name` with its --browser values
+        config.option.browser = [browser_type.value for browser_type in browser_types]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    browser_types = _parse_matrix(metafunc.config.getoption("--browser-matrix"))
+    if browser_types and BROWSER_TYPE_FIXTURE in metafunc.fixturenames:
+        metafunc.parametrize(BROWSER_TYPE_FIXTURE, browser_types, ids=[bt.value for bt in browser_types])
+
+
+def _get_browser_type(item: pytest.Item) -> Optional[BrowserType]:
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get(BROWSER_TYPE_FIXTURE) if callspec else None
+
+
+def interleave_engines(items: List[pytest.Item]) -> List[pytest.Item]:
+    """
+    Interleave the `ui_browser` tests of the different engines, keeping each engine's own order, so parallel
+    workers run different engines at once instead of queueing on the same engine's slots.
+
+    Other tests keep their position. `page` tests are left grouped by engine as pytest orders them:
+    their browser is session-scoped per engine and would be relaunched at every engine switch.
+    """
+    positions = [index for index, item in enumerate(items) if _get_browser_type(item) is not None]
+    queues: Dict[Optional[BrowserType], List[pytest.Item]] = defaultdict(list)
+    for index in positions:
+        queues[_get_browser_type(items[index])].append(items[index])
+    interleaved = [item for item in itertools.chain.from_iterable(itertools.zip_longest(*queues.values()))
+                   if item is not None]
+
+    result = list(items)
+    for index, item in zip(positions, interleaved):
+        result[index] = item
+    return result
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]):
+    yield
+    if not config.getoption("--browser-matrix"):
+        return
+    if config.getoption("--duration-scheduling"):
+        # Longest-first order takes precedence, --matrix-max-per-engine still caps each engine
+        logger.debug("Duration scheduling enabled, matrix tests are not interleaved by engine")
+        return
+    items[:] = interleave_engines(items)
+
+
+@pytest.fixture(scope="session")
+def engine_slots(tmp_path_factory: pytest.TempPathFactory, pytestconfig: pytest.Config) -> EngineSlots:
+    """Per-engine concurrency limit shared by all xdist workers (no limit unless --matrix-max-per-engine)."""
+    return EngineSlots(get_shared_dir(tmp_path_factory.getbasetemp()) / ENGINE_SLOTS_DIR,
+                       limit=pytestconfig.getoption("--matrix-max-per-engine"))
+
+
+@pytest.fixture(autouse=True)
+def _matrix_engine_slot(request: pytest.FixtureRequest) -> None:
+    """Hold an engine slot for matrix tests using pytest-playwright's `page` (`ui_browser` holds its own)."""
+    callspec = getattr(request.node, "callspec", None)
+    if not request.config.getoption("--browser-matrix") or callspec is None \
+            or BROWSER_TYPE_FIXTURE in callspec.params or PLAYWRIGHT_BROWSER_FIXTURE not in callspec.params:
+        yield
+        return
+
+    engine_slots: EngineSlots = request.getfixturevalue("engine_slots")
+    with engine_slots.acquire(callspec.params[PLAYWRIGHT_BROWSER_FIXTURE]):
+        yield
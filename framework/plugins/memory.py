@@ -0,0 +1,105 @@
+"""
+Opt-in memory monitoring: sample memory at test boundaries, flag tests that grow it and write a session time series.
+"""
+import logging
+from typing import List, Optional
+
+import pytest
+from playwright.sync_api import Page
+
+from framework.execution.memory import MB, MemoryDelta, MemoryThresholds, memory_monitor
+from framework.execution.workers import get_worker_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_RESULTS_DIR = "memory-results"
+MEMORY_SERIES_FILE = "memory_series.jsonl"
+MEMORY_GROWTH_PROPERTY = "memory_growth"
+
+memory_delta_key = pytest.StashKey[Optional[MemoryDelta]]()
+
+
+class MemoryGrowthReport:
+    """Collect the tests flagged for memory growth, on the xdist controller as well as without xdist."""
+
+    def __init__(self):
+        self.flagged: List[str] = []
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        for name, value in report.user_properties:
+            if name == MEMORY_GROWTH_PROPERTY:
+                self.flagged.append(f"{report.nodeid}: {value}")
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.flagged:
+            return
+        terminalreporter.write_sep("-", "memory growth")
+        for line in self.flagged:
+            terminalreporter.write_line(line)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("memory", "Memory monitoring")
+    group.addoption("--memory-monitor", action="store_true",
+                    help="Sample Python, browser process and JS heap memory around each test")
+    group.addoption("--memory-results-dir", default=DEFAULT_MEMORY_RESULTS_DIR,
+                    help="Directory to write the memory time series to")
+    group.addoption("--memory-threshold-python-mb", type=float, default=MemoryThresholds.python / MB,
+                    help="Flag tests growing Python memory by more than this many MB")
+    group.addoption("--memory-threshold-rss-mb", type=float, default=MemoryThresholds.browser_rss / MB,
+                    help="Flag tests growing the browser processes' RSS by more than this many MB")
+    group.addoption("--memory-threshold-js-mb", type=float, default=MemoryThresholds.js_heap / MB,
+                    help="Flag tests growing the JS heap of their pages by more than this many MB")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getoption("--memory-monitor"):
+        return
+
+    thresholds = MemoryThresholds(python=int(config.getoption("--memory-threshold-python-mb") * MB),
+                                  browser_rss=int(config.getoption("--memory-threshold-rss-mb") * MB),
+                                  js_heap=int(config.getoption("--memory-threshold-js-mb") * MB))
+    series_file = get_worker_dir(config.rootpath / config.getoption("--memory-results-dir")) / MEMORY_SERIES_FILE
+    memory_monitor.enable(series_file, thresholds)
+    config.pluginmanager.register(MemoryGrowthReport(), "memory_growth_report")
+    logger.info(f"Memory monitoring enabled, time series: '{series_file}'")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if memory_monitor.enabled:
+        memory_monitor.disable()
+
+
+def _get_pages(item: pytest.Item) -> List[Page]:
+    """Return the pages of the browser contexts used by the test (through a `Page` or a `Browser` fixture)."""
+    pages: List[Page] = []
+    for value in getattr(item, "funcargs", {}).values():
+        page = value if isinstance(value, Page) else getattr(value, "page", None)
+        if isinstance(page, Page):
+            pages.extend(p for p in page.context.pages if p not in pages)
+    return pages
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    if not memory_monitor.enabled:
+        yield
+        return
+
+    memory_monitor.start_test(item.nodeid, _get_pages(item))
+    try:
+        yield
+    finally:
+        item.stash[memory_delta_key] = memory_monitor.stop_test(item.nodeid, _get_pages(item))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    if call.when != "call":
+        return
+    delta = item.stash.get(memory_delta_key, None)
+    if delta is not None and delta.exceeded:
+        report = outcome.get_result()
+        report.sections.append(("Memory growth", delta.summary()))
+        report.user_properties.append((MEMORY_GROWTH_PROPERTY, delta.summary().splitlines()[0]))
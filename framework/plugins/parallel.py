@@ -0,0 +1,58 @@
+"""
+pytest-xdist integration: per-worker report directories and resources shared between workers.
+"""
+import logging
+import pathlib
+import shutil
+
+import pytest
+
+from framework.execution.workers import SharedResources, get_shared_dir, get_worker_dir, is_xdist_worker
+
+logger = logging.getLogger(__name__)
+
+XDIST_WORKER_DIR_PATTERN = "gw*"
+SHARED_RESOURCES_DIR = "shared_resources"
+
+
+def _is_xdist_controller(config: pytest.Config) -> bool:
+    """Check if this process distributes tests to pytest-xdist workers."""
+    return config.pluginmanager.hasplugin("dsession")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Point each xdist worker to its own Allure results directory (runs before allure-pytest reads it)."""
+    allure_dir = getattr(config.option, "allure_report_dir", None)
+    if allure_dir and is_xdist_worker():
+        config.option.allure_report_dir = str(get_worker_dir(allure_dir))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Merge per-worker Allure results back into the configured directory, so one report is generated."""
+    config = session.config
+    allure_dir = getattr(config.option, "allure_report_dir", None)
+    if not allure_dir or not _is_xdist_controller(config):
+        return
+
+    results_dir = pathlib.Path(allure_dir)
+    for worker_dir in results_dir.glob(XDIST_WORKER_DIR_PATTERN):
+        if not worker_dir.is_dir():
+            continue
+        for result_file in worker_dir.iterdir():
+            target = results_dir / result_file.name
+            if not target.exists():
+                shutil.move(str(result_file), str(target))
+        shutil.rmtree(worker_dir, ignore_errors=True)
+    logger.debug(f"Merged worker Allure results into '{results_dir}'")
+
+
+@pytest.fixture(scope="session")
+def shared_resources(tmp_path_factory: pytest.TempPathFactory) -> SharedResources:
+    """
+    Resources built once per test run and shared by all xdist workers (e.g. storage states, caches).
+
+    Workers use the common parent of their base temp directories, as recommended by pytest-xdist.
+    """
+    return SharedResources(get_shared_dir(tmp_path_factory.getbasetemp()) / SHARED_RESOURCES_DIR)
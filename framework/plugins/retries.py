@@ -0,0 +1,51 @@
+"""
+Step-level retries: retry a flaky `@action`/`@step` instead of failing (and rerunning) the whole test.
+"""
+import logging
+
+import pytest
+
+from framework.execution.retries import ACTION_TIMEOUT_POLICY, DEFAULT_RETRY_BUDGET_MS, retry_engine
+
+logger = logging.getLogger(__name__)
+
+# Number of retries of the test already included in the reports of its previous phases
+reported_retries_key = pytest.StashKey[int]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("retries", "Step retries")
+    group.addoption("--step-retries", action="store_true",
+                    help="Retry failed element actions and steps according to the default retry policies")
+    group.addoption("--step-retry-budget", type=int, default=DEFAULT_RETRY_BUDGET_MS, metavar="MS",
+                    help="Maximum time each test may spend retrying steps, in milliseconds")
+    group.addoption("--step-retry-action-timeouts", action="store_true",
+                    help="Also retry timeouts of element actions not marked idempotent, once "
+                         "(an action that timed out after reaching the page runs twice)")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("--step-retries"):
+        retry_engine.enable(budget_ms=config.getoption("--step-retry-budget"))
+        if config.getoption("--step-retry-action-timeouts"):
+            retry_engine.register(ACTION_TIMEOUT_POLICY, first=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem):
+    retry_engine.start_test()
+    yield
+    stats = retry_engine.stop_test()
+    if stats.records:
+        logger.info(f"{item.nodeid}: {stats.summary()}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report = outcome.get_result()
+    records = retry_engine.stats.records
+    reported = item.stash.get(reported_retries_key, 0)
+    if len(records) > reported:
+        report.sections.append((f"Step retries ({report.when})", "\n".join(map(str, records[reported:]))))
+        item.stash[reported_retries_key] = len(records)
@@ -0,0 +1,120 @@
+"""
+Duration-history driven test scheduling: longest tests first, spread across xdist workers.
+"""
+import logging
+import pathlib
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+
+import pytest
+
+from framework.execution.durations import (DEFAULT_HISTORY_FILE, MIN_KNOWN_SHARE_FOR_PREDICTION, DurationHistory,
+                                          predict_makespan)
+from framework.execution.workers import get_worker_count, is_xdist_worker
+
+logger = logging.getLogger(__name__)
+
+
+class DurationSchedulingPlugin:
+    """Record test durations into the history file and order tests by them."""
+
+    def __init__(self, config: pytest.Config, history: DurationHistory):
+        self._config = config
+        self._history = history
+        self._durations: Dict[str, float] = defaultdict(float)
+        self._predicted_makespan: Optional[float] = None
+        self._workers = 1
+        self._first_test_start: Optional[float] = None
+        self._last_test_end: Optional[float] = None
+
+    def _predict(self, node_ids: Sequence[str], workers: int) -> None:
+        self._workers = workers
+        known_share = self._history.known_share(node_ids)
+        if known_share < MIN_KNOWN_SHARE_FOR_PREDICTION:
+            logger.debug(f"Only {known_share:.0%} of the tests have a recorded duration, no makespan prediction")
+            return
+        self._predicted_makespan = predict_makespan([self._history.estimate(n) for n in node_ids], workers)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: List[pytest.Item]) -> None:
+        if not items:
+            return
+
+        item_by_id = {item.nodeid: item for item in items}
+        items[:] = [item_by_id[node_id] for node_id in self._history.order_longest_first(item_by_id)]
+        logger.debug(f"Ordered {len(items)} tests by duration history '{self._history.path}'")
+
+        if not is_xdist_worker():
+            self._predict([item.nodeid for item in items], get_worker_count())
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids: Sequence[str]) -> None:
+        # The controller does not collect itself, predict from the first worker's collection
+        if self._predicted_makespan is None:
+            self._predict(ids, len(self._config.getoption("tx") or []) or 1)
+
+    @pytest.hookimpl(optionalhook=True, tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config: pytest.Config, log):
+        if config.getvalue("dist") != "load":
+            return None
+
+        from framework.execution.duration_scheduler import DurationScheduling
+        return DurationScheduling(config, log)
+
+    def pytest_runtest_logstart(self, nodeid: str, location) -> None:
+        if self._first_test_start is None:
+            self._first_test_start = time.monotonic()
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self._durations[report.nodeid] += report.duration
+        self._last_test_end = time.monotonic()
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if is_xdist_worker() or session.config.option.collectonly or not self._durations:
+            return
+
+        for node_id, duration in self._durations.items():
+            self._history.update(node_id, duration)
+        self._history.save()
+        logger.debug(f"Saved {len(self._durations)} test durations to '{self._history.path}'")
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self._first_test_start is None or self._last_test_end is None:
+            return
+
+        terminalreporter.write_sep("-", "duration scheduling")
+        if self._predicted_makespan is not None:
+            terminalreporter.write_line(
+                f"Predicted makespan: {self._predicted_makespan:.1f}s on {self._workers} worker(s)")
+        terminalreporter.write_line(f"Actual makespan: {self._last_test_end - self._first_test_start:.1f}s")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("scheduling", "Duration-history driven test scheduling")
+    group.addoption("--duration-scheduling", action="store_true",
+                    help="Record test durations and run the longest tests first")
+    group.addoption("--duration-history", default=None,
+                    help="Path to the test duration history file, defaults to one in the pytest cache directory")
+    group.addoption("--duration-fallback", type=float, default=None,
+                    help="Estimated duration (seconds) for tests without history, defaults to the history median")
+
+
+def get_history_path(config: pytest.Config) -> pathlib.Path:
+    """Return the duration history file: the given one, otherwise one in the pytest cache directory."""
+    history_file = config.getoption("--duration-history")
+    if history_file:
+        return config.rootpath / history_file
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        return cache.mkdir("duration-history") / DEFAULT_HISTORY_FILE
+    return config.rootpath / ".pytest_cache" / DEFAULT_HISTORY_FILE
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not config.getoption("--duration-scheduling"):
+        return
+
+    history = DurationHistory(get_history_path(config),
+                              fallback_estimate=config.getoption("--duration-fallback")).load()
+    config.pluginmanager.register(DurationSchedulingPlugin(config, history), "duration_scheduling")
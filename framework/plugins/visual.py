@@ -0,0 +1,22 @@
+"""
+Visual regression: baseline screenshots directory and update mode.
+"""
+import pytest
+
+from framework.ui.visual.baselines import DEFAULT_BASELINES_DIR, VISUAL_RESULTS_DIR, baseline_store
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("visual", "Visual regression")
+    group.addoption("--update-baselines", action="store_true",
+                    help="Replace baseline screenshots with the current ones instead of comparing them")
+    group.addoption("--visual-baselines-dir", default=str(DEFAULT_BASELINES_DIR),
+                    help="Directory of the baseline screenshots")
+    group.addoption("--visual-results-dir", default=str(VISUAL_RESULTS_DIR),
+                    help="Directory for screenshots not matching their baselines and their diff images")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    baseline_store.configure(root_dir=config.rootpath / config.getoption("--visual-baselines-dir"),
+                             results_dir=config.rootpath / config.getoption("--visual-results-dir"),
+                             update=config.getoption("--update-baselines"))
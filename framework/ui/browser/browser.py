@@ -1,32 +1,76 @@
 import logging
-from typing import Any, List, Union
+import weakref
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
 
 from playwright.sync_api import Page
 
-from framework.ui.browser.dialog import DialogHandler
+from framework.api.api_client import ApiClient
+from framework.ui.browser.dialog import DialogHandler, DialogJournal
+from framework.ui.browser.downloads import DownloadManager
+from framework.ui.browser.loaders import LoaderWatcher
+from framework.ui.browser.network import NetworkMonitor, PageNetworkTracker
 from framework.ui.browser.window import WindowManager
 from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.elements.base_element import BaseElement
+from framework.ui.visual.baselines import baseline_store
 from framework.utils import http_utils
 
+if TYPE_CHECKING:
+    from framework.ui.visual.comparison import ComparisonOptions, ComparisonResult
+
 logger = logging.getLogger(__name__)
 
 
 class Browser:
 
     def __init__(self, page: Page):
-        self._page = page
+        self._window = WindowManager(page)
+        DialogJournal.for_context(page.context)
+        self._loaders = LoaderWatcher.for_context(page.context)
+        self._network = NetworkMonitor.for_context(page.context)
+        # Kept per page, so the files saved through `downloads` in a test are numbered instead of overwritten
+        self._downloads: 'weakref.WeakKeyDictionary[Page, DownloadManager]' = weakref.WeakKeyDictionary()
 
     @property
     def page(self) -> Page:
-        return self._page
+        """The active page: follows the tab switches made through `window`."""
+        return self._window.page
+
+    @property
+    def api(self) -> ApiClient:
+        """API client sharing the cookies and the connections of the browser context."""
+        return ApiClient.for_context(self.page.context)
 
     @property
     def dialog(self) -> DialogHandler:
         return DialogHandler(self.page)
 
+    @property
+    def downloads(self) -> DownloadManager:
+        """Download manager of the active page."""
+        page = self.page
+        manager = self._downloads.get(page)
+        if manager is None:
+            manager = self._downloads[page] = DownloadManager(page)
+        return manager
+
+    @property
+    def loaders(self) -> LoaderWatcher:
+        return self._loaders
+
+    @property
+    def network(self) -> PageNetworkTracker:
+        """In-flight requests and per-navigation request statistics of the active page."""
+        return self._network.get_tracker(self.page)
+
+    @property
+    def network_monitor(self) -> NetworkMonitor:
+        """Request tracking settings shared by all pages of the context (e.g. ignored URLs)."""
+        return self._network
+
     @property
     def window(self) -> WindowManager:
-        return WindowManager(self.page)
+        return self._window
 
     def execute_script(self, js_script: str, *args: Any) -> Any:
         """Execute JavaScript code in the browser context."""
@@ -78,6 +122,60 @@ class Browser:
         except Exception as e:
             logger.error(f"Error taking screenshot: {e}")
 
+    def take_element_screenshots(self, elements: Sequence[BaseElement]) -> List[bytes]:
+        """
+        Take screenshots of several elements, cropped from a single capture of the page.
+
+        :param elements: The elements to capture.
+        :return: PNG screenshots, in the order of the elements.
+        """
+        from framework.ui.visual.element_screenshots import take_element_screenshots
+
+        logger.info(f"Taking screenshots of {len(elements)} elements")
+        return take_element_screenshots(self.page, elements)
+
+    def assert_screenshot(self, name: str, full_page: bool = False,
+                          options: Optional['ComparisonOptions'] = None) -> 'ComparisonResult':
+        """
+        Compare a screenshot of the current page with its baseline for this browser and viewport.
+
+        :param name: Baseline name.
+        :param full_page: Whether to capture the full scrollable page instead of the viewport.
+        :param options: Comparison tolerances.
+        :return: The comparison result.
+        :raises AssertionError: If the screenshot does not match the baseline.
+        """
+        logger.info(f"Comparing page screenshot with baseline '{name}'")
+        png = self.page.screenshot(full_page=full_page, animations="disabled", caret="hide")
+        return baseline_store.assert_matches(self.page, name, png, options)
+
+    def wait_for_loader(self, appear_timeout: int = WaitTimeoutsMs.WAIT_LOADER_APPEAR,
+                        disappear_timeout: int = WaitTimeoutsMs.WAIT_LOADER_DISAPPEAR) -> None:
+        """
+        Wait for a loader started by the previous action to appear and disappear, instead of a fixed delay.
+
+        :param appear_timeout: Maximum time to wait for a loader to appear in milliseconds.
+        :param disappear_timeout: Maximum time to wait for the loaders to disappear in milliseconds.
+        :raises TimeoutError: If a loader is still visible after `disappear_timeout`.
+        """
+        logger.info("Waiting for loaders")
+        self._loaders.wait_for_loader(self.page, appear_timeout, disappear_timeout)
+
+    def wait_for_network_quiet(self, max_inflight: int = 0, quiet_ms: int = 500,
+                               timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD) -> None:
+        """
+        Wait until at most `max_inflight` requests of the active page have been in flight for `quiet_ms`.
+
+        Requests to URLs ignored through `network_monitor.ignore_urls` and event streams are not counted.
+
+        :param max_inflight: Number of in-flight requests still considered quiet.
+        :param quiet_ms: How long the network must stay quiet in milliseconds.
+        :param timeout: Maximum time to wait in milliseconds.
+        :raises TimeoutError: If the network does not become quiet in time.
+        """
+        logger.info(f"Waiting for network quiet ({max_inflight} requests in flight for {quiet_ms} ms)")
+        self.network.wait_for_network_quiet(max_inflight, quiet_ms, timeout)
+
     def wait_for_delay(self, timeout: int = WaitTimeoutsMs.DEFAULT_DELAY) -> None:
         """Waits for the given `timeout` in milliseconds."""
         logger.debug(f"Waiting for {timeout}ms")
@@ -0,0 +1,144 @@
+import logging
+import pathlib
+from typing import Any, Dict, List, Optional, Union
+
+from playwright.sync_api import Browser as PlaywrightBrowser, BrowserContext, Playwright
+
+from configs.settings import DEFAULT_VIEWPORT_SIZE
+from framework.ui.browser import browser_server
+from framework.ui.browser.context_reset import ContextResetter
+from framework.ui.browser.dialog import DialogJournal
+from framework.ui.constants.browsers import BrowserType
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Per-process pool of launched browsers and their contexts.
+
+    Each pytest(-xdist) worker owns one pool, so every worker drives its own browser processes.
+    Browsers are launched lazily on first use and kept for the whole session; contexts are handed
+    out per test and closed on release. If a healthy browser server (see `browser_server`) is running,
+    the pool connects to it instead of launching a browser.
+
+    With `reuse_contexts`, released contexts are reset in place and handed to the next test
+    instead of being closed (see `ContextResetter`).
+    """
+
+    def __init__(self, playwright: Playwright, headless: bool = False,
+                 server_endpoint_file: Optional[Union[pathlib.Path, str]] = None, reuse_contexts: bool = False,
+                 **context_options: Any):
+        self._playwright = playwright
+        self._headless = headless
+        self._server_endpoint_file = server_endpoint_file
+        self._reuse_contexts = reuse_contexts
+        self._context_options = {"viewport": DEFAULT_VIEWPORT_SIZE, **context_options}
+        self._browsers: Dict[BrowserType, PlaywrightBrowser] = {}
+        self._contexts: List[BrowserContext] = []
+        self._resetters: Dict[BrowserContext, ContextResetter] = {}
+        self._context_types: Dict[BrowserContext, BrowserType] = {}
+        self._idle_contexts: Dict[BrowserType, List[BrowserContext]] = {}
+
+    @property
+    def reuse_contexts(self) -> bool:
+        return self._reuse_contexts
+
+    def get_browser(self, browser_type: BrowserType = BrowserType.CHROMIUM) -> PlaywrightBrowser:
+        """
+        Return the pooled browser of the given type, launching it on first request.
+
+        :param browser_type: Browser engine to use.
+        :return: Launched Playwright browser.
+        """
+        browser = self._browsers.get(browser_type)
+        if browser is None or not browser.is_connected():
+            browser = self._connect_to_server(browser_type) or self._launch(browser_type)
+            self._browsers[browser_type] = browser
+        return browser
+
+    def _connect_to_server(self, browser_type: BrowserType) -> Optional[PlaywrightBrowser]:
+        """Connect to a running browser server of the given type, if there is a healthy one."""
+        if self._server_endpoint_file is None:
+            return None
+
+        endpoint = browser_server.get_healthy_endpoint(browser_type, self._server_endpoint_file)
+        if endpoint is None:
+            return None
+
+        logger.info(f"Connect to '{browser_type.value}' browser server at '{endpoint.ws_endpoint}'")
+        try:
+            return getattr(self._playwright, browser_type.value).connect_over_cdp(endpoint.ws_endpoint)
+        except Exception as e:
+            logger.warning(f"Failed to connect to browser server, falling back to local launch: {e}")
+            return None
+
+    def _launch(self, browser_type: BrowserType) -> PlaywrightBrowser:
+        logger.info(f"Launch '{browser_type.value}' browser (headless: {self._headless})")
+        return getattr(self._playwright, browser_type.value).launch(headless=self._headless)
+
+    def acquire_context(self, browser_type: BrowserType = BrowserType.CHROMIUM, **options: Any) -> BrowserContext:
+        """
+        Return a browser context in the pooled browser of the given type.
+
+        In reuse mode, a previously released (and reset) context is returned if available.
+        Contexts with custom options are never reused.
+
+        :param browser_type: Browser engine to use.
+        :param options: Extra `new_context` options (e.g. `storage_state`), override pool defaults.
+        :return: Browser context with the framework default timeout applied.
+        """
+        reusable = self._reuse_contexts and not options
+        idle_contexts = self._idle_contexts.get(browser_type)
+        if reusable and idle_contexts:
+            return idle_contexts.pop()
+
+        context = self.get_browser(browser_type).new_context(**{**self._context_options, **options})
+        context.set_default_timeout(WaitTimeoutsMs.WAIT_PAGE_LOAD)
+        DialogJournal.for_context(context)
+        self._contexts.append(context)
+        if reusable:
+            self._resetters[context] = ContextResetter(context)
+            self._context_types[context] = browser_type
+        return context
+
+    def release_context(self, context: BrowserContext) -> None:
+        """
+        Release a context previously returned by `acquire_context`.
+
+        Reusable contexts are reset and kept for the next test; a context that is still not clean
+        after the reset is closed instead.
+        """
+        resetter = self._resetters.get(context)
+        if resetter is not None:
+            try:
+                residue = resetter.inspect()
+                if not residue.is_clean():
+                    logger.info(f"Test left residue in browser context: {residue}")
+                resetter.reset()
+                if resetter.verify().is_clean():
+                    self._idle_contexts.setdefault(self._context_types[context], []).append(context)
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to reset browser context, closing it instead: {e}")
+
+        self._resetters.pop(context, None)
+        self._context_types.pop(context, None)
+        if context in self._contexts:
+            self._contexts.remove(context)
+        context.close()
+
+    def close(self) -> None:
+        """Close all contexts and browsers owned by the pool."""
+        for context in self._contexts:
+            context.close()
+        self._contexts.clear()
+        self._resetters.clear()
+        self._context_types.clear()
+        self._idle_contexts.clear()
+        for browser_type, browser in self._browsers.items():
+            # For a browser server connection this only disconnects, the server keeps running
+            logger.info(f"Close '{browser_type.value}' browser")
+            browser.close()
+        self._browsers.clear()
@@ -0,0 +1,180 @@
+"""
+Long-lived local browser server that test runs connect to instead of launching a browser each time.
+
+Playwright for Python has no `BrowserType.launch_server`, so the server is a Chromium browser started with
+a remote debugging port and kept alive by this process. Test runs connect to it over CDP.
+
+**Usage**
+python -m framework.ui.browser.browser_server start [--port 9222] [--headless]
+python -m framework.ui.browser.browser_server status
+python -m framework.ui.browser.browser_server stop
+"""
+import argparse
+import json
+import logging
+import os
+import pathlib
+import signal
+import sys
+import time
+import urllib.error
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Union
+
+from framework.ui.constants.browsers import BrowserType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT_FILE = pathlib.Path(".browser_server") / "endpoint.json"
+DEFAULT_PORT = 9222
+HEALTH_CHECK_TIMEOUT_SEC = 0.5
+
+
+@dataclass
+class ServerEndpoint:
+    """Endpoint of a running browser server, as written to the endpoint file."""
+    browser_type: str
+    ws_endpoint: str
+    http_endpoint: str
+    pid: int
+
+
+def read_endpoint(endpoint_file: Union[pathlib.Path, str] = DEFAULT_ENDPOINT_FILE) -> Optional[ServerEndpoint]:
+    """
+    Read the endpoint file written by a running server.
+
+    :param endpoint_file: Path to the endpoint file.
+    :return: Server endpoint, or None if the file is missing or invalid.
+    """
+    endpoint_file = pathlib.Path(endpoint_file)
+    if not endpoint_file.is_file():
+        return None
+    try:
+        return ServerEndpoint(**json.loads(endpoint_file.read_text(encoding="utf-8")))
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Ignoring invalid browser server endpoint file '{endpoint_file}': {e}")
+        return None
+
+
+def is_healthy(endpoint: ServerEndpoint, timeout: float = HEALTH_CHECK_TIMEOUT_SEC) -> bool:
+    """
+    Check that the browser server answers on its endpoint.
+
+    :param endpoint: Server endpoint to check.
+    :param timeout: Request timeout in seconds.
+    :return: True if the server responded, False otherwise.
+    """
+    import urllib.request  # Deferred: pulls in http.client and ssl, which test runs only need with a server
+
+    try:
+        with urllib.request.urlopen(f"{endpoint.http_endpoint}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        logger.debug(f"Browser server '{endpoint.http_endpoint}' is not healthy: {e}")
+        return False
+
+
+def get_healthy_endpoint(browser_type: BrowserType,
+                         endpoint_file: Union[pathlib.Path, str] = DEFAULT_ENDPOINT_FILE) -> Optional[ServerEndpoint]:
+    """
+    Return the endpoint of a running server for the given browser type, if there is a healthy one.
+
+    :param browser_type: Browser engine the test run needs.
+    :param endpoint_file: Path to the endpoint file.
+    :return: Healthy server endpoint, or None to fall back to a local launch.
+    """
+    endpoint = read_endpoint(endpoint_file)
+    if endpoint is None or endpoint.browser_type != browser_type.value:
+        return None
+    if not is_healthy(endpoint):
+        logger.warning(f"Browser server at '{endpoint.http_endpoint}' is not responding, falling back to local launch")
+        return None
+    return endpoint
+
+
+def _get_ws_endpoint(http_endpoint: str) -> str:
+    import urllib.request
+
+    with urllib.request.urlopen(f"{http_endpoint}/json/version", timeout=HEALTH_CHECK_TIMEOUT_SEC) as response:
+        return json.loads(response.read())["webSocketDebuggerUrl"]
+
+
+def start_server(port: int = DEFAULT_PORT, headless: bool = False,
+                 endpoint_file: Union[pathlib.Path, str] = DEFAULT_ENDPOINT_FILE) -> None:
+    """
+    Launch a Chromium browser with a remote debugging port and keep it running until interrupted.
+
+    :param port: Remote debugging port.
+    :param headless: Run the browser in headless mode.
+    :param endpoint_file: Path to write the endpoint file to; removed on shutdown.
+    """
+    from playwright.sync_api import sync_playwright
+
+    endpoint_file = pathlib.Path(endpoint_file)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless, args=[f"--remote-debugging-port={port}"])
+        http_endpoint = f"http://127.0.0.1:{port}"
+        endpoint = ServerEndpoint(browser_type=BrowserType.CHROMIUM.value, ws_endpoint=_get_ws_endpoint(http_endpoint),
+                                  http_endpoint=http_endpoint, pid=os.getpid())
+        endpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        endpoint_file.write_text(json.dumps(asdict(endpoint), indent=2), encoding="utf-8")
+        logger.info(f"Browser server listening on '{endpoint.ws_endpoint}' (endpoint file: '{endpoint_file}')")
+
+        try:
+            while browser.is_connected():
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            endpoint_file.unlink(missing_ok=True)
+            logger.info("Browser server stopped")
+
+
+def stop_server(endpoint_file: Union[pathlib.Path, str] = DEFAULT_ENDPOINT_FILE) -> bool:
+    """
+    Stop the server recorded in the endpoint file.
+
+    :param endpoint_file: Path to the endpoint file.
+    :return: True if a running server was signalled, False if there was none.
+    """
+    endpoint = read_endpoint(endpoint_file)
+    if endpoint is None:
+        return False
+    try:
+        os.kill(endpoint.pid, signal.SIGTERM)
+        return True
+    except OSError:
+        pathlib.Path(endpoint_file).unlink(missing_ok=True)
+        return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Persistent local browser server for test runs")
+    parser.add_argument("--endpoint-file", default=str(DEFAULT_ENDPOINT_FILE), help="Path to the endpoint file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    start = commands.add_parser("start", help="Launch the browser server and keep it running")
+    start.add_argument("--port", type=int, default=DEFAULT_PORT, help="Remote debugging port")
+    start.add_argument("--headless", action="store_true", help="Run browser in headless mode")
+    commands.add_parser("stop", help="Stop the running browser server")
+    commands.add_parser("status", help="Show the running browser server endpoint")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)-5s - %(message)s")
+    if args.command == "start":
+        start_server(port=args.port, headless=args.headless, endpoint_file=args.endpoint_file)
+    elif args.command == "stop":
+        if not stop_server(args.endpoint_file):
+            logger.info("No running browser server found")
+    elif args.command == "status":
+        endpoint = read_endpoint(args.endpoint_file)
+        if endpoint is None or not is_healthy(endpoint):
+            logger.info("Browser server is not running")
+            return 1
+        logger.info(f"Browser server is running: {endpoint.ws_endpoint} (pid: {endpoint.pid})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
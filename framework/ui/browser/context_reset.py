@@ -0,0 +1,220 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Set
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Frame, Page, Route
+
+from configs.settings import DEFAULT_VIEWPORT_SIZE
+from framework.ui.browser.dialog import DialogHandler, DialogJournal
+from framework.ui.browser.loaders import LOADER_BINDING_NAME
+from framework.ui.constants.page_events import ContextEvent, PageEvent
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+
+logger = logging.getLogger(__name__)
+
+BLANK_PAGE_URL = "about:blank"
+RESET_PAGE_PATH = "/__framework_context_reset__"
+RESET_PAGE_HTML = "<!DOCTYPE html><title>reset</title>"
+# Bindings exposed by the framework itself, kept for the next test
+FRAMEWORK_BINDINGS = (LOADER_BINDING_NAME,)
+
+# Clears the storage of the current origin, then returns what is left of it
+CLEAR_ORIGIN_STORAGE_JS = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map(db => new Promise(resolve => {
+            const request = indexedDB.deleteDatabase(db.name);
+            request.onsuccess = request.onerror = request.onblocked = resolve;
+        })));
+    }
+    if (navigator.serviceWorker) {
+        const registrations = await navigator.serviceWorker.getRegistrations();
+        await Promise.all(registrations.map(registration => registration.unregister()));
+    }
+    if (window.caches) {
+        const keys = await caches.keys();
+        await Promise.all(keys.map(key => caches.delete(key)));
+    }
+    const left = [];
+    if (localStorage.length) left.push("localStorage");
+    if (sessionStorage.length) left.push("sessionStorage");
+    if (indexedDB.databases && (await indexedDB.databases()).length) left.push("IndexedDB");
+    if (navigator.serviceWorker && (await navigator.serviceWorker.getRegistrations()).length) {
+        left.push("service workers");
+    }
+    if (window.caches && (await caches.keys()).length) left.push("cache storage");
+    return left;
+}
+"""
+
+
+def _get_handlers(owner: Any, attribute: str) -> Optional[List[str]]:
+    """
+    Return the route handlers or exposed bindings of a context or page.
+
+    The sync API does not expose them, they are read from its implementation object.
+
+    :return: The handler descriptions, None if the Playwright internals are not as expected.
+    """
+    try:
+        return [str(handler) for handler in getattr(owner._impl_obj, attribute)]
+    except (AttributeError, TypeError):
+        return None
+
+
+@dataclass
+class ContextResidue:
+    """State left in a browser context, compared to a freshly created one."""
+    cookies: int = 0
+    storage_origins: List[str] = field(default_factory=list)
+    extra_pages: int = 0
+    page_url: str = BLANK_PAGE_URL
+    # Origins whose session storage, IndexedDB, service workers or cache storage could not be cleared
+    uncleared_origins: List[str] = field(default_factory=list)
+    service_workers: int = 0
+    routes: int = 0
+    # `expose_binding`/`expose_function` names: Playwright cannot remove them from a context
+    bindings: List[str] = field(default_factory=list)
+
+    def is_clean(self) -> bool:
+        return (not (self.cookies or self.storage_origins or self.extra_pages or self.uncleared_origins
+                     or self.service_workers or self.routes or self.bindings)
+                and self.page_url == BLANK_PAGE_URL)
+
+    def __str__(self) -> str:
+        return (f"cookies: {self.cookies}, origins with storage: {self.storage_origins}, "
+                f"extra pages: {self.extra_pages}, page URL: '{self.page_url}', "
+                f"uncleared origins: {self.uncleared_origins}, service workers: {self.service_workers}, "
+                f"routes: {self.routes}, bindings: {self.bindings}")
+
+
+class ContextResetter:
+    """
+    Resets a browser context in place, so it can be reused by the next test instead of creating a new one.
+
+    Clears cookies, local/session storage, IndexedDB, service workers and cache storage of every origin visited,
+    permissions, routes, extra HTTP headers, dialog listeners and the dialog journal, closes extra pages
+    and leaves the first page on 'about:blank'.
+
+    `verify` checks all of it except permissions, which Playwright cannot read back. Exposed bindings and
+    WebSocket routes cannot be removed: a context with any is reported as not clean. Init scripts
+    (`add_init_script`) can neither be removed nor detected, tests adding them must not reuse contexts.
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._context = context
+        self._origins: Set[str] = set()
+        self._uncleared_origins: List[str] = []
+
+        for page in context.pages:
+            self._track_page(page)
+        context.on(ContextEvent.PAGE.value, self._track_page)
+
+    @property
+    def context(self) -> BrowserContext:
+        return self._context
+
+    def _track_page(self, page: Page) -> None:
+        page.on(PageEvent.FRAME_NAVIGATED.value, self._track_frame)
+
+    def _track_frame(self, frame: Frame) -> None:
+        url = urlsplit(frame.url)
+        if url.scheme in ("http", "https") and url.path != RESET_PAGE_PATH:
+            self._origins.add(f"{url.scheme}://{url.netloc}")
+
+    def inspect(self) -> ContextResidue:
+        """
+        Collect the state currently held by the context.
+
+        :return: Residue compared to a freshly created context.
+        """
+        pages = self._context.pages
+        storage_origins = [
+            origin["origin"] for origin in self._context.storage_state()["origins"] if origin.get("localStorage")
+        ]
+        routes, bindings = 0, []
+        for owner in [self._context, *pages]:
+            for attribute in ("_routes", "_web_socket_routes"):
+                routes += len(_get_handlers(owner, attribute) or [])
+            bindings.extend(name for name in _get_handlers(owner, "_bindings") or []
+                            if name not in FRAMEWORK_BINDINGS)
+        return ContextResidue(
+            cookies=len(self._context.cookies()),
+            storage_origins=storage_origins,
+            extra_pages=max(0, len(pages) - 1),
+            page_url=pages[0].url if pages else BLANK_PAGE_URL,
+            uncleared_origins=list(self._uncleared_origins),
+            service_workers=len(self._context.service_workers),
+            routes=routes,
+            bindings=bindings,
+        )
+
+    def reset(self) -> Page:
+        """
+        Bring the context back to a clean state.
+
+        :return: The page kept open for the next test.
+        """
+        pages = self._context.pages
+        page = pages[0] if pages else self._context.new_page()
+        for extra_page in pages[1:]:
+            extra_page.close()
+
+        DialogHandler(page).remove_dialog_handlers()
+        DialogJournal.for_context(self._context).clear()
+        self._context.unroute_all(behavior="ignoreErrors")
+        page.unroute_all(behavior="ignoreErrors")
+        self._context.set_extra_http_headers({})
+        self._context.clear_cookies()
+        self._context.clear_permissions()
+        self._context.set_offline(False)
+        self._context.set_default_timeout(WaitTimeoutsMs.WAIT_PAGE_LOAD)
+        page.set_default_timeout(WaitTimeoutsMs.WAIT_PAGE_LOAD)
+        page.set_viewport_size(DEFAULT_VIEWPORT_SIZE)
+
+        self._clear_origins_storage(page)
+        page.goto(BLANK_PAGE_URL)
+        return page
+
+    def verify(self) -> ContextResidue:
+        """
+        Check that the context really is clean after `reset`.
+
+        :return: Remaining residue; `is_clean()` is True if the context can be reused.
+        """
+        residue = self.inspect()
+        if not residue.is_clean():
+            logger.warning(f"Browser context is not clean after reset: {residue}")
+        return residue
+
+    def _clear_origins_storage(self, page: Page) -> None:
+        """
+        Clear storage of every visited origin. Storage is only reachable from a document of the same origin,
+        so each origin is visited through a stub page served by a route, without touching the network.
+        Origins whose storage is left after clearing are kept for `verify`.
+        """
+        self._uncleared_origins = []
+        if not self._origins:
+            return
+
+        def serve_reset_page(route: Route) -> None:
+            route.fulfill(status=200, content_type="text/html", body=RESET_PAGE_HTML)
+
+        page.route(f"**{RESET_PAGE_PATH}", serve_reset_page)
+        try:
+            for origin in sorted(self._origins):
+                try:
+                    page.goto(f"{origin}{RESET_PAGE_PATH}")
+                    left = page.evaluate(CLEAR_ORIGIN_STORAGE_JS)
+                except Exception as e:
+                    logger.warning(f"Failed to clear storage of origin '{origin}': {e}")
+                    left = ["not cleared"]
+                if left:
+                    self._uncleared_origins.append(f"{origin} ({', '.join(left)})")
+        finally:
+            page.unroute(f"**{RESET_PAGE_PATH}", serve_reset_page)
+        self._origins.clear()
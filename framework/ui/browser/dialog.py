@@ -1,79 +1,249 @@
 import logging
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
+from typing import Any, Callable, Iterator, List, Optional
 
-from playwright.sync_api import Page, Dialog as PlaywrightDialog
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Page, Dialog as PlaywrightDialog
 
-from framework.ui.constants.page_events import PageEvent
+from framework.ui.constants.page_events import ContextEvent, PageEvent
 from framework.ui.constants.timeouts import WaitTimeoutsMs
 
 logger = logging.getLogger(__name__)
 
+# Dialog listeners registered through DialogHandler, per page, so they can be removed later
+_registered_handlers: 'weakref.WeakKeyDictionary[Page, List[Callable]]' = weakref.WeakKeyDictionary()
+
+
+# Dialog journals, one per browser context
+_journals: 'weakref.WeakKeyDictionary[BrowserContext, DialogJournal]' = weakref.WeakKeyDictionary()
+
+
+def _count_dialog_listeners(emitter: Any) -> Optional[int]:
+    """
+    Count the dialog listeners of a page or context, including `on`, `once` and `expect_event` waiters.
+
+    The sync API does not expose listeners, they are read from its implementation object.
+
+    :return: The number of listeners, None if the Playwright internals are not as expected.
+    """
+    try:
+        return len(emitter._impl_obj.listeners(PageEvent.DIALOG.value))
+    except AttributeError:
+        return None
+
 
 class DialogType(Enum):
     ALERT = "alert"
+    BEFORE_UNLOAD = "beforeunload"
     CONFIRM = "confirm"
     PROMPT = "prompt"
 
 
+class DialogAction(Enum):
+    """How a dialog was handled."""
+    ACCEPTED = "accepted"
+    DISMISSED = "dismissed"
+    AUTO_ACCEPTED = "auto-accepted"
+    AUTO_DISMISSED = "auto-dismissed"
+
+
+@dataclass
+class DialogRecord:
+    """A dialog shown in a browser context."""
+    sequence: int
+    type: str
+    message: str
+    page: Optional[Page]
+    time: float
+    action: Optional[DialogAction] = None
+
+    def __str__(self) -> str:
+        action = self.action.value if self.action else "not handled"
+        return f"#{self.sequence} {self.type} '{self.message}' ({action})"
+
+
+class DialogJournal:
+    """
+    Journal of every dialog shown in a browser context, recorded by an always-on context listener.
+
+    Answers "was a dialog shown since X" without waiting. Positions in the journal (see `mark`) are used
+    as the "since" points. The journal only records: dialogs are left to the other listeners of the page
+    and context (`page.on`, `page.once`, `expect_event`, `DialogHandler` handlers). Only when there is none,
+    which would leave the dialog open since Playwright does not handle dialogs that have a listener,
+    the journal handles it like Playwright does by default: dismissed ('beforeunload' is accepted).
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._records: List[DialogRecord] = []
+        self._by_dialog: 'weakref.WeakKeyDictionary[PlaywrightDialog, DialogRecord]' = weakref.WeakKeyDictionary()
+        self._checked: 'weakref.WeakKeyDictionary[Page, int]' = weakref.WeakKeyDictionary()
+        # `DialogHandler.wait_for_dialog` waits per page, these waiters do not handle dialogs
+        self._waiters: 'weakref.WeakKeyDictionary[Page, int]' = weakref.WeakKeyDictionary()
+        self._context = context
+        context.on(ContextEvent.DIALOG.value, self._on_dialog)
+
+    @classmethod
+    def for_context(cls, context: BrowserContext) -> 'DialogJournal':
+        """Return the journal of the context, attaching it on first use."""
+        journal = _journals.get(context)
+        if journal is None:
+            journal = _journals[context] = cls(context)
+        return journal
+
+    @classmethod
+    def record_action(cls, dialog: PlaywrightDialog, action: DialogAction) -> None:
+        """Record how a dialog was handled, in the journal of its context (if any)."""
+        page = dialog.page
+        journal = _journals.get(page.context) if page else None
+        record = journal._by_dialog.get(dialog) if journal else None
+        if record:
+            record.action = action
+
+    @property
+    def records(self) -> List[DialogRecord]:
+        return list(self._records)
+
+    def mark(self) -> int:
+        """Return the current position in the journal, to check for dialogs shown after it."""
+        return len(self._records)
+
+    def since(self, mark: int = 0, page: Optional[Page] = None) -> List[DialogRecord]:
+        """
+        Return the dialogs shown after the mark.
+
+        :param mark: A position returned by `mark`.
+        :param page: If set, only dialogs shown on this page.
+        :return: The dialog records, oldest first.
+        """
+        return [record for record in self._records[mark:] if page is None or record.page == page]
+
+    def get_checked_mark(self, page: Page) -> int:
+        """Return the position up to which the dialogs of the page were already checked."""
+        return self._checked.get(page, 0)
+
+    def set_checked_mark(self, page: Page, mark: int) -> None:
+        self._checked[page] = mark
+
+    @contextmanager
+    def waiting(self, page: Page) -> Iterator[None]:
+        """Mark a dialog wait on the page, whose event listener does not count as handling dialogs."""
+        self._waiters[page] = self._waiters.get(page, 0) + 1
+        try:
+            yield
+        finally:
+            self._waiters[page] -= 1
+
+    def clear(self) -> None:
+        """Forget all recorded dialogs, e.g. when a context is reused by another test."""
+        self._records.clear()
+        self._checked.clear()
+
+    def _on_dialog(self, dialog: PlaywrightDialog) -> None:
+        record = DialogRecord(sequence=len(self._records), type=dialog.type, message=dialog.message,
+                              page=dialog.page, time=time.time())
+        self._records.append(record)
+        self._by_dialog[dialog] = record
+        logger.debug(f"Dialog shown: {record}")
+
+        if not self._has_other_listeners(dialog.page):
+            if dialog.type == DialogType.BEFORE_UNLOAD.value:
+                dialog.accept()
+                record.action = DialogAction.AUTO_ACCEPTED
+            else:
+                dialog.dismiss()
+                record.action = DialogAction.AUTO_DISMISSED
+
+    def _has_other_listeners(self, page: Optional[Page]) -> bool:
+        """Check if a listener other than the journal and dialog waits will see the dialog."""
+        context_listeners = _count_dialog_listeners(self._context)
+        page_listeners = _count_dialog_listeners(page) if page is not None else 0
+        if context_listeners is None or page_listeners is None:
+            # Unknown Playwright internals: only handlers registered through DialogHandler are known
+            return page is not None and bool(_registered_handlers.get(page))
+        waiters = self._waiters.get(page, 0) if page is not None else 0
+        return context_listeners - 1 + page_listeners - waiters > 0
+
+
 class DialogHandler:
     """Class to handle browser dialogs (alert, confirm, prompt)."""
 
     def __init__(self, page: Page):
         self._page = page
+        DialogJournal.for_context(page.context)
 
     @property
     def page(self) -> Page:
         return self._page
 
-    def _wait_for_dialog_state(self, timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD, should_be_open: bool = True) -> bool:
+    @property
+    def journal(self) -> DialogJournal:
+        return DialogJournal.for_context(self.page.context)
+
+    def was_dialog_shown(self, since: Optional[int] = None) -> bool:
         """
-        Wait for the dialog to be either open or closed.
+        Check instantly if a dialog was shown on the page.
 
-        :param timeout: Time to wait for the dialog event.
-        :param should_be_open: True to wait for the dialog to appear, False to confirm it's not shown.
-        :return: True if dialog is in expected state, False otherwise.
+        :param since: Journal position (see `DialogJournal.mark`). Defaults to the last dialog check on the page.
+        :return: True if a dialog was shown since then.
         """
-        logger.debug(f"Waiting for dialog to be '{'open' if should_be_open else 'closed'} (timeout: {timeout} ms)")
+        return bool(self._get_dialogs(since))
 
-        try:
-            self.page.wait_for_event(PageEvent.DIALOG.value, timeout=timeout)
-            message = (
-                "Browser dialog is open."
-                if should_be_open else
-                "Browser dialog appeared, but was expected to be closed."
-            )
-            logger.debug(message) if should_be_open else logger.warning(message)
-            return True if should_be_open else False
-
-        except TimeoutError:
-            message = (
-                "Dialog did not appear within timeout."
-                if should_be_open else
-                "Dialog did not appear — assumed closed."
-            )
-            logger.warning(message) if should_be_open else logger.debug(message)
-            return False if should_be_open else True
-
-    def is_dialog_opened(self, timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD) -> bool:
+    def wait_for_dialog(self, timeout: int = WaitTimeoutsMs.WAIT_DIALOG_APPEAR,
+                        since: Optional[int] = None) -> Optional[DialogRecord]:
+        """
+        Wait for a dialog shown on the page, returning at once if one was already shown.
+
+        :param timeout: Explicit deadline in milliseconds.
+        :param since: Journal position (see `DialogJournal.mark`). Defaults to the last dialog check on the page.
+        :return: The first dialog shown, or None if none was shown before the deadline.
         """
-        Check if a dialog is currently opened within the given timeout.
+        dialogs = self._get_dialogs(since)
+        if not dialogs and timeout > 0:
+            with self.journal.waiting(self.page):
+                try:
+                    self.page.wait_for_event(PageEvent.DIALOG.value, timeout=timeout)
+                except PlaywrightError:
+                    pass
+            dialogs = self._get_dialogs(since)
+
+        self.journal.set_checked_mark(self.page, self.journal.mark())
+        if dialogs:
+            logger.debug(f"Dialog shown: {dialogs[0]}")
+            return dialogs[0]
+        return None
+
+    def is_dialog_opened(self, timeout: int = WaitTimeoutsMs.WAIT_DIALOG_APPEAR) -> bool:
+        """
+        Check if a dialog was shown on the page since the last dialog check, waiting up to the timeout.
 
         :param timeout: Timeout to wait for the dialog.
-        :return: True if the dialog is open, False otherwise.
+        :return: True if a dialog was shown, False otherwise.
         """
         logger.debug(f'Check if dialog is opened within {timeout} ms')
-        return self._wait_for_dialog_state(timeout=timeout, should_be_open=True)
+        is_opened = self.wait_for_dialog(timeout) is not None
+        if not is_opened:
+            logger.warning("Dialog did not appear within timeout.")
+        return is_opened
 
-    def is_dialog_closed(self, timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD) -> bool:
+    def is_dialog_closed(self, timeout: int = WaitTimeoutsMs.WAIT_DIALOG_APPEAR) -> bool:
         """
-        Check if no dialog is open within the given timeout.
+        Check that no dialog was shown on the page since the last dialog check, nor within the timeout.
 
-        :param timeout: Timeout to confirm the dialog is closed.
-        :return: True if the dialog is not open, False otherwise.
+        :param timeout: Time to watch for a dialog: this check always waits it out when no dialog is shown.
+        :return: True if no dialog was shown, False otherwise.
         """
         logger.debug(f'Check if dialog is closed within {timeout} ms')
-        return self._wait_for_dialog_state(timeout=timeout, should_be_open=False)
+        is_closed = self.wait_for_dialog(timeout) is None
+        if not is_closed:
+            logger.warning("Browser dialog appeared, but was expected to be closed.")
+        return is_closed
+
+    def _get_dialogs(self, since: Optional[int]) -> List[DialogRecord]:
+        mark = self.journal.get_checked_mark(self.page) if since is None else since
+        return self.journal.since(mark, page=self.page)
 
     def register_dialog_handler(self, action_func: Callable[..., None], prompt_text: str = "") -> None:
         """
@@ -101,22 +271,33 @@ class DialogHandler:
                 action_func(dialog)
 
         self.page.on(PageEvent.DIALOG.value, dialog_handler)
+        _registered_handlers.setdefault(self.page, []).append(dialog_handler)
         logger.debug("Dialog handler registered")
 
+    def remove_dialog_handlers(self) -> None:
+        """Remove all dialog handlers registered on the page with `register_dialog_handler`."""
+        handlers = _registered_handlers.pop(self.page, [])
+        for handler in handlers:
+            self.page.remove_listener(PageEvent.DIALOG.value, handler)
+        logger.debug(f"Removed {len(handlers)} dialog handler(s)")
+
     @staticmethod
     def accept(dialog: PlaywrightDialog) -> None:
         dialog.accept()
+        DialogJournal.record_action(dialog, DialogAction.ACCEPTED)
         logger.info(f"Dialog accepted: {dialog.message}")
 
     @staticmethod
     def dismiss(dialog: PlaywrightDialog) -> None:
         dialog.dismiss()
+        DialogJournal.record_action(dialog, DialogAction.DISMISSED)
         logger.info(f"Dialog dismissed: {dialog.message}")
 
     @staticmethod
     def type_and_accept(dialog: PlaywrightDialog, text: str) -> None:
         if dialog.type == DialogType.PROMPT.value:
             dialog.accept(text)
+            DialogJournal.record_action(dialog, DialogAction.ACCEPTED)
             logger.info(f"Text entered in prompt: {text}")
         else:
             logger.warning("Text input is only valid for prompt dialogs.")
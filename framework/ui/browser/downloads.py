@@ -0,0 +1,259 @@
+import asyncio
+import hashlib
+import logging
+import pathlib
+import shutil
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Set, Union
+
+from playwright.sync_api import Download as PlaywrightDownload, Error as PlaywrightError, Page
+
+from framework.constants.timeouts import Timeouts
+from framework.execution.workers import get_worker_dir
+from framework.ui.constants.page_events import PageEvent
+
+logger = logging.getLogger(__name__)
+
+DOWNLOADS_DIRECTORY = pathlib.Path('downloads')
+CHUNK_SIZE_BYTES = 1024 * 1024
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+
+@dataclass
+class ExpectedFile:
+    """Expected size and/or hash of a downloaded file (hex digest, in the given `hashlib` algorithm)."""
+    size: Optional[int] = None
+    digest: Optional[str] = None
+    algorithm: str = DEFAULT_HASH_ALGORITHM
+
+
+@dataclass
+class DownloadedFile:
+    """A download saved and verified by `DownloadManager`."""
+    path: pathlib.Path
+    suggested_filename: str
+    url: str
+    size: int
+    digest: str
+    algorithm: str
+
+
+class DownloadManager:
+    """
+    Captures downloads triggered by an action and saves them to a per-worker directory.
+
+    Files are copied from the browser's download location in chunks while their size and hash are computed,
+    so multi-GB downloads are verified in one pass without being read into memory.
+    """
+
+    def __init__(self, page: Page, downloads_dir: Union[str, pathlib.Path] = DOWNLOADS_DIRECTORY):
+        self._page = page
+        self._dir = get_worker_dir(pathlib.Path(downloads_dir))
+        self._targets: Set[pathlib.Path] = set()
+
+    @property
+    def page(self) -> Page:
+        return self._page
+
+    @property
+    def downloads_dir(self) -> pathlib.Path:
+        return self._dir
+
+    @contextmanager
+    def expect_downloads(self, count: int = 1,
+                         timeout: float = Timeouts.WAIT_FILE_DOWNLOAD) -> Iterator[List[PlaywrightDownload]]:
+        """
+        Capture the downloads started inside the block, waiting on exit until `count` downloads have started.
+
+        **Usage**
+        with browser.downloads.expect_downloads(count=2) as downloads:
+            export_button.click()
+
+        :param count: Number of downloads expected.
+        :param timeout: Seconds to wait for the downloads to start.
+        :return: The list of started downloads, filled when the block exits.
+        """
+        downloads: List[PlaywrightDownload] = []
+
+        def on_download(download: PlaywrightDownload) -> None:
+            if download not in downloads:
+                downloads.append(download)
+
+        self.page.on(PageEvent.DOWNLOAD.value, on_download)
+        try:
+            yield downloads
+            deadline = time.monotonic() + timeout
+            while len(downloads) < count:
+                remaining_ms = (deadline - time.monotonic()) * 1000
+                if remaining_ms <= 0:
+                    raise TimeoutError(f"{len(downloads)} of {count} downloads started within {timeout} s")
+                on_download(self.page.wait_for_event(PageEvent.DOWNLOAD.value, timeout=remaining_ms))
+        finally:
+            self.page.remove_listener(PageEvent.DOWNLOAD.value, on_download)
+        logger.info(f"Downloads started: {[download.suggested_filename for download in downloads]}")
+
+    def download(self, action: Callable[[], None], count: int = 1, timeout: float = Timeouts.WAIT_FILE_DOWNLOAD,
+                 expected: Optional[Dict[str, ExpectedFile]] = None) -> List[DownloadedFile]:
+        """
+        Run an action that triggers downloads, then save and verify all of them within one shared deadline.
+
+        :param action: Function triggering the downloads, e.g. a click on an export button.
+        :param count: Number of downloads expected.
+        :param timeout: Seconds for all downloads to start and finish.
+        :param expected: Expected size/hash by suggested file name.
+        :return: The saved files, in the order the downloads started.
+        """
+        deadline = time.monotonic() + timeout
+        with self.expect_downloads(count, timeout) as downloads:
+            action()
+        return self.save_all(downloads, deadline=deadline, expected=expected)
+
+    def save_all(self, downloads: List[PlaywrightDownload], deadline: Optional[float] = None,
+                 expected: Optional[Dict[str, ExpectedFile]] = None) -> List[DownloadedFile]:
+        """
+        Save and verify downloads running in parallel in the browser, all within one deadline.
+
+        All downloads are waited for together, so the total time is that of the slowest one.
+        Downloads not finished when the deadline has passed are cancelled, then none is saved.
+
+        :param downloads: The downloads to save.
+        :param deadline: `time.monotonic()` value all downloads must finish by (WAIT_FILE_DOWNLOAD from now if None).
+        :param expected: Expected size/hash by suggested file name.
+        :return: The saved files, in the same order as the downloads.
+        """
+        deadline = deadline or time.monotonic() + Timeouts.WAIT_FILE_DOWNLOAD
+        expected = expected or {}
+        finished = self._wait_for_finish(downloads, deadline)
+        if finished is None:
+            logger.warning("Cannot wait for downloads with a deadline, waiting for each until it finishes")
+            finished = [time.monotonic() < deadline] * len(downloads)
+
+        pending = [download for download, is_finished in zip(downloads, finished) if not is_finished]
+        if pending:
+            for download in pending:
+                download.cancel()
+            raise TimeoutError(f"Download deadline passed, cancelled {len(pending)} of {len(downloads)} downloads: "
+                               f"{[download.suggested_filename for download in pending]}")
+        return [self._save(download, expected.get(download.suggested_filename)) for download in downloads]
+
+    @staticmethod
+    def _wait_for_finish(downloads: List[PlaywrightDownload], deadline: float) -> Optional[List[bool]]:
+        """
+        Wait for all downloads to finish, at most until the deadline.
+
+        `Download.path()` and `failure()` block without a timeout in the sync API, so the waits run together on
+        Playwright's event loop through its implementation objects (Playwright is pinned in requirements.txt).
+
+        :return: Whether each download finished, None if the Playwright internals are not as expected.
+        """
+        if not downloads:
+            return []
+        try:
+            impls = [download._impl_obj for download in downloads]
+            run = downloads[0]._sync
+        except AttributeError:
+            return None
+
+        async def wait_all() -> List[bool]:
+            # failure() resolves once the download finished, successfully or not, also for remote browsers
+            tasks = [asyncio.ensure_future(impl.failure()) for impl in impls]
+            done, not_done = await asyncio.wait(tasks, timeout=max(deadline - time.monotonic(), 0))
+            for task in not_done:
+                task.cancel()
+            return [task in done for task in tasks]
+
+        return run(wait_all())
+
+    def save(self, download: PlaywrightDownload, expected: Optional[ExpectedFile] = None,
+             timeout: float = Timeouts.WAIT_FILE_DOWNLOAD) -> DownloadedFile:
+        """
+        Wait for the download to finish, then copy it to the downloads directory, computing its size and hash
+        on the fly, and verify them.
+
+        :param download: The download to save.
+        :param expected: Expected size and/or hash.
+        :param timeout: Seconds to wait for the download to finish, it is cancelled after that.
+        :return: The saved file.
+        :raises TimeoutError: If the download did not finish in time.
+        :raises RuntimeError: If the download failed.
+        :raises AssertionError: If the size or hash does not match the expected ones.
+        """
+        finished = self._wait_for_finish([download], time.monotonic() + timeout)
+        if finished == [False]:
+            download.cancel()
+            raise TimeoutError(f"Download '{download.suggested_filename}' did not finish within {timeout} s, "
+                               f"cancelled")
+        return self._save(download, expected)
+
+    def _save(self, download: PlaywrightDownload, expected: Optional[ExpectedFile]) -> DownloadedFile:
+        expected = expected or ExpectedFile()
+        target = self._get_target(download.suggested_filename)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            source = download.path()
+        except PlaywrightError:
+            # Browsers connected remotely keep downloads on their side, only `save_as` can fetch them
+            download.save_as(target)
+            source = None
+
+        failure = download.failure()
+        if failure:
+            raise RuntimeError(f"Download '{download.suggested_filename}' failed: {failure}")
+
+        hasher = hashlib.new(expected.algorithm)
+        size = 0
+        if source is None:
+            for chunk in self._read_chunks(target):
+                hasher.update(chunk)
+                size += len(chunk)
+        else:
+            with open(target, "wb") as target_file:
+                for chunk in self._read_chunks(source):
+                    hasher.update(chunk)
+                    target_file.write(chunk)
+                    size += len(chunk)
+                    if expected.size is not None and size > expected.size:
+                        break
+
+        downloaded = DownloadedFile(path=target, suggested_filename=download.suggested_filename, url=download.url,
+                                    size=size, digest=hasher.hexdigest(), algorithm=expected.algorithm)
+        self._verify(downloaded, expected)
+        logger.info(f"Download saved: '{target}' ({size} bytes, {expected.algorithm}: {downloaded.digest})")
+        return downloaded
+
+    def _get_target(self, filename: str) -> pathlib.Path:
+        """
+        Return a path for the file in the downloads directory, numbered like browsers do if already saved
+        by this manager or found on disk (e.g. saved by another manager of the same worker).
+        """
+        target = self._dir / filename
+        number = 1
+        while target in self._targets or target.exists():
+            target = self._dir / f"{pathlib.Path(filename).stem} ({number}){pathlib.Path(filename).suffix}"
+            number += 1
+        self._targets.add(target)
+        return target
+
+    @staticmethod
+    def _read_chunks(path: Union[str, pathlib.Path]) -> Iterator[bytes]:
+        with open(path, "rb") as file:
+            while chunk := file.read(CHUNK_SIZE_BYTES):
+                yield chunk
+
+    @staticmethod
+    def _verify(downloaded: DownloadedFile, expected: ExpectedFile) -> None:
+        if expected.size is not None and downloaded.size != expected.size:
+            raise AssertionError(f"Download '{downloaded.suggested_filename}' size is "
+                                 f"{'over ' if downloaded.size > expected.size else ''}{downloaded.size} bytes, "
+                                 f"expected {expected.size}")
+        if expected.digest is not None and downloaded.digest != expected.digest.lower():
+            raise AssertionError(f"Download '{downloaded.suggested_filename}' {expected.algorithm} is "
+                                 f"{downloaded.digest}, expected {expected.digest}")
+
+    def clear(self) -> None:
+        """Remove all files saved in the downloads directory."""
+        shutil.rmtree(self._dir, ignore_errors=True)
+        self._targets.clear()
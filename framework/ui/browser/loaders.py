@@ -0,0 +1,251 @@
+import json
+import logging
+import time
+import weakref
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Page
+
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+
+logger = logging.getLogger(__name__)
+
+# CSS selectors of loaders (spinners, progress overlays) shared by all pages, see `register_loader_selectors`
+DEFAULT_LOADER_SELECTORS = ('[aria-busy="true"]', '.spinner', '.loader', '.loading')
+_loader_selectors: List[str] = list(DEFAULT_LOADER_SELECTORS)
+
+# Loader watchers, one per browser context
+_watchers: 'weakref.WeakKeyDictionary[BrowserContext, LoaderWatcher]' = weakref.WeakKeyDictionary()
+
+LOADER_BINDING_NAME = "__frameworkLoaderStateChanged"
+
+# Tracks whether an element matching any loader selector is shown in the top frame, reporting changes
+# through the binding. Called again with more selectors, it only adds them to the running observer.
+# Mutations only schedule a check, at most one per animation frame (or timer, as frames pause in hidden tabs).
+LOADER_OBSERVER_JS = f"""
+(selectors) => {{
+    if (window !== window.top) return;
+    if (window.__loaderWatcher) {{
+        window.__loaderWatcher.add(selectors);
+        return;
+    }}
+    const isShown = element => {{
+        if (!element.getClientRects().length) return false;
+        const style = getComputedStyle(element);
+        return style.visibility !== 'hidden' && style.opacity !== '0';
+    }};
+    const watcher = {{
+        selectors: [],
+        // Unknown until the first update, so every new document reports its state once
+        visible: null,
+        scheduled: false,
+        add(newSelectors) {{
+            for (const selector of newSelectors) {{
+                try {{
+                    document.createDocumentFragment().querySelector(selector);
+                }} catch (e) {{
+                    console.warn(`Ignoring invalid loader selector: ${{selector}}`);
+                    continue;
+                }}
+                if (!this.selectors.includes(selector)) this.selectors.push(selector);
+            }}
+            this.update();
+        }},
+        update() {{
+            const visible = this.selectors.length > 0
+                && Array.from(document.querySelectorAll(this.selectors.join(','))).some(isShown);
+            if (visible !== this.visible) {{
+                this.visible = visible;
+                window.{LOADER_BINDING_NAME}?.(visible);
+            }}
+        }},
+        schedule() {{
+            if (this.scheduled) return;
+            this.scheduled = true;
+            requestAnimationFrame(() => this.flush());
+            setTimeout(() => this.flush(), 100);
+        }},
+        // Runs the scheduled check now, e.g. when a wait reads the state
+        flush() {{
+            if (!this.scheduled) return;
+            this.scheduled = false;
+            this.update();
+        }},
+        isVisible() {{
+            this.flush();
+            return this.visible;
+        }},
+    }};
+    window.__loaderWatcher = watcher;
+    new MutationObserver(() => watcher.schedule()).observe(document, {{
+        subtree: true, childList: true, attributes: true,
+        attributeFilter: ['class', 'style', 'hidden', 'aria-busy', 'aria-hidden'],
+    }});
+    watcher.add(selectors);
+}}
+"""
+
+LOADER_HIDDEN_JS = "() => !window.__loaderWatcher || !window.__loaderWatcher.isVisible()"
+LOADER_VISIBLE_JS = "() => !!window.__loaderWatcher && window.__loaderWatcher.isVisible()"
+
+
+def register_loader_selectors(*selectors: str) -> None:
+    """
+    Add CSS selectors of loaders to watch in browser contexts created from now on.
+
+    Contexts already watched are updated through `LoaderWatcher.add_selectors`.
+
+    :param selectors: CSS selectors (Playwright-specific selectors such as `text=` are not supported).
+    """
+    for selector in selectors:
+        if selector not in _loader_selectors:
+            _loader_selectors.append(selector)
+
+
+def get_loader_selectors() -> List[str]:
+    return list(_loader_selectors)
+
+
+@dataclass
+class LoaderWaitStats:
+    """Time spent waiting for loaders, across all browser contexts."""
+    waits: int = 0
+    total_ms: float = 0
+
+    def add(self, duration_ms: float) -> None:
+        self.waits += 1
+        self.total_ms += duration_ms
+
+
+loader_wait_stats = LoaderWaitStats()
+
+
+class LoaderWatcher:
+    """
+    Watches the pages of a browser context for visible loaders.
+
+    An in-page MutationObserver reports loader visibility changes to Python, so checking whether a page
+    shows a loader is a dictionary lookup without a round trip. Actions wait for loaders to disappear only
+    when one was reported, instead of sleeping for loaders that usually are not there. The page checks for
+    loaders at most once per animation frame, however many mutations it sees. Changes made since the last
+    Playwright call (or within the current frame) are not known yet; Playwright's own actionability checks
+    cover that gap.
+    """
+
+    def __init__(self, context: BrowserContext, selectors: Sequence[str] = ()):
+        self._context = context
+        self._visible: 'weakref.WeakKeyDictionary[Page, bool]' = weakref.WeakKeyDictionary()
+        selectors = list(selectors) or get_loader_selectors()
+
+        context.expose_binding(LOADER_BINDING_NAME, self._on_state_changed)
+        context.add_init_script(script=f"({LOADER_OBSERVER_JS})({json.dumps(selectors)})")
+        # Init scripts only run on new documents, pages opened before need the observer too
+        for page in context.pages:
+            self._install(page, selectors)
+
+    @classmethod
+    def for_context(cls, context: BrowserContext) -> 'LoaderWatcher':
+        """Return the watcher of the context, creating it on first use."""
+        watcher = _watchers.get(context)
+        if watcher is None:
+            watcher = _watchers[context] = cls(context)
+        return watcher
+
+    @classmethod
+    def get(cls, page: Page) -> Optional['LoaderWatcher']:
+        """Return the watcher of the page's context, None if the context is not watched."""
+        return _watchers.get(page.context)
+
+    def add_selectors(self, *selectors: str) -> None:
+        """Add loader selectors to the pages of this context."""
+        self._context.add_init_script(script=f"({LOADER_OBSERVER_JS})({json.dumps(selectors)})")
+        for page in self._context.pages:
+            self._install(page, selectors)
+
+    def is_loader_visible(self, page: Page) -> bool:
+        """Return whether the page reported a visible loader. No round trip to the browser."""
+        return self._visible.get(page, False)
+
+    def wait_for_loaders_to_hide(self, page: Page, timeout: int = WaitTimeoutsMs.WAIT_LOADER_DISAPPEAR,
+                                 no_throw: bool = False) -> bool:
+        """
+        Wait for the loaders of a page to disappear, only if the page reported a visible loader.
+
+        :param page: The page to check.
+        :param timeout: Maximum time to wait in milliseconds.
+        :param no_throw: If True, log a warning instead of raising on timeout.
+        :return: True if no loader is visible.
+        """
+        if not self.is_loader_visible(page):
+            return True
+        return self._wait(page, LOADER_HIDDEN_JS, timeout, no_throw, "disappear")
+
+    def wait_for_loader(self, page: Page, appear_timeout: int = WaitTimeoutsMs.WAIT_LOADER_APPEAR,
+                        disappear_timeout: int = WaitTimeoutsMs.WAIT_LOADER_DISAPPEAR,
+                        no_throw: bool = False) -> bool:
+        """
+        Wait for a loader triggered by a previous action: wait for it to appear, then to disappear.
+
+        Use instead of a fixed sleep after actions that may start loading. If no loader appears within
+        `appear_timeout`, it returns without waiting further.
+
+        :param page: The page to check.
+        :param appear_timeout: Maximum time to wait for a loader to appear in milliseconds.
+        :param disappear_timeout: Maximum time to wait for the loaders to disappear in milliseconds.
+        :param no_throw: If True, log a warning instead of raising when the loaders do not disappear.
+        :return: True if no loader is visible.
+        """
+        if not self.is_loader_visible(page):
+            start = time.monotonic()
+            try:
+                page.wait_for_function(LOADER_VISIBLE_JS, timeout=appear_timeout)
+            except PlaywrightError:
+                logger.debug(f"No loader appeared within {appear_timeout} ms")
+                return True
+            finally:
+                loader_wait_stats.add((time.monotonic() - start) * 1000)
+        return self._wait(page, LOADER_HIDDEN_JS, disappear_timeout, no_throw, "disappear")
+
+    def _wait(self, page: Page, condition_js: str, timeout: int, no_throw: bool, expected: str) -> bool:
+        logger.debug(f"Waiting for loaders to {expected} (timeout: {timeout} ms)")
+        start = time.monotonic()
+        try:
+            page.wait_for_function(condition_js, timeout=timeout)
+            return True
+        except PlaywrightError as e:
+            message = f"Loaders did not {expected} within {timeout} ms"
+            if no_throw:
+                logger.warning(message)
+                return False
+            raise TimeoutError(message) from e
+        finally:
+            duration_ms = (time.monotonic() - start) * 1000
+            loader_wait_stats.add(duration_ms)
+            logger.debug(f"Waited {duration_ms:.0f} ms for loaders to {expected}")
+
+    def _on_state_changed(self, source: dict, visible: bool) -> None:
+        page = source.get("page")
+        if page is not None:
+            self._visible[page] = visible
+
+    @staticmethod
+    def _install(page: Page, selectors: Sequence[str]) -> None:
+        try:
+            page.evaluate(LOADER_OBSERVER_JS, list(selectors))
+        except PlaywrightError as e:
+            logger.debug(f"Loader observer not installed on '{page.url}': {e}")
+
+
+def wait_for_loaders_to_hide(page: Optional[Page]) -> None:
+    """
+    Wait for the loaders of a page to disappear before an action, if its context is watched and reported one.
+
+    Costs two dictionary lookups when no loader is visible. A loader still visible after
+    `WAIT_LOADER_DISAPPEAR` is logged, the action then proceeds and fails or succeeds on its own.
+    """
+    if page is None:
+        return
+    watcher = _watchers.get(page.context)
+    if watcher is not None:
+        watcher.wait_for_loaders_to_hide(page, no_throw=True)
@@ -0,0 +1,223 @@
+import fnmatch
+import logging
+import re
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Pattern, Tuple, Union
+
+from playwright.sync_api import BrowserContext, Page, Request
+
+from framework.ui.constants.page_events import ContextEvent, PageEvent
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+
+logger = logging.getLogger(__name__)
+
+UrlPattern = Union[str, Pattern[str]]
+
+# Requests that stay open by design and never let the network become quiet
+DEFAULT_IGNORED_RESOURCE_TYPES = ("eventsource", "websocket")
+# Navigations kept per page for their request statistics
+NAVIGATION_HISTORY_SIZE = 20
+
+# Network monitors, one per browser context
+_monitors: 'weakref.WeakKeyDictionary[BrowserContext, NetworkMonitor]' = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class NavigationStats:
+    """Requests started by a page between one main-frame navigation and the next."""
+    url: str
+    started: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    finished: int = 0
+    failed: int = 0
+    ignored: int = 0
+    durations_ms: List[Tuple[float, str]] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(duration for duration, _ in self.durations_ms)
+
+    @property
+    def max_ms(self) -> float:
+        return max((duration for duration, _ in self.durations_ms), default=0)
+
+    def slowest(self, count: int = 5) -> List[Tuple[float, str]]:
+        """Return the (duration in ms, URL) of the slowest completed requests."""
+        return sorted(self.durations_ms, reverse=True)[:count]
+
+    def __str__(self) -> str:
+        return (f"'{self.url}': {self.requests} requests ({self.failed} failed, {self.ignored} ignored), "
+                f"slowest {self.max_ms:.0f} ms")
+
+
+class NetworkMonitor:
+    """
+    Tracks the requests of every page of a browser context, with URL patterns shared by all its pages.
+
+    Requests matching an ignored pattern or resource type (long polling, event streams, analytics beacons)
+    are not counted as in flight, so they never hold up a network-quiet wait.
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._ignored_patterns: List[UrlPattern] = []
+        self.ignored_resource_types = set(DEFAULT_IGNORED_RESOURCE_TYPES)
+        self._trackers: 'weakref.WeakKeyDictionary[Page, PageNetworkTracker]' = weakref.WeakKeyDictionary()
+
+        for page in context.pages:
+            self.get_tracker(page)
+        context.on(ContextEvent.PAGE.value, self.get_tracker)
+
+    @classmethod
+    def for_context(cls, context: BrowserContext) -> 'NetworkMonitor':
+        """Return the monitor of the context, attaching it on first use."""
+        monitor = _monitors.get(context)
+        if monitor is None:
+            monitor = _monitors[context] = cls(context)
+        return monitor
+
+    def get_tracker(self, page: Page) -> 'PageNetworkTracker':
+        """Return the request tracker of a page, attaching it on first use."""
+        tracker = self._trackers.get(page)
+        if tracker is None:
+            tracker = self._trackers[page] = PageNetworkTracker(page, self)
+        return tracker
+
+    @property
+    def ignored_patterns(self) -> List[UrlPattern]:
+        return list(self._ignored_patterns)
+
+    def ignore_urls(self, *patterns: UrlPattern) -> None:
+        """
+        Stop counting requests to matching URLs as in flight, on all pages of the context.
+
+        :param patterns: Glob patterns (e.g. '**/poll?*', like Playwright routes) or compiled regular expressions.
+        """
+        self._ignored_patterns.extend(patterns)
+
+    def is_ignored(self, request: Request) -> bool:
+        if request.resource_type in self.ignored_resource_types:
+            return True
+        url = request.url
+        return any(pattern.search(url) if isinstance(pattern, re.Pattern) else fnmatch.fnmatchcase(url, pattern)
+                   for pattern in self._ignored_patterns)
+
+
+class PageNetworkTracker:
+    """
+    Counts the in-flight requests of a page from its request, requestfinished and requestfailed events.
+
+    Unlike Playwright's `networkidle` (no requests for a fixed 500 ms, long polls included), the quiet
+    period and the number of tolerated requests are chosen per wait, and the wait ends as soon as the
+    network has stayed quiet for that period.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, page: Page, monitor: NetworkMonitor):
+        self._page = page
+        self._monitor = monitor
+        self._inflight: Dict[Request, Tuple[float, NavigationStats]] = {}
+        self._navigations: Deque[NavigationStats] = deque([NavigationStats(page.url)], maxlen=NAVIGATION_HISTORY_SIZE)
+        self._last_finished = time.monotonic()
+        # Highest in-flight count since the last reset, to detect bursts between two checks of a wait
+        self._peak = 0
+
+        page.on(PageEvent.REQUEST.value, self._on_request)
+        page.on(PageEvent.REQUEST_FINISHED.value, lambda request: self._on_request_done(request, failed=False))
+        page.on(PageEvent.REQUEST_FAILED.value, lambda request: self._on_request_done(request, failed=True))
+        page.on(PageEvent.CLOSE.value, lambda _: self._inflight.clear())
+
+    @property
+    def inflight(self) -> int:
+        """Number of requests started and not yet finished or failed, ignored ones excluded."""
+        return len(self._inflight)
+
+    @property
+    def inflight_urls(self) -> List[str]:
+        return [request.url for request in self._inflight]
+
+    @property
+    def navigations(self) -> List[NavigationStats]:
+        """Request statistics of the last navigations, oldest first."""
+        return list(self._navigations)
+
+    @property
+    def current_navigation(self) -> NavigationStats:
+        return self._navigations[-1]
+
+    def wait_for_network_quiet(self, max_inflight: int = 0, quiet_ms: int = 500,
+                               timeout: int = WaitTimeoutsMs.WAIT_PAGE_LOAD, no_throw: bool = False) -> bool:
+        """
+        Wait until at most `max_inflight` requests have been in flight for `quiet_ms` without interruption.
+
+        :param max_inflight: Number of in-flight requests still considered quiet.
+        :param quiet_ms: How long the network must stay quiet in milliseconds.
+        :param timeout: Maximum time to wait in milliseconds.
+        :param no_throw: If True, log a warning instead of raising on timeout.
+        :return: True if the network became quiet in time.
+        """
+        logger.debug(f"Waiting for at most {max_inflight} requests in flight for {quiet_ms} ms "
+                     f"(in flight: {self.inflight}, timeout: {timeout} ms)")
+        start = time.monotonic()
+        deadline = start + timeout / 1000
+        # The count only drops on a finished request, so it has been at most `max_inflight` since the last one
+        quiet_since = self._last_finished if self.inflight <= max_inflight else None
+        while True:
+            now = time.monotonic()
+            if quiet_since is not None and (now - quiet_since) * 1000 >= quiet_ms:
+                logger.debug(f"Network quiet after {(now - start) * 1000:.0f} ms")
+                return True
+            if now >= deadline:
+                break
+
+            # Sleep exactly until the quiet period would end, events received meanwhile are checked after it
+            remaining_ms = quiet_ms - (now - quiet_since) * 1000 if quiet_since is not None else self.POLL_INTERVAL_MS
+            self._peak = self.inflight
+            self._page.wait_for_timeout(max(1, min(remaining_ms, (deadline - now) * 1000)))
+
+            if self.inflight > max_inflight:
+                quiet_since = None
+            elif self._peak > max_inflight or quiet_since is None:
+                # Quiet again since the request that brought the count back down finished
+                quiet_since = self._last_finished
+
+        message = f"Network not quiet after {timeout} ms, {self.inflight} requests in flight: {self.inflight_urls[:5]}"
+        if no_throw:
+            logger.warning(message)
+            return False
+        raise TimeoutError(message)
+
+    def _on_request(self, request: Request) -> None:
+        if request.is_navigation_request() and request.frame == self._page.main_frame \
+                and request.redirected_from is None:
+            self._navigations.append(NavigationStats(request.url))
+
+        navigation = self.current_navigation
+        navigation.requests += 1
+        if self._monitor.is_ignored(request):
+            navigation.ignored += 1
+            return
+        self._inflight[request] = (time.monotonic(), navigation)
+        self._peak = max(self._peak, len(self._inflight))
+
+    def _on_request_done(self, request: Request, failed: bool) -> None:
+        started = self._inflight.pop(request, None)
+        if started is None:
+            return
+        start_time, navigation = started
+        self._last_finished = time.monotonic()
+        if failed:
+            navigation.failed += 1
+        else:
+            navigation.finished += 1
+            navigation.durations_ms.append((self._get_duration_ms(request, start_time), request.url))
+
+    def _get_duration_ms(self, request: Request, start_time: float) -> float:
+        # Browser-side timing, without the delay of the events reaching Python, when the browser provides it
+        timing = request.timing
+        if timing.get("responseEnd", -1) >= 0:
+            return timing["responseEnd"]
+        return (self._last_finished - start_time) * 1000
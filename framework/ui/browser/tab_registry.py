@@ -0,0 +1,150 @@
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from playwright.sync_api import BrowserContext, Frame, Page
+
+from framework.ui.constants.page_events import ContextEvent, PageEvent
+
+logger = logging.getLogger(__name__)
+
+# One registry per browser context, shared by every Browser/WindowManager working with that context
+_registries: 'weakref.WeakKeyDictionary[BrowserContext, TabRegistry]' = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class TabInfo:
+    """Last known state of a browser tab."""
+    page: Page
+    title: str
+    url: str
+    opener: Optional[Page]
+
+
+class TabRegistry:
+    """
+    Registry of the open tabs of a browser context, kept up to date from context and page events.
+
+    Tabs are indexed by title, URL and opener, so finding a tab does not need a round trip per open tab.
+    Titles are read once per page load; title changes made by scripts without a load are picked up
+    by `refresh_titles`.
+    """
+
+    def __init__(self, context: BrowserContext):
+        self._context = context
+        self._tabs: Dict[Page, TabInfo] = {}
+        self._by_title: Dict[str, List[Page]] = {}
+        self._by_url: Dict[str, List[Page]] = {}
+        self._by_opener: Dict[Page, List[Page]] = {}
+
+        for page in context.pages:
+            self._add_page(page)
+        context.on(ContextEvent.PAGE.value, self._add_page)
+
+    @classmethod
+    def for_context(cls, context: BrowserContext) -> 'TabRegistry':
+        """Return the registry of the context, creating it on first use."""
+        registry = _registries.get(context)
+        if registry is None:
+            registry = _registries[context] = cls(context)
+        return registry
+
+    @property
+    def pages(self) -> List[Page]:
+        """Open tabs in the order they were opened."""
+        return list(self._tabs)
+
+    def get_info(self, page: Page) -> Optional[TabInfo]:
+        return self._tabs.get(page)
+
+    def find_by_title(self, title: str) -> Optional[Page]:
+        """Return the most recently opened tab with exactly this title."""
+        pages = self._by_title.get(title)
+        return pages[-1] if pages else None
+
+    def find_by_url(self, url: str) -> Optional[Page]:
+        """Return the most recently opened tab with exactly this URL."""
+        pages = self._by_url.get(url)
+        return pages[-1] if pages else None
+
+    def find_by_opener(self, opener: Page) -> List[Page]:
+        """Return the open tabs (popups) opened by the given tab, in the order they were opened."""
+        return list(self._by_opener.get(opener, []))
+
+    def find(self, name: str) -> Optional[Page]:
+        """
+        Find a tab by exact title or URL, falling back to the tabs whose title or URL contains `name`.
+
+        :param name: Title, URL or part of either.
+        :return: The most recently opened matching tab, or None.
+        """
+        page = self.find_by_title(name) or self.find_by_url(name)
+        if page:
+            return page
+        matches = [tab.page for tab in self._tabs.values() if name in tab.title or name in tab.url]
+        return matches[-1] if matches else None
+
+    def refresh_titles(self) -> None:
+        """Re-read the titles of all tabs, e.g. after a single-page app changed `document.title`."""
+        for page in self.pages:
+            self._update_title(page)
+
+    def _add_page(self, page: Page) -> None:
+        if page in self._tabs:
+            return
+        tab = TabInfo(page=page, title="", url=page.url, opener=page.opener())
+        self._tabs[page] = tab
+        self._index(self._by_url, tab.url, page)
+        if tab.opener:
+            self._index(self._by_opener, tab.opener, page)
+        self._update_title(page)
+
+        page.on(PageEvent.FRAME_NAVIGATED.value, lambda frame: self._on_navigated(page, frame))
+        page.on(PageEvent.DOM_CONTENT_LOADED.value, lambda _: self._update_title(page))
+        page.on(PageEvent.CLOSE.value, self._remove_page)
+        logger.debug(f"New tab registered: '{tab.url}' (total tabs: {len(self._tabs)})")
+
+    def _on_navigated(self, page: Page, frame: Frame) -> None:
+        tab = self._tabs.get(page)
+        if tab is None or frame != page.main_frame:
+            return
+        self._unindex(self._by_url, tab.url, page)
+        tab.url = frame.url
+        self._index(self._by_url, tab.url, page)
+
+    def _update_title(self, page: Page) -> None:
+        tab = self._tabs.get(page)
+        if tab is None:
+            return
+        try:
+            title = page.title()
+        except Exception as e:
+            logger.debug(f"Failed to read title of tab '{tab.url}': {e}")
+            return
+        self._unindex(self._by_title, tab.title, page)
+        tab.title = title
+        self._index(self._by_title, tab.title, page)
+
+    def _remove_page(self, page: Page) -> None:
+        tab = self._tabs.pop(page, None)
+        if tab is None:
+            return
+        self._unindex(self._by_title, tab.title, page)
+        self._unindex(self._by_url, tab.url, page)
+        if tab.opener:
+            self._unindex(self._by_opener, tab.opener, page)
+        self._by_opener.pop(page, None)
+        logger.debug(f"Tab closed: '{tab.url}' (total tabs: {len(self._tabs)})")
+
+    @staticmethod
+    def _index(index: Dict[Any, List[Page]], key: Any, page: Page) -> None:
+        index.setdefault(key, []).append(page)
+
+    @staticmethod
+    def _unindex(index: Dict[Any, List[Page]], key: Any, page: Page) -> None:
+        pages = index.get(key, [])
+        if page in pages:
+            pages.remove(page)
+        if not pages:
+            index.pop(key, None)
@@ -4,6 +4,7 @@ from typing import Optional, Dict
 from playwright.sync_api import Page
 
 from configs.settings import DEFAULT_VIEWPORT_SIZE
+from framework.ui.browser.tab_registry import TabRegistry
 from framework.ui.decorators.decorators import step
 
 logger = logging.getLogger(__name__)
@@ -12,13 +13,18 @@ logger = logging.getLogger(__name__)
 class WindowManager:
     """Class for browser window operations such as resizing, switching tabs, navigation, etc."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, tabs: Optional[TabRegistry] = None):
         self._page = page
+        self._tabs = tabs or TabRegistry.for_context(page.context)
 
     @property
     def page(self) -> Page:
         return self._page
 
+    @property
+    def tabs(self) -> TabRegistry:
+        return self._tabs
+
     @page.setter
     def page(self, new_page: Page) -> None:
         logger.info(f"Switch active page context")
@@ -26,8 +32,16 @@ class WindowManager:
 
     @step("Close current window")
     def close_current_window(self) -> None:
-        """Close the currently active window (tab)."""
-        self.page.close()
+        """Close the currently active window (tab) and switch to its opener or the last remaining tab."""
+        closed_page = self.page
+        tab = self.tabs.get_info(closed_page)
+        closed_page.close()
+
+        remaining_pages = [page for page in self.tabs.pages if page != closed_page and not page.is_closed()]
+        if tab and tab.opener in remaining_pages:
+            self.page = tab.opener
+        elif remaining_pages:
+            self.page = remaining_pages[-1]
 
     @step("Navigate to previous page")
     def back(self) -> None:
@@ -39,37 +53,48 @@ class WindowManager:
         """Navigate to the next page in history."""
         self.page.go_forward()
 
-    @step("Refresh current page")
+    @step("Refresh current page", idempotent=True)
     def refresh(self) -> None:
         """Reload the current page."""
         self.page.reload()
 
-    @step("Resize browser window")
+    @step("Resize browser window", idempotent=True)
     def resize(self, size_option: Optional[Dict[str, int]] = None) -> None:
         """Resize browser window to specified dimensions or default size."""
         size = size_option or DEFAULT_VIEWPORT_SIZE
         logger.debug(f"Set browser window size to: {size}")
         self.page.set_viewport_size(size)
 
-    @step("Switch to window by name")
+    @step("Switch to window by name", idempotent=True)
     def switch_to_window(self, name: str) -> None:
         """Switch to a window (tab) by title or URL containing the specified name."""
         logger.debug(f"Switch to window with name containing: '{name}'")
-        for page in self.page.context.pages:
-            if name in page.title() or name in page.url:
-                self.page = page
-                return
-        raise ValueError(f"No window found with title or URL containing: {name}")
-
-    @step("Switch to last window")
+        page = self.tabs.find(name)
+        if page is None:
+            # Titles changed by scripts without a page load are only known after re-reading them
+            self.tabs.refresh_titles()
+            page = self.tabs.find(name)
+        if page is None:
+            raise ValueError(f"No window found with title or URL containing: {name}")
+        self.page = page
+
+    @step("Switch to window opened by the current window", idempotent=True)
+    def switch_to_child_window(self) -> None:
+        """Switch to the most recently opened window (tab) whose opener is the current window."""
+        children = self.tabs.find_by_opener(self.page)
+        if not children:
+            raise ValueError("No window opened by the current window")
+        self.page = children[-1]
+
+    @step("Switch to last window", idempotent=True)
     def switch_to_last_window(self) -> None:
         """Switch to the most recently opened window (tab)."""
-        pages = self.page.context.pages
+        pages = self.tabs.pages
         logger.debug(f"Total windows count: {len(pages)})")
         self.page = pages[-1]
 
-    @step("Switch to first window")
+    @step("Switch to first window", idempotent=True)
     def switch_to_first_window(self) -> None:
         """Switch to the first opened window (tab)."""
-        pages = self.page.context.pages
+        pages = self.tabs.pages
         self.page = pages[0]
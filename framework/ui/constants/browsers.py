@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class BrowserType(Enum):
+    """Browser engines supported by the framework."""
+    CHROMIUM = "chromium"
+    FIREFOX = "firefox"
+    WEBKIT = "webkit"
@@ -17,8 +17,10 @@ class ElementType(Enum):
     """Types of elements for use in tests."""
     BUTTON = "Button"
     CHECKBOX = "Checkbox"
+    CHECKBOX_GROUP = "Checkbox Group"
     DROPDOWN = "Dropdown"
     ELEMENT = "Element"
+    ELEMENT_LIST = "Element List"
     FILE_UPLOADER = "File Uploader"
     IFRAME = "iFrame"
     INPUT = "Input"
@@ -5,5 +5,18 @@ class PageEvent(Enum):
     """Enum for different page events."""
     CLOSE = "close"
     DIALOG = "dialog"
+    DOM_CONTENT_LOADED = "domcontentloaded"
+    DOWNLOAD = "download"
+    FRAME_NAVIGATED = "framenavigated"
     LOAD = "load"
     NAVIGATE = "navigate"
+    REQUEST = "request"
+    REQUEST_FAILED = "requestfailed"
+    REQUEST_FINISHED = "requestfinished"
+
+
+class ContextEvent(Enum):
+    """Enum for different browser context events."""
+    CLOSE = "close"
+    DIALOG = "dialog"
+    PAGE = "page"
@@ -3,6 +3,7 @@ class WaitTimeoutsMs:
     """Class to define various timeout constants used in the framework in milliseconds."""
     DEFAULT_DELAY = 2000
     EXPLICIT_WAIT = 10000
+    WAIT_DIALOG_APPEAR = 1000
     WAIT_LOADER_APPEAR = 1000
     WAIT_LOADER_DISAPPEAR = 10000
     WAIT_PAGE_LOAD = 30000
@@ -1,11 +1,23 @@
 import inspect
 import logging
 from functools import wraps
+from typing import Optional
+
+from framework.execution.impact import impact_recorder
+from framework.execution.retries import RetryPolicy, retry_engine
+from framework.ui.browser.loaders import wait_for_loaders_to_hide
 
 logger = logging.getLogger(__name__)
 
 
-def action(message: str = None):
+def action(message: str = None, idempotent: bool = False, retry: Optional[RetryPolicy] = None):
+    """
+    Log an element action, wait for visible loaders of its page and retry it on failures matching a retry policy.
+
+    :param message: Action description, formatted with the arguments and `element`.
+    :param idempotent: Whether the action can be repeated after it took (partial) effect.
+    :param retry: Retry policy of this action, instead of the policies registered in `retry_engine`.
+    """
     def decorator(func):
         signature = inspect.signature(func)
 
@@ -21,14 +33,30 @@ def action(message: str = None):
             step_text = template.format(**context)
 
             logger.debug(f"Action: {step_text}")
-            return func(self, *args, **kwargs)
+            impact_recorder.record(self)
+
+            def call():
+                wait_for_loaders_to_hide(getattr(self, '_page', None))
+                return func(self, *args, **kwargs)
+
+            if not retry_engine.enabled and retry is None:
+                return call()
+            return retry_engine.run(call, step_text, self, idempotent, retry, single_action=True)
 
         return wrapper
 
     return decorator
 
 
-def step(message: str = None):
+def step(message: str = None, idempotent: bool = False, retry: Optional[RetryPolicy] = None):
+    """
+    Log a step and retry it on failures matching a retry policy.
+
+    :param message: Step description, formatted with the arguments.
+    :param idempotent: Whether the step can be repeated after it took (partial) effect. Steps that are not
+        are never retried: a failure may follow earlier actions of the step that took effect.
+    :param retry: Retry policy of this step, instead of the policies registered in `retry_engine`.
+    """
     def decorator(func):
         sig = inspect.signature(func)
 
@@ -47,7 +75,10 @@ def step(message: str = None):
                 logger.warning(f"Missing key in step message: {e}")
 
             logger.info(step_text)
-            return func(self, *args, **kwargs)
+            impact_recorder.record(self)
+            if not retry_engine.enabled and retry is None:
+                return func(self, *args, **kwargs)
+            return retry_engine.run(lambda: func(self, *args, **kwargs), step_text, self, idempotent, retry)
 
         return wrapper
 
@@ -1,17 +1,34 @@
 import logging
 from abc import ABC
-from typing import Union, List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Union, List, Optional, Sequence
 
 from playwright.sync_api import Locator, Page
 
 from framework.ui.constants.elements import ElementType
 from framework.ui.constants.mouse import MouseButton
 from framework.ui.decorators.decorators import action
+from framework.ui.elements.helpers.element_scripts import GET_CSS_PROPERTY_JS, READ_FIELDS_FUNCTION
 from framework.ui.elements.helpers.element_state import ElementStateHandler
+from framework.ui.visual.baselines import baseline_store
+
+if TYPE_CHECKING:
+    from framework.ui.visual.comparison import ComparisonOptions, ComparisonResult
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ElementFields:
+    """Properties of an element read together by `BaseElement.read`, None for the ones not requested."""
+    text: Optional[str] = None
+    html: Optional[str] = None
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+    css: Dict[str, str] = field(default_factory=dict)
+    # Viewport-relative box in CSS pixels: {"x", "y", "width", "height"}, like `Locator.bounding_box`
+    rect: Optional[Dict[str, float]] = None
+
+
 class BaseElement(ABC):
     """
     Base class for all web elements.
@@ -84,7 +101,7 @@ class BaseElement(ABC):
         :return: The value of the CSS property.
         """
         logger.debug(f"Get CSS property '{property_name}' from element: {self}")
-        return self.locator.evaluate(f"el => getComputedStyle(el).getPropertyValue('{property_name}')")
+        return self.locator.evaluate(GET_CSS_PROPERTY_JS, property_name)
 
     def get_html(self) -> str:
         """
@@ -100,6 +117,29 @@ class BaseElement(ABC):
         logger.debug(f"Get inner text from element: {self}")
         return self.locator.inner_text()
 
+    def read(self, text: bool = False, attrs: Sequence[str] = (), css: Sequence[str] = (), html: bool = False,
+             rect: bool = False) -> ElementFields:
+        """
+        Reads several properties of the element in one evaluation.
+
+        **Usage**
+        fields = element.read(text=True, attrs=["href", "title"], css=["color"])
+        assert fields.text == "Docs" and fields.attributes["href"] == "/docs"
+
+        :param text: Whether to read the inner text.
+        :param attrs: Names of the attributes to read.
+        :param css: Names of the computed CSS properties to read.
+        :param html: Whether to read the inner HTML.
+        :param rect: Whether to read the bounding box.
+        :return: The requested properties.
+        """
+        fields = {"text": text, "html": html, "attributes": list(attrs), "css": list(css), "states": False,
+                  "rect": rect}
+        logger.debug(f"Read {fields} from element: {self}")
+        values = self.locator.evaluate(READ_FIELDS_FUNCTION, fields)
+        return ElementFields(text=values.get("text"), html=values.get("html"), attributes=values.get("attributes", {}),
+                             css=values.get("css", {}), rect=values.get("rect"))
+
     @action('Click on {element}')
     def click(self, modifier=None, delay=0) -> None:
         """Performs a left-click on the element."""
@@ -146,16 +186,29 @@ class BaseElement(ABC):
         logger.debug(f"Drag and drop element {self} to target position: {{x: {x}, y:{y}}}")
         self.locator.drag_to(target_position={"x": x, "y": y})
 
-    @action('Move to {element}')
+    @action('Move to {element}', idempotent=True)
     def move_to(self) -> None:
         """Moves the mouse to the element."""
         self.locator.hover()
 
-    @action('Scroll to element {element}')
+    @action('Scroll to element {element}', idempotent=True)
     def scroll_into_view(self) -> None:
         """Scrolls the element into view."""
         self._page.evaluate("el => el.scrollIntoView({block: 'center'})", self.locator)
 
+    @action("Compare screenshot of {element} with baseline '{name}'")
+    def assert_screenshot(self, name: str, options: Optional['ComparisonOptions'] = None) -> 'ComparisonResult':
+        """
+        Compare a screenshot of the element with its baseline for this browser and viewport.
+
+        :param name: Baseline name.
+        :param options: Comparison tolerances.
+        :return: The comparison result.
+        :raises AssertionError: If the screenshot does not match the baseline.
+        """
+        png = self.locator.screenshot(animations="disabled", caret="hide")
+        return baseline_store.assert_matches(self._page, name, png, options)
+
     def _click(self, button: MouseButton = MouseButton.LEFT, double: bool = False,
                modifier: Optional[Union[str, List[str]]] = None, delay: int = 0) -> None:
         """Internal click handler supporting different mouse buttons and click types."""
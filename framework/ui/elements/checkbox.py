@@ -25,12 +25,12 @@ class Checkbox(BaseElement):
         logger.debug(f"Checkbox '{self._name}' is currently {self._get_checkbox_state(is_checked)}")
         return is_checked
 
-    @action("Select the checkbox {element}")
+    @action("Select the checkbox {element}", idempotent=True)
     def check(self) -> None:
         """Ensure the checkbox is checked."""
         self._check(is_checked=True)
 
-    @action("Unselect the checkbox {element}")
+    @action("Unselect the checkbox {element}", idempotent=True)
     def uncheck(self) -> None:
         """Ensure the checkbox is unchecked."""
         self._check(is_checked=False)
@@ -0,0 +1,201 @@
+import logging
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from playwright.sync_api import Error as PlaywrightError, Locator, Page
+
+from framework.ui.constants.elements import ElementAttribute, ElementType
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.decorators.decorators import action
+from framework.ui.elements.base_element import BaseElement
+
+logger = logging.getLogger(__name__)
+
+# Target state of the group: a bitmask (bit N is box N, boxes beyond the highest bit are unchecked),
+# a list of states by index, or a dict of states by key attribute (boxes not listed are left as they are)
+GroupState = Union[int, Sequence[bool], Mapping[str, bool]]
+
+READ_STATES_JS = """
+(elements, keyAttribute) => elements.map(el => [el.getAttribute(keyAttribute), el.checked])
+"""
+
+# Native click() toggles the box and fires 'input' and 'change' events like a user click would.
+# It skips Playwright's actionability checks, so disabled boxes are not clicked and boxes a click
+# did not toggle (e.g. prevented by a handler) are reported as blocked.
+SET_STATES_JS = """
+async (elements, {states, fallback, keyAttribute}) => {
+    const toggled = [];
+    const blocked = [];
+    elements.forEach((el, index) => {
+        const key = keyAttribute === null ? index : el.getAttribute(keyAttribute);
+        const target = Object.hasOwn(states, key) ? states[key] : fallback;
+        if (target === null || el.checked === target) {
+            return;
+        }
+        if (el.disabled) {
+            blocked.push(index);
+            return;
+        }
+        el.click();
+        toggled.push([el, index, target]);
+    });
+    // Let frameworks re-render controlled inputs before checking the clicks took effect
+    await new Promise(resolve => setTimeout(resolve));
+    const clicked = [];
+    for (const [el, index, target] of toggled) {
+        (el.checked === target ? clicked : blocked).push(index);
+    }
+    return {clicked, blocked};
+}
+"""
+
+MATCH_STATES_JS = """
+({elements, states, fallback, keyAttribute}) => elements.every((el, index) => {
+    const key = keyAttribute === null ? index : el.getAttribute(keyAttribute);
+    const target = Object.hasOwn(states, key) ? states[key] : fallback;
+    return target === null || el.checked === target;
+})
+"""
+
+
+class CheckboxGroup(BaseElement):
+    """
+    Group of checkboxes matched by one shared locator.
+
+    Reads and sets all boxes in a single browser evaluation, instead of one `is_checked` and `click`
+    round trip per box.
+    """
+
+    def __init__(self, page: Page, locator: Union[Locator, str], name: str,
+                 key_attribute: str = ElementAttribute.VALUE.value):
+        super().__init__(page, locator, name, ElementType.CHECKBOX_GROUP)
+        self._key_attribute = key_attribute
+
+    def get_states(self) -> List[bool]:
+        """
+        Returns the states of all checkboxes in the group.
+
+        :return: A list with True for each checked box, in DOM order.
+        """
+        return [is_checked for _, is_checked in self._read_states()]
+
+    def get_bitmask(self) -> int:
+        """
+        Returns the states of all checkboxes in the group as a bitmask.
+
+        :return: An integer where bit N is set if box N (in DOM order) is checked.
+        """
+        return sum(1 << index for index, is_checked in enumerate(self.get_states()) if is_checked)
+
+    def get_state_map(self) -> Dict[str, bool]:
+        """
+        Returns the states of all checkboxes in the group by their key attribute (`value` by default).
+
+        :return: A dictionary mapping each box key to True if the box is checked.
+        """
+        return dict(self._read_states())
+
+    @action("Set states of the checkbox group {element} to {states}", idempotent=True)
+    def set_states(self, states: GroupState) -> int:
+        """
+        Bring the group to the target state, clicking only the boxes that differ from it.
+
+        :param states: A bitmask, a list of states by index, or a dict of states by key attribute.
+        :return: The number of boxes clicked.
+        """
+        result = self.locator.evaluate_all(SET_STATES_JS, self._to_script_arg(states))
+        clicked, blocked = result["clicked"], result["blocked"]
+        logger.debug(f"Clicked {len(clicked)} boxes of '{self._name}': {clicked}")
+        if blocked:
+            raise RuntimeError(f"Boxes {blocked} of checkbox group '{self._name}' are disabled or were not toggled "
+                               f"by a click, clicked boxes: {clicked}")
+        return len(clicked)
+
+    def check_all(self) -> int:
+        """Ensure all checkboxes in the group are checked."""
+        return self.set_states([True] * self.count())
+
+    def uncheck_all(self) -> int:
+        """Ensure all checkboxes in the group are unchecked."""
+        return self.set_states(0)
+
+    def matches(self, states: GroupState) -> bool:
+        """
+        Check if the group currently matches the target state.
+
+        :param states: A bitmask, a list of states by index, or a dict of states by key attribute.
+        :return: True if every box covered by the target has the target state.
+        """
+        return self._matches(self._read_states(), states)
+
+    def wait_for_states(self, states: GroupState, timeout: int = WaitTimeoutsMs.EXPLICIT_WAIT,
+                        no_throw: bool = False) -> bool:
+        """
+        Wait until the group matches the target state.
+
+        :param states: A bitmask, a list of states by index, or a dict of states by key attribute.
+        :param timeout: Maximum time to wait in milliseconds.
+        :param no_throw: If True, log a warning instead of raising on timeout.
+        :return: True if the group matched the target state in time.
+        """
+        logger.debug(f"Waiting for checkbox group '{self._name}' to be {states} (timeout: {timeout} ms)")
+        arg = self._to_script_arg(states)
+        # Boxes are resolved once: the predicate runs in the page and follows their state, not re-rendered groups
+        arg["elements"] = self.locator.element_handles()
+        try:
+            # A zero timeout would disable Playwright's timeout instead of checking once
+            self._page.wait_for_function(MATCH_STATES_JS, arg=arg, timeout=max(timeout, 1))
+            return True
+        except PlaywrightError as e:
+            current = self.get_states()
+            message = (f"Checkbox group '{self._name}' did not match {states} after {timeout} ms, "
+                       f"current states: {dict(enumerate(current))}")
+            if no_throw:
+                logger.warning(message)
+                return False
+            raise TimeoutError(message) from e
+        finally:
+            for handle in arg["elements"]:
+                handle.dispose()
+
+    def _read_states(self) -> List[Tuple[Optional[str], bool]]:
+        """Read key attribute and state of every box in one evaluation."""
+        states = self.locator.evaluate_all(READ_STATES_JS, self._key_attribute)
+        logger.debug(f"Checkbox group '{self._name}' states: {states}")
+        return [(key, is_checked) for key, is_checked in states]
+
+    def _to_script_arg(self, states: GroupState) -> Dict:
+        target_states, fallback = self._to_target(states)
+        return {
+            "states": target_states,
+            "fallback": fallback,
+            "keyAttribute": self._key_attribute if isinstance(states, Mapping) else None,
+        }
+
+    @staticmethod
+    def _to_target(states: GroupState) -> Tuple[Union[List[bool], Dict[str, bool]], Optional[bool]]:
+        """
+        Normalize a target state to explicit states plus the state of boxes not covered by them.
+
+        :return: A tuple of (states by index or by key, fallback state or None to leave the box as it is).
+        """
+        if isinstance(states, bool):
+            raise TypeError("Checkbox group state must be a bitmask, a list or a dict, not a single bool")
+        if isinstance(states, int):
+            if states < 0:
+                raise ValueError(f"Checkbox group bitmask must not be negative: {states}")
+            return [bit == "1" for bit in reversed(bin(states)[2:])], False
+        if isinstance(states, Mapping):
+            return {str(key): bool(value) for key, value in states.items()}, None
+        return [bool(value) for value in states], None
+
+    @classmethod
+    def _matches(cls, current: List[Tuple[Optional[str], bool]], states: GroupState) -> bool:
+        target_states, fallback = cls._to_target(states)
+        for index, (key, is_checked) in enumerate(current):
+            if isinstance(target_states, dict):
+                target = target_states.get(key, fallback)
+            else:
+                target = target_states[index] if index < len(target_states) else fallback
+            if target is not None and target != is_checked:
+                return False
+        return True
@@ -0,0 +1,158 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Type, Union
+
+from playwright.sync_api import Locator, Page
+
+from framework.ui.constants.elements import ElementType
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.elements.base_element import BaseElement
+from framework.ui.elements.helpers.element_scripts import READ_ALL_FIELDS_JS
+from framework.ui.elements.label import Label
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ItemState:
+    """State of one element of an `ElementList`."""
+    visible: bool
+    enabled: bool
+    checked: bool
+
+
+@dataclass
+class ListItem:
+    """Fields of one element of an `ElementList`, read together with all the other elements."""
+    index: int
+    text: Optional[str] = None
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+    css: Dict[str, str] = field(default_factory=dict)
+    state: Optional[ItemState] = None
+
+
+class ElementList(BaseElement):
+    """
+    Collection of elements matched by one locator (e.g. search results, menu items).
+
+    Texts, attributes, CSS properties and states of all elements are read in a single `evaluate_all`,
+    instead of one round trip per element and property. Indexing returns regular elements for interactions.
+    """
+
+    POLL_INTERVAL_MS = 100
+
+    def __init__(self, page: Page, locator: Union[Locator, str], name: str,
+                 item_class: Type[BaseElement] = Label):
+        """
+        :param item_class: Element class of the items returned by indexing, created with (page, locator, name).
+        """
+        super().__init__(page, locator, name, ElementType.ELEMENT_LIST)
+        self._item_class = item_class
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index: int) -> BaseElement:
+        """
+        Return the element at an index (negative indexes count from the end).
+
+        :raises IndexError: If there is no element at the index.
+        """
+        count = self.count()
+        position = index + count if index < 0 else index
+        if not 0 <= position < count:
+            raise IndexError(f"{self} has {count} elements, no element at index {index}")
+        return self._get_item(position)
+
+    def __iter__(self) -> Iterator[BaseElement]:
+        return (self._get_item(index) for index in range(self.count()))
+
+    def items(self, text: bool = True, attributes: Sequence[str] = (), css: Sequence[str] = (),
+              states: bool = False) -> List[ListItem]:
+        """
+        Read the requested fields of all elements in one evaluation.
+
+        :param text: Whether to read the inner texts.
+        :param attributes: Names of the attributes to read.
+        :param css: Names of the computed CSS properties to read.
+        :param states: Whether to read visibility, enabled and checked states.
+        :return: One item per element, in DOM order.
+        """
+        fields = {"text": text, "attributes": list(attributes), "css": list(css), "states": states}
+        logger.debug(f"Read {fields} of all elements of {self}")
+        values = self.locator.evaluate_all(READ_ALL_FIELDS_JS, fields)
+        return [ListItem(index=index, text=value.get("text"), attributes=value.get("attributes", {}),
+                         css=value.get("css", {}), state=ItemState(**value["states"]) if "states" in value else None)
+                for index, value in enumerate(values)]
+
+    def texts(self) -> List[str]:
+        """Returns the inner texts of all elements."""
+        return [item.text for item in self.items()]
+
+    def attributes(self, name: str) -> List[Optional[str]]:
+        """
+        Returns an attribute of all elements.
+
+        :param name: The attribute name.
+        :return: The attribute values, None for elements without the attribute.
+        """
+        return [item.attributes[name] for item in self.items(text=False, attributes=[name])]
+
+    def css(self, property_name: str) -> List[str]:
+        """
+        Returns a computed CSS property of all elements.
+
+        :param property_name: The CSS property name.
+        :return: The property values.
+        """
+        return [item.css[property_name] for item in self.items(text=False, css=[property_name])]
+
+    def states(self) -> List[ItemState]:
+        """Returns the visibility, enabled and checked states of all elements."""
+        return [item.state for item in self.items(text=False, states=True)]
+
+    def filter(self, predicate: Callable[[ListItem], bool], attributes: Sequence[str] = (),
+               css: Sequence[str] = ()) -> List[BaseElement]:
+        """
+        Return the elements whose fields match a predicate, reading the fields of all elements in one evaluation.
+
+        **Usage**
+        visible_results = results.filter(lambda item: item.state.visible and "Python" in item.text)
+
+        :param predicate: Function called with the text, states and requested attributes/CSS of each element.
+        :param attributes: Attributes to read for the predicate.
+        :param css: CSS properties to read for the predicate.
+        :return: The matching elements, located by index.
+        """
+        items = self.items(attributes=attributes, css=css, states=True)
+        return [self._get_item(item.index) for item in items if predicate(item)]
+
+    def wait_for_count(self, count: int, timeout: int = WaitTimeoutsMs.EXPLICIT_WAIT,
+                       no_throw: bool = False) -> bool:
+        """
+        Wait until the locator matches the expected number of elements.
+
+        :param count: The expected number of elements.
+        :param timeout: Maximum time to wait in milliseconds.
+        :param no_throw: If True, log a warning instead of raising on timeout.
+        :return: True if the count was reached in time.
+        """
+        logger.debug(f"Waiting for {self} to have {count} elements (timeout: {timeout} ms)")
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            current = self.count()
+            if current == count:
+                return True
+            if time.monotonic() >= deadline:
+                break
+            self._page.wait_for_timeout(self.POLL_INTERVAL_MS)
+
+        message = f"{self} has {current} elements after {timeout} ms, expected {count}"
+        if no_throw:
+            logger.warning(message)
+            return False
+        raise TimeoutError(message)
+
+    def _get_item(self, index: int) -> BaseElement:
+        return self._item_class(self._page, self.locator.nth(index), f"{self._name} #{index}")
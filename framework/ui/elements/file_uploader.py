@@ -1,12 +1,14 @@
 import logging
-import pathlib
-from typing import Union, List
+from contextlib import ExitStack
+from typing import Union, Sequence
 
 from playwright.sync_api import Locator
 
 from framework.ui.constants.elements import ElementType
 from framework.ui.decorators.decorators import action
 from framework.ui.elements.base_element import BaseElement
+from framework.ui.elements.helpers.upload_payloads import (PayloadStager, UploadItem, UploadPayload, needs_staging,
+                                                          normalize_upload_items)
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +19,30 @@ class FileUploader(BaseElement):
         super().__init__(page, locator, name, ElementType.FILE_UPLOADER)
 
     @action("Click on {element} to select files")
-    def upload_files(self, paths: Union[pathlib.Path, str, List[Union[pathlib.Path, str]]]) -> None:
+    def upload_files(self, paths: Union[UploadItem, Sequence[UploadItem]]) -> None:
         """
         Upload one or multiple files into an '<input type="file">' element.
 
-        :param paths: A single path or a list of file paths (as str or pathlib.Path).
-        :raises TypeError: If the input is not a valid path or list of paths.
+        Besides file paths, accepts payloads that do not exist on disk: `BufferPayload` (bytes in memory),
+        `MappedFilePayload` (memory-mapped file), `SyntheticPayload` (generated content of a given size)
+        and Playwright FilePayload dicts. Payloads are sent as buffers when Playwright allows it (up to 50 MB
+        in total, not mixed with paths), otherwise they are staged as files on a memory-backed file system.
+
+        :param paths: A single file or a list of files: paths (as str or pathlib.Path) and/or payloads.
+        :raises TypeError: If an item is not a path, a payload or a FilePayload dict.
         """
         logger.debug(f"Select file '{paths}' for uploading...")
 
-        file_paths = self._normalize_paths(paths)
-        self.locator.set_input_files(*file_paths)
+        items = normalize_upload_items(paths)
+        if not needs_staging(items):
+            # Buffers (e.g. memory-mapped files) are released once Playwright has sent them
+            with ExitStack() as stack:
+                files = [stack.enter_context(item.open_file_payload()) if isinstance(item, UploadPayload) else item
+                         for item in items]
+                self.locator.set_input_files(files)
+            return
+
+        with PayloadStager() as stager:
+            file_paths = [stager.stage(item) if isinstance(item, UploadPayload) else item for item in items]
+            self.locator.set_input_files(file_paths)
 
-    def _normalize_paths(self, paths: Union[pathlib.Path, str, List[Union[pathlib.Path, str]]]) -> List[pathlib.Path]:
-        """Normalize the input to a list of pathlib.Path objects. """
-        if isinstance(paths, (str, pathlib.Path)):
-            paths = [pathlib.Path(paths)]
-        return [pathlib.Path(p) for p in paths]
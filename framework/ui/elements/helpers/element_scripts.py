@@ -0,0 +1,44 @@
+"""
+JavaScript reading several properties of elements in one evaluation.
+
+The requested fields are passed as an argument instead of being interpolated into the source,
+so the same function is reused for every call.
+"""
+
+# Reads the requested fields of one element: {text, html, attributes: [...], css: [...], states, rect}
+READ_FIELDS_FUNCTION = """
+(element, {text, html, attributes, css, states, rect}) => {
+    const fields = {};
+    if (text) fields.text = element.innerText;
+    if (html) fields.html = element.innerHTML;
+    if (attributes.length) {
+        fields.attributes = Object.fromEntries(attributes.map(name => [name, element.getAttribute(name)]));
+    }
+    if (css.length || states) {
+        const style = getComputedStyle(element);
+        if (css.length) fields.css = Object.fromEntries(css.map(name => [name, style.getPropertyValue(name)]));
+        if (states) {
+            const box = element.getBoundingClientRect();
+            fields.states = {
+                visible: box.width > 0 && box.height > 0 && style.visibility !== 'hidden',
+                enabled: !element.disabled,
+                checked: element.checked ?? element.getAttribute('aria-checked') === 'true',
+            };
+        }
+    }
+    if (rect) {
+        const box = element.getBoundingClientRect();
+        fields.rect = {x: box.x, y: box.y, width: box.width, height: box.height};
+    }
+    return fields;
+}
+"""
+
+GET_CSS_PROPERTY_JS = "(element, name) => getComputedStyle(element).getPropertyValue(name)"
+
+READ_ALL_FIELDS_JS = f"""
+(elements, fields) => {{
+    const readFields = {READ_FIELDS_FUNCTION.strip()};
+    return elements.map(element => readFields(element, fields));
+}}
+"""
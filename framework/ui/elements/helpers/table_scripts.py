@@ -0,0 +1,184 @@
+"""
+JavaScript evaluated on table elements: lookup index, watched-table snapshots and row export.
+"""
+
+# Elements matching a selector under the root. Selectors starting with '//', '..', '(' or 'xpath='
+# are XPath relative to the root (like Playwright's chained locators), others are CSS
+QUERY_ALL_JS = """
+(root, selector) => {
+    if (selector.startsWith('xpath=')) {
+        selector = selector.slice('xpath='.length);
+    } else if (!/^(\\/\\/|\\.\\.|\\()/.test(selector)) {
+        return Array.from(root.querySelectorAll(selector.replace(/^css=/, '')));
+    }
+    const xpath = selector.startsWith('/') ? '.' + selector : selector;
+    const result = document.evaluate(xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+}
+"""
+
+# Builds (once) and caches on the table element a header-to-index map and the text of every cell.
+# A MutationObserver drops the cached index as soon as the table content changes.
+# Maps keyed by page text have no prototype, so texts like 'constructor' are plain keys.
+TABLE_INDEX_JS = """
+(table, selectors) => {
+    if (table.__frameworkTableIndex) {
+        return table.__frameworkTableIndex;
+    }
+    const queryAll = """ + QUERY_ALL_JS + """;
+    const headers = Object.create(null);
+    const headerRow = queryAll(table, selectors.header)[0];
+    if (headerRow) {
+        queryAll(headerRow, selectors.headerCell).forEach((cell, i) => headers[cell.innerText.trim()] = i);
+    }
+    const cells = queryAll(table, selectors.row).map(row => queryAll(row, selectors.cell).map(cell => cell.innerText.trim()));
+    const keys = Object.create(null);
+    const index = {
+        headers,
+        cells,
+        // Rows with the given value in the column, through a value-to-rows map built on first use of the column
+        rowsBy: (column, value) => {
+            if (!keys[column]) {
+                keys[column] = Object.create(null);
+                cells.forEach((row, i) => (keys[column][row[headers[column]]] ??= []).push(i));
+            }
+            return keys[column][value] || [];
+        },
+    };
+
+    const observer = new MutationObserver(() => {
+        observer.disconnect();
+        delete table.__frameworkTableIndex;
+    });
+    observer.observe(table, {childList: true, subtree: true, characterData: true});
+    table.__frameworkTableIndex = index;
+    return index;
+}
+"""
+
+# Rows matching all criteria: the first criterion is looked up in its column map, the rest are checked on those rows
+FIND_ROWS_JS = """
+(table, {selectors, criteria}) => {
+    const index = (""" + TABLE_INDEX_JS + """)(table, selectors);
+    const columns = Object.keys(criteria);
+    const missing = columns.filter(column => !Object.hasOwn(index.headers, column));
+    if (missing.length) {
+        return {missing, rows: []};
+    }
+    const [keyColumn, ...otherColumns] = columns;
+    const rows = index.rowsBy(keyColumn, criteria[keyColumn]).filter(i =>
+        otherColumns.every(column => index.cells[i][index.headers[column]] === criteria[column]));
+    return {missing, rows};
+}
+"""
+
+GET_CELL_JS = """
+(table, {selectors, keyColumn, rowKey, column}) => {
+    const index = (""" + TABLE_INDEX_JS + """)(table, selectors);
+    keyColumn ??= Object.keys(index.headers).find(name => index.headers[name] === 0);
+    const missing = [keyColumn, column].filter(name => !Object.hasOwn(index.headers, name));
+    if (missing.length) {
+        return {missing, found: false, text: null};
+    }
+    const rows = index.rowsBy(keyColumn, rowKey);
+    const text = rows.length ? index.cells[rows[0]][index.headers[column]] ?? null : null;
+    return {missing, found: rows.length > 0, text};
+}
+"""
+
+INVALIDATE_INDEX_JS = "table => { delete table.__frameworkTableIndex; }"
+
+# Starts watching the table: a MutationObserver marks changed rows as dirty and row additions/removals
+# as a structural change, so a refresh only reads what changed. Row ids are kept in a WeakMap owned by
+# the watch, so a new watch of the same table starts from fresh ids. Returns the column names.
+WATCH_START_JS = """
+(table, selectors) => {
+    const queryAll = """ + QUERY_ALL_JS + """;
+    if (table.__frameworkTableWatch) {
+        table.__frameworkTableWatch.observer.disconnect();
+    }
+    const watch = {ids: new WeakMap(), nextId: 0, dirty: new Set(), structural: true};
+    watch.observer = new MutationObserver(mutations => {
+        for (const mutation of mutations) {
+            let node = mutation.target;
+            while (node && node !== table && !watch.ids.has(node)) {
+                node = node.parentNode;
+            }
+            if (node && node !== table) {
+                watch.dirty.add(node);
+            } else {
+                watch.structural = true;
+            }
+        }
+    });
+    watch.observer.observe(table, {childList: true, subtree: true, characterData: true});
+    table.__frameworkTableWatch = watch;
+
+    const headerRow = queryAll(table, selectors.header)[0];
+    return headerRow ? queryAll(headerRow, selectors.headerCell).map(cell => cell.innerText.trim()) : [];
+}
+"""
+
+# Changes since the previous refresh: cell texts of new and changed rows by row id, and the current
+# order of row ids if rows were added, removed or moved (null otherwise)
+WATCH_REFRESH_JS = """
+(table, selectors) => {
+    const queryAll = """ + QUERY_ALL_JS + """;
+    const watch = table.__frameworkTableWatch;
+    if (!watch) {
+        return null;
+    }
+    let order = null;
+    if (watch.structural) {
+        watch.structural = false;
+        order = queryAll(table, selectors.row).map(row => {
+            if (!watch.ids.has(row)) {
+                watch.ids.set(row, watch.nextId++);
+                watch.dirty.add(row);
+            }
+            return watch.ids.get(row);
+        });
+    }
+    const rows = [];
+    for (const row of watch.dirty) {
+        if (row.isConnected) {
+            rows.push([watch.ids.get(row), queryAll(row, selectors.cell).map(cell => cell.innerText.trim())]);
+        }
+    }
+    watch.dirty.clear();
+    return {order, rows};
+}
+"""
+
+WATCH_STOP_JS = """
+table => {
+    if (table.__frameworkTableWatch) {
+        table.__frameworkTableWatch.observer.disconnect();
+        delete table.__frameworkTableWatch;
+    }
+}
+"""
+
+# Export in chunks: the start collects the rows once and keeps them on the table element,
+# each chunk returns the cell texts of the next rows, the end releases them
+EXPORT_START_JS = """
+(table, selectors) => {
+    const queryAll = """ + QUERY_ALL_JS + """;
+    const headerRow = queryAll(table, selectors.header)[0];
+    table.__frameworkExportRows = queryAll(table, selectors.row);
+    return {
+        columns: headerRow ? queryAll(headerRow, selectors.headerCell).map(cell => cell.innerText.trim()) : [],
+        total: table.__frameworkExportRows.length,
+    };
+}
+"""
+
+EXPORT_CHUNK_JS = """
+(table, {selectors, start, count}) => {
+    const queryAll = """ + QUERY_ALL_JS + """;
+    return table.__frameworkExportRows.slice(start, start + count)
+        .map(row => queryAll(row, selectors.cell).map(cell => cell.innerText.trim()));
+}
+"""
+
+EXPORT_END_JS = "table => { delete table.__frameworkExportRows; }"
@@ -0,0 +1,142 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from playwright.sync_api import Locator, Page
+
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+from framework.ui.elements.helpers.table_scripts import WATCH_REFRESH_JS, WATCH_START_JS, WATCH_STOP_JS
+
+logger = logging.getLogger(__name__)
+
+RowData = Dict[str, str]
+
+
+@dataclass
+class TableDiff:
+    """Rows added, removed and changed in a watched table since the previous refresh."""
+    added: List[RowData] = field(default_factory=list)
+    removed: List[RowData] = field(default_factory=list)
+    changed: List[Tuple[RowData, RowData]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def __str__(self) -> str:
+        return f"added: {len(self.added)}, removed: {len(self.removed)}, changed: {len(self.changed)}"
+
+
+class TableWatcher:
+    """
+    Watched-table mode: keeps the last snapshot of a table in Python and refreshes it from diffs.
+
+    A MutationObserver in the page records which rows changed, so each refresh only reads the cell texts
+    of added and changed rows instead of the whole table.
+    """
+
+    POLL_INTERVAL_MS = 100
+
+    def __init__(self, page: Page, locator: Locator, name: str, selectors: Dict[str, str]):
+        self._page = page
+        self._locator = locator
+        self._name = name
+        self._selectors = selectors
+
+        self._columns: List[str] = []
+        self._rows: Dict[int, RowData] = {}
+        self._order: List[int] = []
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def snapshot(self) -> List[RowData]:
+        """The last known table content, in the same format as `Table.parse_table_content`."""
+        return [self._rows[row_id] for row_id in self._order]
+
+    def start(self) -> 'TableWatcher':
+        """Attach the observer to the table and read the initial snapshot."""
+        self._columns = self._locator.evaluate(WATCH_START_JS, self._selectors)
+        self._rows.clear()
+        self._order.clear()
+        logger.debug(f"Watching table '{self._name}', columns: {self._columns}")
+        self.refresh()
+        return self
+
+    def stop(self) -> None:
+        """Detach the observer from the table."""
+        self._locator.evaluate(WATCH_STOP_JS)
+        logger.debug(f"Stopped watching table '{self._name}'")
+
+    def refresh(self) -> TableDiff:
+        """
+        Pull the changes since the previous refresh and apply them to the snapshot.
+
+        :return: The rows added, removed and changed.
+        """
+        changes = self._locator.evaluate(WATCH_REFRESH_JS, self._selectors)
+        if changes is None:
+            raise RuntimeError(f"Table '{self._name}' is not watched, the table element may have been replaced")
+
+        diff = TableDiff()
+        if changes["order"] is not None:
+            order = changes["order"]
+            current_ids = set(order)
+            diff.removed = [self._rows.pop(row_id) for row_id in self._order if row_id not in current_ids]
+            self._order = order
+
+        for row_id, cells in changes["rows"]:
+            row = dict(zip(self._columns, cells))
+            previous = self._rows.get(row_id)
+            if previous is None:
+                diff.added.append(row)
+            elif previous != row:
+                diff.changed.append((previous, row))
+            self._rows[row_id] = row
+
+        unread = [row_id for row_id in self._order if row_id not in self._rows]
+        if unread:
+            raise RuntimeError(f"Table '{self._name}' watch is out of sync, rows {unread} were never read")
+
+        if not diff.is_empty():
+            logger.debug(f"Table '{self._name}' changes: {diff}")
+        return diff
+
+    def wait_for_row(self, predicate: Callable[[RowData], bool], timeout: int = WaitTimeoutsMs.EXPLICIT_WAIT,
+                     no_throw: bool = False) -> Optional[RowData]:
+        """
+        Wait until a row matching the predicate is in the table. Only added and changed rows are checked
+        after the initial snapshot.
+
+        :param predicate: Function taking a row (column name to cell text) and returning True if it matches.
+        :param timeout: Maximum time to wait in milliseconds.
+        :param no_throw: If True, log a warning and return None instead of raising on timeout.
+        :return: The first matching row.
+        """
+        self.refresh()
+        row = next((row for row in self.snapshot if predicate(row)), None)
+
+        deadline = time.monotonic() + timeout / 1000
+        while row is None and time.monotonic() < deadline:
+            self._page.wait_for_timeout(self.POLL_INTERVAL_MS)
+            diff = self.refresh()
+            candidates = diff.added + [new for _, new in diff.changed]
+            row = next((row for row in candidates if predicate(row)), None)
+
+        if row is not None:
+            logger.debug(f"Row found in table '{self._name}': {row}")
+            return row
+
+        message = f"No matching row appeared in table '{self._name}' after {timeout} ms"
+        if no_throw:
+            logger.warning(message)
+            return None
+        raise TimeoutError(message)
+
+    def __enter__(self) -> 'TableWatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
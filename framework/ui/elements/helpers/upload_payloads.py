@@ -0,0 +1,210 @@
+import logging
+import mimetypes
+import mmap
+import pathlib
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Playwright rejects in-memory payloads larger than this in total (per `set_input_files` call)
+PAYLOAD_SIZE_LIMIT_BYTES = 50 * 1024 * 1024
+CHUNK_SIZE_BYTES = 1024 * 1024
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+# Memory-backed file system used to stage payloads that are too large to be sent as buffers
+RAM_DISK_DIR = pathlib.Path("/dev/shm")
+
+
+class UploadPayload(ABC):
+    """A file to upload that does not need to exist on disk."""
+
+    def __init__(self, name: str, mime_type: Optional[str] = None):
+        self.name = name
+        self.mime_type = mime_type or mimetypes.guess_type(name)[0] or DEFAULT_MIME_TYPE
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """Size of the payload in bytes."""
+
+    @abstractmethod
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE_BYTES) -> Iterator[bytes]:
+        """Yield the payload content in chunks, without building it all in memory."""
+
+    @property
+    def path(self) -> Optional[pathlib.Path]:
+        """Existing file with the payload content, if any (used instead of staging a copy)."""
+        return None
+
+    def get_buffer(self) -> Union[bytes, bytearray, memoryview]:
+        """Return the whole content as a bytes-like object."""
+        return b"".join(self.iter_chunks())
+
+    @contextmanager
+    def open_buffer(self) -> Iterator[Union[bytes, bytearray, memoryview, mmap.mmap]]:
+        """Provide the whole content as a bytes-like object, valid until the block exits."""
+        yield self.get_buffer()
+
+    @contextmanager
+    def open_file_payload(self) -> Iterator[Dict[str, Union[str, bytes]]]:
+        """Provide the payload in Playwright's name/mimeType/buffer format, valid until the block exits."""
+        with self.open_buffer() as buffer:
+            yield {"name": self.name, "mimeType": self.mime_type, "buffer": buffer}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} '{self.name}' ({self.size} bytes, {self.mime_type})"
+
+
+class BufferPayload(UploadPayload):
+    """Payload from bytes already in memory."""
+
+    def __init__(self, name: str, data: Union[bytes, bytearray, memoryview], mime_type: Optional[str] = None):
+        super().__init__(name, mime_type)
+        self._data = data
+
+    @property
+    def size(self) -> int:
+        return len(self._data)
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE_BYTES) -> Iterator[bytes]:
+        view = memoryview(self._data)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+
+    def get_buffer(self) -> Union[bytes, bytearray, memoryview]:
+        return self._data
+
+
+class MappedFilePayload(UploadPayload):
+    """Payload from a memory-mapped file: pages are read by the OS on demand instead of loading the file."""
+
+    def __init__(self, path: Union[str, pathlib.Path], name: Optional[str] = None, mime_type: Optional[str] = None):
+        self._path = pathlib.Path(path)
+        super().__init__(name or self._path.name, mime_type)
+
+    @property
+    def size(self) -> int:
+        return self._path.stat().st_size
+
+    @property
+    def path(self) -> Optional[pathlib.Path]:
+        # A file under another name has to be staged, the browser uses the file name of the path
+        return self._path if self._path.name == self.name else None
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE_BYTES) -> Iterator[bytes]:
+        with open(self._path, "rb") as file:
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    @contextmanager
+    def open_buffer(self) -> Iterator[Union[bytes, mmap.mmap]]:
+        if self.size == 0:
+            yield b""
+            return
+        with open(self._path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+class SyntheticPayload(UploadPayload):
+    """Payload of a given size, generated lazily by repeating a content pattern."""
+
+    def __init__(self, name: str, size: int, pattern: bytes = b"\0", mime_type: Optional[str] = None):
+        if size < 0:
+            raise ValueError(f"Payload size must not be negative: {size}")
+        if not pattern:
+            raise ValueError("Payload pattern must not be empty")
+        super().__init__(name, mime_type)
+        self._size = size
+        self._pattern = pattern
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE_BYTES) -> Iterator[bytes]:
+        # One chunk-sized block of the repeated pattern is built once and sliced, whatever the total size
+        repeats = -(-(chunk_size + len(self._pattern)) // len(self._pattern))
+        block = self._pattern * repeats
+        position = 0
+        while position < self._size:
+            length = min(chunk_size, self._size - position)
+            offset = position % len(self._pattern)
+            yield block[offset:offset + length]
+            position += length
+
+
+class PayloadStager:
+    """
+    Writes payloads that cannot be sent as buffers to files, preferably on a memory-backed file system,
+    and removes them afterwards.
+    """
+
+    def __init__(self, staging_dir: Optional[Union[str, pathlib.Path]] = None):
+        base_dir = staging_dir or (RAM_DISK_DIR if RAM_DISK_DIR.is_dir() else None)
+        self._dir = pathlib.Path(tempfile.mkdtemp(prefix="uploads_", dir=base_dir))
+
+    def stage(self, payload: UploadPayload) -> pathlib.Path:
+        """
+        Return a file path with the payload content, writing it in chunks if the payload has no file.
+
+        :param payload: The payload to stage.
+        :return: The file path to upload.
+        """
+        if payload.path:
+            return payload.path
+        target_dir = pathlib.Path(tempfile.mkdtemp(dir=self._dir))
+        path = target_dir / payload.name
+        with open(path, "wb") as file:
+            for chunk in payload.iter_chunks():
+                file.write(chunk)
+        logger.debug(f"Staged {payload!r} to '{path}'")
+        return path
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self) -> 'PayloadStager':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.cleanup()
+
+
+UploadItem = Union[str, pathlib.Path, UploadPayload, Dict[str, Union[str, bytes]]]
+
+
+def normalize_upload_items(files: Union[UploadItem, Sequence[UploadItem]]) -> List[Union[pathlib.Path, UploadPayload]]:
+    """
+    Normalize upload input to a list of paths and payloads.
+    Playwright FilePayload dicts ({"name", "mimeType", "buffer"}) become `BufferPayload`s.
+
+    :raises TypeError: If an item is not a path, a payload or a FilePayload dict.
+    """
+    items = [files] if isinstance(files, (str, pathlib.Path, UploadPayload, dict)) else list(files)
+    normalized = []
+    for item in items:
+        if isinstance(item, (str, pathlib.Path)):
+            normalized.append(pathlib.Path(item))
+        elif isinstance(item, UploadPayload):
+            normalized.append(item)
+        elif isinstance(item, dict):
+            normalized.append(BufferPayload(item["name"], item["buffer"], item.get("mimeType")))
+        else:
+            raise TypeError(f"Cannot upload {type(item).__name__}: expected a path, an UploadPayload "
+                            f"or a FilePayload dict")
+    return normalized
+
+
+def needs_staging(items: Sequence[Union[pathlib.Path, UploadPayload]]) -> bool:
+    """
+    Check if payloads have to be uploaded as files: Playwright cannot mix paths with buffers,
+    and rejects buffers over 50 MB in total.
+    """
+    payloads = [item for item in items if isinstance(item, UploadPayload)]
+    has_paths = len(payloads) < len(items)
+    return bool(payloads) and (has_paths or sum(payload.size for payload in payloads) > PAYLOAD_SIZE_LIMIT_BYTES)
+
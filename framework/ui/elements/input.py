@@ -17,7 +17,7 @@ class Input(BaseElement):
         """Types the given text into the input field."""
         self._type_text(text=value, clear=False)
 
-    @action("Clear field and type text in {element}")
+    @action("Clear field and type text in {element}", idempotent=True)
     def type_text_with_clear(self, value: str) -> None:
         """Clears the field before typing the given text."""
         self._type_text(text=value, clear=True)
@@ -28,7 +28,7 @@ class Input(BaseElement):
         secret_text = string_utils.mask_secret()
         self._type_text(text=secret_text, clear=False)
 
-    @action("Clear field and type secret text in {element}")
+    @action("Clear field and type secret text in {element}", idempotent=True)
     def type_secret_with_clear(self, value: str) -> None:
         """Clears the field before typing secret text (masked in logs)."""
         secret_text = string_utils.mask_secret()
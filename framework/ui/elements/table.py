@@ -1,17 +1,23 @@
-from typing import List, Dict, Union
+from pathlib import Path
+from typing import Any, List, Dict, Optional, Union
 import logging
 
 from playwright.sync_api import Page, Locator
 
 from framework.ui.constants.elements import ElementType
 from framework.ui.elements.base_element import BaseElement
+from framework.ui.elements.helpers.table_scripts import (EXPORT_CHUNK_JS, EXPORT_END_JS, EXPORT_START_JS,
+                                                        FIND_ROWS_JS, GET_CELL_JS, INVALIDATE_INDEX_JS)
+from framework.ui.elements.helpers.table_watcher import TableWatcher
+from framework.utils.export_utils import Compression, ExportFormat, RowsWriter, infer_format, open_rows_file
 from framework.ui.elements.table_row import TableRow
 
 logger = logging.getLogger(__name__)
 
-
 class Table(BaseElement):
 
+    EXPORT_CHUNK_SIZE = 1000
+
     DEFAULT_LOCATORS = {
         "header_locator": '//thead//tr',
         "header_cell_locator": '//th',
@@ -93,3 +99,107 @@ class Table(BaseElement):
         row_data = {attr: row.get(cell_name, None) for cell_name, attr in zip(row.keys(), obj_attrs)}
         return obj_cls(**row_data)
 
+    def find_rows(self, **criteria: Any) -> List[TableRow]:
+        """
+        Find rows by cell values, using an index built in the page once and kept until the table changes.
+
+        Column names that are not valid Python identifiers can be passed with `**{"First Name": "John"}`.
+
+        :param criteria: Column names mapped to the expected cell texts. Other values are compared as `str(value)`.
+        :return: A list of TableRow objects bound to the matched rows, in table order.
+        """
+        if not criteria:
+            raise ValueError("At least one column criterion is required to find rows")
+        criteria = {column: str(value) for column, value in criteria.items()}
+
+        logger.info(f"Find rows in table '{self._name}' by {criteria}")
+        result = self.locator.evaluate(FIND_ROWS_JS, {"selectors": self._selectors(), "criteria": criteria})
+        self._raise_on_missing_columns(result["missing"])
+
+        rows = self.find_child_locator(self.row_locator)
+        return [TableRow(self._page, rows.nth(index), f"Table: '{self._name}', Row #{index}",
+                         cell_locator=self.cell_locator) for index in result["rows"]]
+
+    def get_cell(self, row_key: Any, column: str, key_column: Optional[str] = None) -> str:
+        """
+        Returns the text of a cell in one evaluation, using the in-page index of the table.
+
+        :param row_key: Value of the key column identifying the row (the first match is used), compared as a string.
+        :param column: The name of the column to read.
+        :param key_column: The name of the key column. Defaults to the first column.
+        :return: The text of the cell.
+        """
+        arg = {"selectors": self._selectors(), "keyColumn": key_column, "rowKey": str(row_key), "column": column}
+        result = self.locator.evaluate(GET_CELL_JS, arg)
+        self._raise_on_missing_columns(result["missing"])
+        if not result["found"]:
+            raise ValueError(f"Row '{row_key}' not found in table '{self._name}'")
+
+        logger.debug(f"Table '{self._name}', row '{row_key}', column '{column}': '{result['text']}'")
+        return result["text"]
+
+    def invalidate_index(self) -> None:
+        """Drop the in-page index, e.g. after changes the table makes without touching its DOM."""
+        self.locator.evaluate(INVALIDATE_INDEX_JS)
+
+    def watch(self) -> TableWatcher:
+        """
+        Start watching the table for changes, for polling live-updating tables without re-parsing them.
+
+        Can be used as a context manager to stop watching on exit:
+        `with table.watch() as watcher: watcher.wait_for_row(lambda row: row["Status"] == "Done")`
+
+        :return: A started TableWatcher holding the current snapshot of the table.
+        """
+        logger.info(f"Watch table '{self._name}' for changes")
+        return TableWatcher(self._page, self.locator, self._name, self._selectors()).start()
+
+    def export(self, path: Union[str, Path], format: Optional[Union[ExportFormat, str]] = None,
+               compression: Optional[Union[Compression, str]] = None, chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+        """
+        Export the table to a CSV or JSONL file, streaming rows from the page in chunks.
+
+        Only one chunk of rows is held in memory at a time. Compare the result with a reference file
+        using `framework.utils.export_utils.compare_rows_files`.
+
+        :param path: The file to write.
+        :param format: 'csv' or 'jsonl'. Inferred from the file suffix if None.
+        :param compression: 'gzip', 'bz2' or 'xz'. Inferred from the file suffix (.gz, .bz2, .xz) if None.
+        :param chunk_size: Number of rows read from the page per evaluation.
+        :return: The number of rows exported.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Export chunk size must be at least 1, got {chunk_size}")
+        export_format = ExportFormat(format) if format else infer_format(path)
+        selectors = self._selectors()
+
+        table = self.locator.evaluate(EXPORT_START_JS, selectors)
+        logger.info(f"Export {table['total']} rows of table '{self._name}' to '{path}'")
+        try:
+            with open_rows_file(path, "w", compression) as file:
+                writer = RowsWriter(file, table["columns"], export_format)
+                for start in range(0, table["total"], chunk_size):
+                    arg = {"selectors": selectors, "start": start, "count": chunk_size}
+                    writer.write_rows(self.locator.evaluate(EXPORT_CHUNK_JS, arg))
+        finally:
+            self.locator.evaluate(EXPORT_END_JS)
+
+        logger.info(f"Exported {writer.rows_written} rows of table '{self._name}'")
+        return writer.rows_written
+
+    def _selectors(self) -> Dict[str, Any]:
+        locators = {
+            "header": self.header_locator,
+            "headerCell": self.header_cell_locator,
+            "row": self.row_locator,
+            "cell": self.cell_locator,
+        }
+        not_selectors = [name for name, locator in locators.items() if not isinstance(locator, str)]
+        if not_selectors:
+            raise TypeError(f"Table '{self._name}' lookups, watching and export need string selectors, "
+                            f"got Locator for: {not_selectors}")
+        return locators
+
+    def _raise_on_missing_columns(self, missing: List[str]) -> None:
+        if missing:
+            raise ValueError(f"Columns {missing} not found in table '{self._name}'")
@@ -2,6 +2,7 @@ import logging
 
 from playwright.sync_api import Locator, Page
 
+from framework.execution.impact import impact_recorder
 from framework.ui.constants.elements import WaitForState
 from framework.ui.constants.page_events import PageEvent
 from framework.ui.constants.timeouts import WaitTimeoutsMs
@@ -16,6 +17,7 @@ class BasePage:
         self._page = page
         self._name = name
         self._unique_element = element
+        impact_recorder.record(self)
 
     @property
     def name(self) -> str:
@@ -0,0 +1,120 @@
+import logging
+import os
+import pathlib
+import tempfile
+from typing import TYPE_CHECKING, Optional, Union
+
+import allure
+from playwright.sync_api import Page
+
+if TYPE_CHECKING:
+    from framework.ui.visual.comparison import ComparisonOptions, ComparisonResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINES_DIR = pathlib.Path('visual-baselines')
+VISUAL_RESULTS_DIR = pathlib.Path('visual-results')
+UNKNOWN_BROWSER = "unknown"
+
+
+class BaselineStore:
+    """
+    Stores baseline screenshots under `<root>/<browser>_<width>x<height>/<name>.png`,
+    so every browser engine and viewport size has its own baselines.
+
+    A missing baseline is saved from the current screenshot. In update mode every screenshot replaces its baseline.
+    Screenshots that do not match are saved to the results directory together with a diff image.
+    """
+
+    def __init__(self, root_dir: Union[str, pathlib.Path] = DEFAULT_BASELINES_DIR,
+                 results_dir: Union[str, pathlib.Path] = VISUAL_RESULTS_DIR, update: bool = False):
+        self._root_dir = pathlib.Path(root_dir)
+        self._results_dir = pathlib.Path(results_dir)
+        self._update = update
+
+    @property
+    def root_dir(self) -> pathlib.Path:
+        return self._root_dir
+
+    @property
+    def results_dir(self) -> pathlib.Path:
+        return self._results_dir
+
+    @property
+    def update(self) -> bool:
+        return self._update
+
+    def configure(self, root_dir: Optional[Union[str, pathlib.Path]] = None,
+                  results_dir: Optional[Union[str, pathlib.Path]] = None, update: Optional[bool] = None) -> None:
+        if root_dir is not None:
+            self._root_dir = pathlib.Path(root_dir)
+        if results_dir is not None:
+            self._results_dir = pathlib.Path(results_dir)
+        if update is not None:
+            self._update = update
+
+    @staticmethod
+    def get_key(page: Page) -> str:
+        """Return the baseline group of the page: browser engine and viewport size, e.g. 'chromium_1280x720'."""
+        browser = page.context.browser
+        browser_name = browser.browser_type.name if browser else UNKNOWN_BROWSER
+        viewport = page.viewport_size
+        size = f"{viewport['width']}x{viewport['height']}" if viewport else "no_viewport"
+        return f"{browser_name}_{size}"
+
+    def get_path(self, page: Page, name: str) -> pathlib.Path:
+        return self._root_dir / self.get_key(page) / f"{name}.png"
+
+    def assert_matches(self, page: Page, name: str, png: bytes,
+                       options: Optional['ComparisonOptions'] = None) -> 'ComparisonResult':
+        """
+        Compare a screenshot with its baseline.
+
+        :param page: The page the screenshot was taken on, selecting the browser and viewport baselines.
+        :param name: Baseline name, may contain '/' to group baselines in subdirectories.
+        :param png: The screenshot.
+        :param options: Comparison tolerances.
+        :return: The comparison result.
+        :raises AssertionError: If the screenshot does not match the baseline.
+        """
+        # Imported on first use: NumPy and Pillow add ~100 ms to the startup of runs without visual checks
+        from framework.ui.visual.comparison import ComparisonResult, MatchMethod, compare_images, load_image
+
+        baseline_path = self.get_path(page, name)
+        if self._update or not baseline_path.exists():
+            logger.warning(f"{'Updating' if baseline_path.exists() else 'Creating'} baseline '{baseline_path}'")
+            self._write(baseline_path, png)
+            return ComparisonResult(matched=True, method=MatchMethod.NEW_BASELINE)
+
+        expected_png = baseline_path.read_bytes()
+        result = compare_images(load_image(png), load_image(expected_png), options)
+        logger.debug(f"Screenshot '{name}' compared with '{baseline_path}': {result}")
+        if not result.matched:
+            self._report_mismatch(page, name, png, expected_png, result)
+            raise AssertionError(f"Screenshot '{name}' does not match baseline '{baseline_path}': {result}")
+        return result
+
+    def _report_mismatch(self, page: Page, name: str, png: bytes, expected_png: bytes,
+                         result: 'ComparisonResult') -> None:
+        from framework.ui.visual.comparison import encode_png
+
+        results_dir = self._results_dir / self.get_key(page)
+        self._write(results_dir / f"{name}.actual.png", png)
+        allure.attach(expected_png, name=f"{name} (expected)", attachment_type=allure.attachment_type.PNG)
+        allure.attach(png, name=f"{name} (actual)", attachment_type=allure.attachment_type.PNG)
+        if result.diff_image is not None:
+            diff_png = encode_png(result.diff_image)
+            self._write(results_dir / f"{name}.diff.png", diff_png)
+            allure.attach(diff_png, name=f"{name} (diff)", attachment_type=allure.attachment_type.PNG)
+
+    @staticmethod
+    def _write(path: pathlib.Path, data: bytes) -> None:
+        # Written to a temporary file first, so parallel workers never read a partially written baseline
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+
+baseline_store = BaselineStore()
@@ -0,0 +1,218 @@
+import io
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+PHASH_IMAGE_SIZE = 32
+PHASH_HASH_SIZE = 8
+DEFAULT_TILE_SIZE = 32
+# Maximum per-channel difference (0-255) still treated as the same color
+DEFAULT_COLOR_THRESHOLD = 16
+
+DIFF_COLOR = (255, 0, 0)
+ANTI_ALIASING_COLOR = (255, 200, 0)
+
+# Neighbour offsets checked by the anti-aliasing tolerance
+_NEIGHBOUR_OFFSETS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)]
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II matrix, so the 2D DCT of an image is `D @ image @ D.T`."""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.sqrt(2 / size) * np.cos(np.pi * (2 * n + 1) * k / (2 * size))
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(PHASH_IMAGE_SIZE)
+
+
+class MatchMethod(Enum):
+    """How a screenshot was found to match (or not) its baseline."""
+    IDENTICAL = "identical"
+    PERCEPTUAL_HASH = "perceptual hash"
+    PIXEL_DIFF = "pixel diff"
+    SIZE_MISMATCH = "size mismatch"
+    NEW_BASELINE = "new baseline"
+
+
+@dataclass
+class ComparisonOptions:
+    """
+    Tolerances of a screenshot comparison.
+
+    :param phash_threshold: Maximum perceptual hash distance (in bits, of 63) accepted without a pixel diff,
+                            None (default) to always run the pixel diff. Opt-in only: the hash is too coarse
+                            to see a small local change (e.g. one word of text), even at a threshold of 0.
+    :param color_threshold: Maximum per-channel difference (0-255) of pixels considered equal.
+    :param anti_aliasing: Ignore differing pixels that match a neighbouring pixel of the other image
+                          (edges shifted by anti-aliasing or subpixel rendering).
+    :param max_diff_ratio: Maximum share of differing pixels in the whole image.
+    :param max_tile_diff_ratio: Maximum share of differing pixels in any tile, to catch localized changes
+                                that are too small to exceed `max_diff_ratio`.
+    :param tile_size: Tile width and height in pixels.
+    """
+    phash_threshold: Optional[int] = None
+    color_threshold: int = DEFAULT_COLOR_THRESHOLD
+    anti_aliasing: bool = True
+    max_diff_ratio: float = 0.0
+    max_tile_diff_ratio: float = 0.0
+    tile_size: int = DEFAULT_TILE_SIZE
+
+
+@dataclass
+class ComparisonResult:
+    """Result of comparing a screenshot with its baseline."""
+    matched: bool
+    method: MatchMethod
+    phash_distance: Optional[int] = None
+    diff_pixels: int = 0
+    anti_aliased_pixels: int = 0
+    diff_ratio: float = 0.0
+    # (row, column) of tiles exceeding `max_tile_diff_ratio`
+    diff_tiles: List[Tuple[int, int]] = field(default_factory=list)
+    diff_image: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def __str__(self) -> str:
+        if self.method == MatchMethod.SIZE_MISMATCH:
+            return "Screenshot size differs from the baseline"
+        return (f"{self.method.value}: {self.diff_pixels} differing pixels ({self.diff_ratio:.4%}), "
+                f"{self.anti_aliased_pixels} anti-aliased, {len(self.diff_tiles)} differing tiles, "
+                f"perceptual hash distance: {self.phash_distance}")
+
+
+def load_image(png: bytes) -> np.ndarray:
+    """Decode a PNG into an RGB array of shape (height, width, 3)."""
+    with Image.open(io.BytesIO(png)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(image).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def perceptual_hash(image: np.ndarray) -> int:
+    """
+    DCT-based perceptual hash: the low frequencies of a 32x32 grayscale version of the image,
+    each bit telling if a frequency is above the median.
+
+    :return: A 63-bit hash (the DC term is left out).
+    """
+    # `reducing_gap` shrinks the image by whole factors first, which is much faster than resampling it at full size
+    gray = Image.fromarray(image).convert("L").resize((PHASH_IMAGE_SIZE, PHASH_IMAGE_SIZE), Image.LANCZOS,
+                                                      reducing_gap=2.0)
+    frequencies = _DCT @ np.asarray(gray, dtype=np.float64) @ _DCT.T
+    low = frequencies[:PHASH_HASH_SIZE, :PHASH_HASH_SIZE].flatten()[1:]
+    bits = low > np.median(low)
+    return int(np.packbits(bits).tobytes().hex(), 16)
+
+
+def hash_distance(first: int, second: int) -> int:
+    return bin(first ^ second).count("1")
+
+
+def compare_images(actual: np.ndarray, expected: np.ndarray,
+                   options: Optional[ComparisonOptions] = None) -> ComparisonResult:
+    """
+    Compare a screenshot with its baseline.
+
+    Identical images are accepted without a pixel diff, as are images within the perceptual hash threshold
+    if one is set.
+    Otherwise differing pixels are found with vectorized array operations, the anti-aliasing tolerance is
+    applied to those pixels only, and the differences are aggregated per tile.
+
+    :param actual: The screenshot, RGB array.
+    :param expected: The baseline, RGB array.
+    :param options: Comparison tolerances.
+    :return: The comparison result, with a diff image if the images do not match.
+    """
+    options = options or ComparisonOptions()
+    if actual.shape != expected.shape:
+        return ComparisonResult(matched=False, method=MatchMethod.SIZE_MISMATCH)
+    if np.array_equal(actual, expected):
+        return ComparisonResult(matched=True, method=MatchMethod.IDENTICAL, phash_distance=0)
+
+    distance = hash_distance(perceptual_hash(actual), perceptual_hash(expected))
+    if options.phash_threshold is not None and distance <= options.phash_threshold:
+        return ComparisonResult(matched=True, method=MatchMethod.PERCEPTUAL_HASH, phash_distance=distance)
+
+    differs = _color_distance(actual, expected) > options.color_threshold
+    anti_aliased = np.zeros_like(differs)
+    if options.anti_aliasing:
+        anti_aliased = _find_anti_aliased(actual, expected, differs, options.color_threshold)
+        differs &= ~anti_aliased
+
+    diff_pixels = int(differs.sum())
+    diff_ratio = diff_pixels / differs.size
+    diff_tiles = _find_diff_tiles(differs, options.tile_size, options.max_tile_diff_ratio)
+    matched = diff_ratio <= options.max_diff_ratio and not diff_tiles
+
+    return ComparisonResult(
+        matched=matched,
+        method=MatchMethod.PIXEL_DIFF,
+        phash_distance=distance,
+        diff_pixels=diff_pixels,
+        anti_aliased_pixels=int(anti_aliased.sum()),
+        diff_ratio=diff_ratio,
+        diff_tiles=diff_tiles,
+        diff_image=None if matched else _render_diff(expected, differs, anti_aliased),
+    )
+
+
+def _color_distance(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Maximum per-channel absolute difference of each pixel."""
+    # Computed in uint8 without widening, and reduced channel by channel (faster than `max(axis=-1)`)
+    difference = np.maximum(first, second)
+    difference -= np.minimum(first, second)
+    return np.maximum(np.maximum(difference[..., 0], difference[..., 1]), difference[..., 2])
+
+
+def _find_anti_aliased(actual: np.ndarray, expected: np.ndarray, differs: np.ndarray,
+                       color_threshold: int) -> np.ndarray:
+    """
+    Mark differing pixels whose color exists in the 3x3 neighbourhood of the same position in the other image,
+    in both directions. Only the differing pixels are checked.
+    """
+    ys, xs = np.nonzero(differs)
+    height, width = differs.shape
+    matches_expected = np.zeros(len(ys), dtype=bool)
+    matches_actual = np.zeros(len(ys), dtype=bool)
+    for dy, dx in _NEIGHBOUR_OFFSETS:
+        ny = np.clip(ys + dy, 0, height - 1)
+        nx = np.clip(xs + dx, 0, width - 1)
+        matches_expected |= _color_distance(actual[ys, xs], expected[ny, nx]) <= color_threshold
+        matches_actual |= _color_distance(expected[ys, xs], actual[ny, nx]) <= color_threshold
+
+    anti_aliased = np.zeros_like(differs)
+    anti_aliased[ys, xs] = matches_expected & matches_actual
+    return anti_aliased
+
+
+def _find_diff_tiles(differs: np.ndarray, tile_size: int, max_tile_diff_ratio: float) -> List[Tuple[int, int]]:
+    """Return (row, column) of the tiles whose share of differing pixels exceeds the limit."""
+    height, width = differs.shape
+    rows, columns = -(-height // tile_size), -(-width // tile_size)
+    padded = np.zeros((rows * tile_size, columns * tile_size), dtype=np.int32)
+    padded[:height, :width] = differs
+    counts = padded.reshape(rows, tile_size, columns, tile_size).sum(axis=(1, 3))
+    tile_ratios = counts / (tile_size * tile_size)
+    return [(int(row), int(column)) for row, column in zip(*np.nonzero(tile_ratios > max_tile_diff_ratio))]
+
+
+def _render_diff(expected: np.ndarray, differs: np.ndarray, anti_aliased: np.ndarray) -> np.ndarray:
+    """Faded grayscale baseline with differing pixels in red and tolerated anti-aliasing in yellow."""
+    channels_sum = expected[..., 0].astype(np.uint16) + expected[..., 1] + expected[..., 2]
+    image = np.empty_like(expected)
+    image[...] = (255 - (765 - channels_sum) // 10).astype(np.uint8)[..., None]
+    image[anti_aliased] = ANTI_ALIASING_COLOR
+    image[differs] = DIFF_COLOR
+    return image
@@ -0,0 +1,123 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from playwright.sync_api import Page
+
+from framework.ui.elements.base_element import BaseElement
+from framework.ui.visual.comparison import encode_png, load_image
+
+logger = logging.getLogger(__name__)
+
+# Document-relative boxes of all elements, read in one evaluation. Elements inside scroll containers
+# (their hidden part is not in a full-page capture) and fixed or sticky ones (drawn at a scroll-dependent
+# position) are flagged to be captured on their own.
+ELEMENT_BOXES_JS = """
+elements => {
+    const root = document.scrollingElement || document.documentElement;
+    const isScrollContainer = node => {
+        const style = getComputedStyle(node);
+        return /(auto|scroll|hidden|overlay)/.test(style.overflowX + style.overflowY)
+            && (node.scrollHeight > node.clientHeight || node.scrollWidth > node.clientWidth);
+    };
+    const needsOwnCapture = element => {
+        for (let node = element; node && node !== root && node !== document.body; node = node.parentElement) {
+            if (node !== element && isScrollContainer(node)) return true;
+            if (['fixed', 'sticky'].includes(getComputedStyle(node).position)) return true;
+        }
+        return false;
+    };
+    return {
+        devicePixelRatio: window.devicePixelRatio,
+        boxes: elements.map(element => {
+            const rect = element.getBoundingClientRect();
+            return {
+                x: rect.left + window.scrollX,
+                y: rect.top + window.scrollY,
+                width: rect.width,
+                height: rect.height,
+                ownCapture: needsOwnCapture(element),
+            };
+        }),
+    };
+}
+"""
+
+
+@dataclass
+class ElementBox:
+    """Element position in the document, in CSS pixels."""
+    x: float
+    y: float
+    width: float
+    height: float
+    own_capture: bool = False
+
+    def to_pixels(self, scale: float) -> Tuple[int, int, int, int]:
+        """Return the (top, bottom, left, right) pixel bounds in an image captured at the given scale."""
+        return (math.floor(self.y * scale), math.ceil((self.y + self.height) * scale),
+                math.floor(self.x * scale), math.ceil((self.x + self.width) * scale))
+
+
+def get_element_boxes(page: Page, elements: Sequence[BaseElement]) -> Tuple[List[ElementBox], float]:
+    """
+    Read the document-relative boxes of elements in one evaluation.
+
+    :return: The boxes, in the order of the elements, and the device pixel ratio.
+    """
+    handles = [element.locator.element_handle() for element in elements]
+    try:
+        result = page.evaluate(ELEMENT_BOXES_JS, handles)
+    finally:
+        for handle in handles:
+            handle.dispose()
+    boxes = [ElementBox(box["x"], box["y"], box["width"], box["height"], box["ownCapture"])
+             for box in result["boxes"]]
+    return boxes, result["devicePixelRatio"]
+
+
+def crop(image: np.ndarray, box: ElementBox, scale: float) -> Optional[np.ndarray]:
+    """
+    Cut the element out of a full-page capture.
+
+    :return: The element image, None if the box is empty or not entirely inside the capture.
+    """
+    top, bottom, left, right = box.to_pixels(scale)
+    height, width = image.shape[:2]
+    if top < 0 or left < 0 or bottom > height or right > width or bottom <= top or right <= left:
+        return None
+    return image[top:bottom, left:right]
+
+
+def take_element_screenshots(page: Page, elements: Sequence[BaseElement]) -> List[bytes]:
+    """
+    Take PNG screenshots of several elements from a single full-page capture.
+
+    Boxes of all elements are read in one evaluation, the page is captured once and each element is cropped
+    from it. Elements that cannot be cropped (inside a scroll container, fixed or sticky, empty or outside
+    the page) are captured one by one.
+
+    :param page: The page of the elements.
+    :param elements: The elements to capture.
+    :return: PNG screenshots, in the order of the elements.
+    """
+    if not elements:
+        return []
+    boxes, scale = get_element_boxes(page, elements)
+    capture = None
+    if not all(box.own_capture for box in boxes):
+        capture = load_image(page.screenshot(full_page=True, animations="disabled", caret="hide"))
+
+    screenshots = []
+    own_captures = 0
+    for element, box in zip(elements, boxes):
+        cropped = None if box.own_capture else crop(capture, box, scale)
+        if cropped is None:
+            own_captures += 1
+            screenshots.append(element.locator.screenshot(animations="disabled", caret="hide"))
+        else:
+            screenshots.append(encode_png(cropped))
+    logger.debug(f"Took screenshots of {len(elements)} elements, {own_captures} captured on their own")
+    return screenshots
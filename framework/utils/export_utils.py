@@ -0,0 +1,183 @@
+import bz2
+import csv
+import gzip
+import itertools
+import json
+import logging
+import lzma
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+RowData = Dict[str, str]
+
+
+class ExportFormat(Enum):
+    """Row file formats for table exports."""
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class Compression(Enum):
+    """Compression of row files."""
+    NONE = "none"
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    XZ = "xz"
+
+
+COMPRESSION_SUFFIXES = {
+    ".gz": Compression.GZIP,
+    ".bz2": Compression.BZ2,
+    ".xz": Compression.XZ,
+}
+
+_OPENERS = {
+    Compression.NONE: open,
+    Compression.GZIP: gzip.open,
+    Compression.BZ2: bz2.open,
+    Compression.XZ: lzma.open,
+}
+
+
+def infer_compression(path: Union[str, Path]) -> Compression:
+    """Infer compression from the last file suffix (e.g. 'rows.csv.gz' -> gzip)."""
+    return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower(), Compression.NONE)
+
+
+def infer_format(path: Union[str, Path]) -> ExportFormat:
+    """
+    Infer the row file format from the file suffix, ignoring a compression suffix (e.g. 'rows.jsonl.gz' -> jsonl).
+
+    :raises ValueError: If the suffix is not a known format.
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes if suffix.lower() not in COMPRESSION_SUFFIXES]
+    try:
+        return ExportFormat(suffixes[-1].lstrip("."))
+    except (IndexError, ValueError):
+        raise ValueError(f"Cannot infer export format from '{path}', "
+                         f"expected one of: {[export_format.value for export_format in ExportFormat]}")
+
+
+def open_rows_file(path: Union[str, Path], mode: str, compression: Optional[Union[Compression, str]] = None) -> IO[str]:
+    """
+    Open a row file in text mode, compressed or not.
+
+    :param path: The file path.
+    :param mode: 'r' to read or 'w' to write.
+    :param compression: Compression to use. Inferred from the file suffix if None.
+    :return: A text file object.
+    """
+    compression = Compression(compression) if compression else infer_compression(path)
+    return _OPENERS[compression](path, f"{mode}t", encoding="utf-8", newline="")
+
+
+class RowsWriter:
+    """Writes rows one chunk at a time, so a whole table never has to be held in memory."""
+
+    def __init__(self, file: IO[str], columns: Sequence[str], export_format: ExportFormat):
+        self._file = file
+        self._columns = list(columns)
+        self._format = export_format
+        self.rows_written = 0
+
+        if export_format == ExportFormat.CSV:
+            self._csv_writer = csv.writer(file)
+            self._csv_writer.writerow(self._columns)
+
+    def write_rows(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Write rows given as lists of cell texts in column order.
+
+        :param rows: The rows to write.
+        """
+        for cells in rows:
+            if self._format == ExportFormat.CSV:
+                self._csv_writer.writerow(cells)
+            else:
+                self._file.write(json.dumps(dict(zip(self._columns, cells)), ensure_ascii=False) + "\n")
+            self.rows_written += 1
+
+
+def read_rows(path: Union[str, Path], export_format: Optional[Union[ExportFormat, str]] = None,
+              compression: Optional[Union[Compression, str]] = None) -> Iterator[RowData]:
+    """
+    Read rows from a CSV or JSONL file one at a time.
+
+    :param path: The file path.
+    :param export_format: The file format. Inferred from the file suffix if None.
+    :param compression: The file compression. Inferred from the file suffix if None.
+    :return: An iterator of rows (column name to cell text).
+    """
+    export_format = ExportFormat(export_format) if export_format else infer_format(path)
+    with open_rows_file(path, "r", compression) as file:
+        if export_format == ExportFormat.CSV:
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield {column: _to_text(value) for column, value in json.loads(line).items()}
+
+
+def _to_text(value) -> str:
+    """Cell values read from JSONL exports of other systems may be numbers or null, tables only have text."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+@dataclass
+class RowDifference:
+    """A row that differs between two row files (1-based row number, header not counted)."""
+    row_number: int
+    expected: Optional[RowData]
+    actual: Optional[RowData]
+
+    def __str__(self) -> str:
+        return f"Row #{self.row_number}: expected {self.expected}, actual {self.actual}"
+
+
+@dataclass
+class RowsComparison:
+    """Result of comparing two row files."""
+    rows_compared: int = 0
+    differences_count: int = 0
+    differences: List[RowDifference] = field(default_factory=list)
+
+    def is_equal(self) -> bool:
+        return self.differences_count == 0
+
+    def __str__(self) -> str:
+        summary = f"Compared {self.rows_compared} rows, {self.differences_count} differ"
+        return "\n".join([summary] + [str(difference) for difference in self.differences])
+
+
+def compare_rows_files(actual_path: Union[str, Path], expected_path: Union[str, Path],
+                       max_differences: int = 100) -> RowsComparison:
+    """
+    Compare two row files row by row, reading both in a streaming way. Rows are compared in file order,
+    so both files must be sorted the same way. Formats and compression may differ and are inferred
+    from the file suffixes.
+
+    :param actual_path: The file to check, e.g. a table export.
+    :param expected_path: The reference file, e.g. a backend export.
+    :param max_differences: Maximum number of differences kept in the result (all are counted).
+    :return: The comparison result.
+    """
+    logger.info(f"Compare rows of '{actual_path}' with reference '{expected_path}'")
+    comparison = RowsComparison()
+    pairs = itertools.zip_longest(read_rows(expected_path), read_rows(actual_path))
+    for row_number, (expected, actual) in enumerate(pairs, start=1):
+        comparison.rows_compared = row_number
+        if expected != actual:
+            comparison.differences_count += 1
+            if len(comparison.differences) < max_differences:
+                comparison.differences.append(RowDifference(row_number, expected, actual))
+
+    logger.info(f"Rows comparison: compared {comparison.rows_compared} rows, {comparison.differences_count} differ")
+    return comparison
@@ -3,6 +3,7 @@ Google Images Page Object
 """
 from playwright.sync_api import Page
 from framework.ui.pages.base_page import BasePage
+from framework.ui.elements.element_list import ElementList
 from framework.ui.elements.input import Input
 from framework.ui.elements.label import Label
 
@@ -27,7 +28,7 @@ class GoogleImagesPage(BasePage):
             "Images Search Input"
         )
 
-        self.image_results = Label(
+        self.image_results = ElementList(
             page,
             self._image_results_locator,
             "Image Results"
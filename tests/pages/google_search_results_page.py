@@ -3,6 +3,7 @@ Google Search Results Page Object
 """
 from playwright.sync_api import Page, Locator
 from framework.ui.pages.base_page import BasePage
+from framework.ui.elements.element_list import ElementList
 from framework.ui.elements.input import Input
 from framework.ui.elements.label import Label
 from framework.ui.elements.button import Button
@@ -36,7 +37,7 @@ class GoogleSearchResultsPage(BasePage):
             "Result Statistics"
         )
 
-        self.search_results = Label(
+        self.search_results = ElementList(
             page,
             self._search_results_locator,
             "Search Results Headers"
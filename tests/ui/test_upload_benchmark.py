@@ -0,0 +1,44 @@
+"""
+Upload throughput benchmark: synthetic payloads of growing size, uploaded without staging them on disk
+(sent as buffers up to the 50 MB Playwright limit, staged on a memory-backed file system above it).
+"""
+import logging
+import time
+
+import allure
+import pytest
+from playwright.sync_api import Page
+
+from framework.ui.elements.file_uploader import FileUploader
+from framework.ui.elements.helpers.upload_payloads import SyntheticPayload
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+UPLOAD_PAGE_HTML = '<input type="file" id="upload">'
+
+
+@allure.feature("Framework")
+@allure.story("Upload Benchmark")
+@pytest.mark.e2e
+@pytest.mark.slow
+class TestUploadBenchmark:
+
+    @allure.title("Upload throughput for {size_mb} MB")
+    @pytest.mark.parametrize("size_mb", [1, 10, 45, 200, 500])
+    def test_upload_throughput(self, page: Page, size_mb: int):
+        page.set_content(UPLOAD_PAGE_HTML)
+        uploader = FileUploader(page, "#upload", "Upload")
+        payload = SyntheticPayload(f"payload_{size_mb}mb.bin", size_mb * MB, pattern=b"0123456789abcdef")
+
+        started = time.perf_counter()
+        uploader.upload_files(payload)
+        elapsed = time.perf_counter() - started
+
+        with allure.step("Verify the browser received the whole file"):
+            assert uploader.locator.evaluate("input => input.files[0].size") == payload.size
+
+        throughput = size_mb / elapsed
+        message = f"Uploaded {size_mb} MB in {elapsed:.2f} s ({throughput:.1f} MB/s)"
+        logger.info(message)
+        allure.attach(message, name="Upload throughput", attachment_type=allure.attachment_type.TEXT)
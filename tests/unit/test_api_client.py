@@ -0,0 +1,188 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Error as PlaywrightError
+
+from framework.api.api_client import ApiClient, ApiRequest
+from framework.api.data_seeder import DataSeeder
+from framework.utils import http_utils
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    """Records requests and the highest number of requests handled at once."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeApiHandler)
+        self.requests = []
+        self.items = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def handle_one_request(self):
+        with self.server.lock:
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        try:
+            super().handle_one_request()
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path, self.headers.get("Authorization")))
+        if self.path.startswith("/slow"):
+            time.sleep(0.1)
+        self.respond(500 if self.path.startswith("/fail") else 200, {"path": self.path})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            item = {"id": len(self.server.items) + 1, **body}
+            self.server.items[item["id"]] = item
+        self.server.requests.append(("POST", self.path, None))
+        if body.get("fail"):
+            self.server.items.pop(item["id"])
+            self.respond(500, {"error": "rejected"})
+        else:
+            self.respond(201, [item] if body.get("wrapped") else item)
+
+    def do_DELETE(self):
+        self.server.requests.append(("DELETE", self.path, None))
+        item_id = int(self.path.rsplit("/", 1)[-1])
+        self.respond(204 if self.server.items.pop(item_id, None) else 404)
+
+    def respond(self, status, body=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class PublicOnly:
+    """Exposes only the public API of a Playwright object."""
+
+    def __init__(self, target):
+        self.target = target
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.target, name)
+
+
+@allure.feature("Framework")
+@allure.story("API Client")
+@pytest.mark.unit
+class TestApiClient:
+
+    @pytest.fixture(scope="class")
+    def server(self):
+        server = FakeApiServer()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield server
+        server.shutdown()
+
+    @pytest.fixture
+    def api(self, playwright, server):
+        server.requests.clear()
+        server.max_active = 0
+        request_context = playwright.request.new_context()
+        yield ApiClient(request_context, base_url=server.url)
+        request_context.dispose()
+
+    @allure.title("Test relative paths, query parameters and basic authentication")
+    def test_fetch(self, api, server):
+        api.set_basic_authentication("user", "secret")
+
+        response = api.get("/users", params={"page": 2})
+
+        assert response.json() == {"path": "/users?page=2"}
+        assert server.requests == [("GET", "/users?page=2", http_utils.generate_basic_auth_header("user", "secret"))]
+
+    @allure.title("Test bulk requests run concurrently up to the limit, responses in request order")
+    def test_fetch_all(self, api, server):
+        requests = [ApiRequest("GET", f"/slow/{index}") for index in range(8)]
+
+        start = time.monotonic()
+        responses = api.fetch_all(requests, concurrency=4)
+
+        assert [response.json()["path"] for response in responses] == [f"/slow/{index}" for index in range(8)]
+        assert 1 < server.max_active <= 4
+        assert time.monotonic() - start < 0.8 * 0.1 * 8
+
+    @allure.title("Test bulk failure is raised after all requests completed")
+    def test_fetch_all_failure(self, api, server):
+        with pytest.raises(PlaywrightError):
+            api.fetch_all([ApiRequest("GET", "/fail"), ApiRequest("GET", "/slow/1")])
+
+        assert len(server.requests) == 2
+        assert api.fetch_all([ApiRequest("GET", "/fail")], fail_on_status_code=False)[0].status == 500
+
+    @allure.title("Test seeded data is deleted in reverse order at cleanup")
+    def test_seed_and_cleanup(self, api, server):
+        seeder = DataSeeder(api)
+        user = seeder.create("/users", {"name": "admin"})
+        orders = seeder.create_many("/users/orders", [{"total": 1}, {"total": 2}])
+        api.delete(f"/users/orders/{orders[0]['id']}")
+
+        seeder.cleanup()
+
+        deletes = [path for method, path, _ in server.requests if method == "DELETE"]
+        assert deletes[1:3] == [f"/users/orders/{orders[0]['id']}", f"/users/orders/{orders[1]['id']}"]
+        assert deletes[3] == f"/users/{user['id']}"
+        assert seeder.pending_cleanups == 0
+        assert not server.items
+
+    @allure.title("Test records created before a seeding failure are still deleted at cleanup")
+    def test_seed_partial_failure(self, api, server):
+        seeder = DataSeeder(api)
+
+        with pytest.raises(RuntimeError, match="2 of 4 records") as error:
+            seeder.create_many("/orders", [{"total": 1}, {"fail": True}, {"wrapped": True}, {"total": 2}])
+
+        assert "#1: 500" in str(error.value) and "#2: no cleanup path" in str(error.value)
+        assert seeder.pending_cleanups == 2
+        seeder.cleanup()
+        assert [item.get("wrapped") for item in server.items.values()] == [True]
+        server.items.clear()
+
+    @allure.title("Test bulk requests are sent one at a time without the Playwright internals")
+    def test_fetch_all_without_internals(self, api, server):
+        api._request = PublicOnly(api._request)
+
+        start = time.monotonic()
+        responses = api.fetch_all([ApiRequest("GET", "/fail"), ApiRequest("GET", "/slow/1"),
+                                   ApiRequest("GET", "/slow/2")], return_exceptions=True)
+
+        assert isinstance(responses[0], PlaywrightError)
+        assert [response.json()["path"] for response in responses[1:]] == ["/slow/1", "/slow/2"]
+        assert time.monotonic() - start >= 0.2
+
+    @allure.title("Test one client per browser context, sharing its request context")
+    def test_for_context(self):
+        context = Mock(spec=BrowserContext)
+
+        client = ApiClient.for_context(context)
+
+        assert client is ApiClient.for_context(context)
+        assert client.request_context is context.request
+        assert client.get_url("https://other/api") == "https://other/api"
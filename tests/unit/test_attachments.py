@@ -0,0 +1,99 @@
+import gzip
+
+import pytest
+import allure
+from allure_commons.model2 import Attachment, TestResult, TestStepResult
+
+from framework.execution.attachments import COMPRESSED_MIME_TYPE, AttachmentStore, DeduplicatingAllureFileLogger
+
+
+@allure.feature("Framework")
+@allure.story("Attachment Store")
+@pytest.mark.unit
+class TestAttachmentStore:
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = AttachmentStore(tmp_path, compress_min_size=100)
+        yield store
+        store.close()
+
+    @allure.title("Test identical content is stored once")
+    def test_deduplication(self, store, tmp_path):
+        first, _ = store.put_data(b"screenshot", "png")
+        second, _ = store.put_data(b"screenshot", "png")
+        other, _ = store.put_data(b"other", "png")
+        store.flush()
+
+        assert first == second != other
+        assert (tmp_path / first).read_bytes() == b"screenshot"
+        assert store.stats.attached == 3
+        assert store.stats.stored == 2
+
+    @allure.title("Test existing files are not written again")
+    def test_existing_file(self, tmp_path):
+        with_file = AttachmentStore(tmp_path)
+        file_name, _ = with_file.put_data("log", "txt")
+        with_file.close()
+
+        store = AttachmentStore(tmp_path)
+        assert store.put_data("log", "txt")[0] == file_name
+        assert store.stats.stored == 0
+        store.close()
+
+    @allure.title("Test large text attachments are compressed")
+    @pytest.mark.parametrize("body, extension, compressed", [
+        ("x" * 100, "txt", True),
+        ("x" * 99, "txt", False),
+        (b"x" * 100, "png", False),
+    ])
+    def test_compression(self, store, tmp_path, body, extension, compressed):
+        file_name, is_compressed = store.put_data(body, extension)
+        store.flush()
+
+        assert is_compressed is compressed
+        assert file_name.endswith(".gz") is compressed
+        content = (tmp_path / file_name).read_bytes()
+        expected = body.encode() if isinstance(body, str) else body
+        assert (gzip.decompress(content) if compressed else content) == expected
+
+    @allure.title("Test attached files are hashed and copied")
+    def test_put_file(self, store, tmp_path):
+        source = tmp_path / "source.log"
+        source.write_text("y" * 500)
+
+        file_name, compressed = store.put_file(source, "txt")
+        store.flush()
+
+        assert compressed
+        assert gzip.decompress((tmp_path / file_name).read_bytes()) == b"y" * 500
+        assert store.put_data("y" * 500, "txt")[0] == file_name
+
+
+@allure.feature("Framework")
+@allure.story("Attachment Store")
+@pytest.mark.unit
+class TestDeduplicatingAllureFileLogger:
+
+    @allure.title("Test results and steps link to the shared attachment files")
+    def test_link_attachments(self, tmp_path):
+        store = AttachmentStore(tmp_path, compress_min_size=10)
+        file_logger = DeduplicatingAllureFileLogger(tmp_path, store)
+        file_logger.report_attached_data(body=b"png", file_name="uuid-1-attachment.png")
+        file_logger.report_attached_data(body=b"png", file_name="uuid-2-attachment.png")
+        file_logger.report_attached_data(body="long text log", file_name="uuid-3-attachment.txt")
+        step = TestStepResult(name="step", attachments=[Attachment(source="uuid-2-attachment.png", type="image/png")])
+        result = TestResult(uuid="result", steps=[step], attachments=[
+            Attachment(source="uuid-1-attachment.png", type="image/png"),
+            Attachment(source="uuid-3-attachment.txt", type="text/plain"),
+        ])
+
+        file_logger.report_result(result)
+        store.close()
+
+        png_attachment, text_attachment = result.attachments
+        assert png_attachment.source == step.attachments[0].source
+        assert (tmp_path / png_attachment.source).read_bytes() == b"png"
+        assert text_attachment.source.endswith(".txt.gz")
+        assert text_attachment.type == COMPRESSED_MIME_TYPE
+        assert not list(tmp_path.glob("uuid-*"))
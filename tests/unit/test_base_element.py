@@ -60,6 +60,36 @@ class TestBaseElement:
         assert value == expected_value
         mock_locator.get_attribute.assert_called_once_with("data-test")
     
+    @allure.title("Test CSS property name is passed as an argument")
+    def test_get_css_property(self, base_element, mock_locator):
+        mock_locator.evaluate.return_value = "rgb(255, 0, 0)"
+
+        value = base_element.get_css_property("color")
+
+        assert value == "rgb(255, 0, 0)"
+        script, argument = mock_locator.evaluate.call_args.args
+        assert "color" not in script
+        assert argument == "color"
+
+    @allure.title("Test several properties are read in one evaluation")
+    def test_read(self, base_element, mock_locator):
+        mock_locator.evaluate.return_value = {
+            "text": "Docs", "attributes": {"href": "/docs", "title": None}, "css": {"color": "red"},
+            "rect": {"x": 1, "y": 2, "width": 30, "height": 10},
+        }
+
+        fields = base_element.read(text=True, attrs=["href", "title"], css=["color"], rect=True)
+
+        mock_locator.evaluate.assert_called_once()
+        _, argument = mock_locator.evaluate.call_args.args
+        assert argument == {"text": True, "html": False, "attributes": ["href", "title"], "css": ["color"],
+                            "states": False, "rect": True}
+        assert fields.text == "Docs"
+        assert fields.html is None
+        assert fields.attributes == {"href": "/docs", "title": None}
+        assert fields.css["color"] == "red"
+        assert fields.rect["width"] == 30
+
     @allure.title("Test click functionality")
     def test_click(self, base_element, mock_locator):
         base_element.click()
@@ -0,0 +1,124 @@
+import json
+import socket
+from dataclasses import asdict
+
+import pytest
+import allure
+from unittest.mock import Mock, patch
+from playwright.sync_api import Error as PlaywrightError, Playwright
+
+from framework.ui.browser import browser_server
+from framework.ui.browser.browser_pool import BrowserPool
+from framework.ui.browser.browser_server import ServerEndpoint, read_endpoint
+from framework.ui.constants.browsers import BrowserType
+
+
+def get_free_port() -> int:
+    """Return a local port nothing listens on."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@allure.feature("Framework")
+@allure.story("Browser Server")
+@pytest.mark.unit
+class TestBrowserServer:
+
+    @pytest.fixture
+    def endpoint_file(self, tmp_path):
+        return tmp_path / ".browser_server" / "endpoint.json"
+
+    @pytest.fixture
+    def mock_playwright(self):
+        return Mock(spec=Playwright)
+
+    def write_endpoint(self, endpoint_file, browser_type=BrowserType.CHROMIUM, port=9222):
+        endpoint = ServerEndpoint(browser_type=browser_type.value,
+                                  ws_endpoint=f"ws://127.0.0.1:{port}/devtools/browser",
+                                  http_endpoint=f"http://127.0.0.1:{port}", pid=12345)
+        endpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        endpoint_file.write_text(json.dumps(asdict(endpoint)), encoding="utf-8")
+        return endpoint
+
+    @allure.title("Test endpoint file is read, missing or invalid files are ignored")
+    def test_read_endpoint(self, endpoint_file):
+        assert read_endpoint(endpoint_file) is None
+
+        endpoint = self.write_endpoint(endpoint_file)
+        assert read_endpoint(endpoint_file) == endpoint
+
+        endpoint_file.write_text('{"ws_endpoint": "ws://127.0.0.1:9222"}', encoding="utf-8")
+        assert read_endpoint(endpoint_file) is None
+        endpoint_file.write_text("not json", encoding="utf-8")
+        assert read_endpoint(endpoint_file) is None
+
+    @allure.title("Test pool connects over CDP to a healthy browser server")
+    def test_connect(self, endpoint_file, mock_playwright):
+        endpoint = self.write_endpoint(endpoint_file)
+        pool = BrowserPool(mock_playwright, server_endpoint_file=endpoint_file)
+
+        with patch.object(browser_server, "is_healthy", return_value=True):
+            browser = pool.get_browser(BrowserType.CHROMIUM)
+
+        assert browser is mock_playwright.chromium.connect_over_cdp.return_value
+        mock_playwright.chromium.connect_over_cdp.assert_called_once_with(endpoint.ws_endpoint)
+        mock_playwright.chromium.launch.assert_not_called()
+
+    @allure.title("Test stale endpoint file of a crashed server falls back to a local launch")
+    def test_stale_endpoint(self, endpoint_file, mock_playwright):
+        self.write_endpoint(endpoint_file, port=get_free_port())
+        pool = BrowserPool(mock_playwright, headless=True, server_endpoint_file=endpoint_file)
+
+        browser = pool.get_browser(BrowserType.CHROMIUM)
+
+        assert browser is mock_playwright.chromium.launch.return_value
+        mock_playwright.chromium.launch.assert_called_once_with(headless=True)
+        mock_playwright.chromium.connect_over_cdp.assert_not_called()
+
+    @allure.title("Test failed connection to a healthy server falls back to a local launch")
+    def test_connect_failed(self, endpoint_file, mock_playwright):
+        self.write_endpoint(endpoint_file)
+        mock_playwright.chromium.connect_over_cdp.side_effect = PlaywrightError("WebSocket error")
+        pool = BrowserPool(mock_playwright, server_endpoint_file=endpoint_file)
+
+        with patch.object(browser_server, "is_healthy", return_value=True):
+            browser = pool.get_browser(BrowserType.CHROMIUM)
+
+        assert browser is mock_playwright.chromium.launch.return_value
+
+    @pytest.mark.parametrize("browser_type", [BrowserType.FIREFOX, BrowserType.WEBKIT])
+    @allure.title("Test non-Chromium engines skip the Chromium browser server")
+    def test_other_engines(self, endpoint_file, mock_playwright, browser_type):
+        self.write_endpoint(endpoint_file)
+        pool = BrowserPool(mock_playwright, server_endpoint_file=endpoint_file)
+
+        with patch.object(browser_server, "is_healthy", return_value=True) as is_healthy:
+            browser = pool.get_browser(browser_type)
+
+        assert browser is getattr(mock_playwright, browser_type.value).launch.return_value
+        is_healthy.assert_not_called()
+        mock_playwright.chromium.connect_over_cdp.assert_not_called()
+
+    @allure.title("Test pool without an endpoint file (--no-browser-server) always launches")
+    def test_no_browser_server(self, endpoint_file, mock_playwright):
+        self.write_endpoint(endpoint_file)
+        pool = BrowserPool(mock_playwright, server_endpoint_file=None)
+
+        with patch.object(browser_server, "is_healthy", return_value=True) as is_healthy:
+            browser = pool.get_browser(BrowserType.CHROMIUM)
+
+        assert browser is mock_playwright.chromium.launch.return_value
+        is_healthy.assert_not_called()
+
+    @allure.title("Test disconnected pooled browser is replaced on the next request")
+    def test_reconnect(self, endpoint_file, mock_playwright):
+        self.write_endpoint(endpoint_file)
+        pool = BrowserPool(mock_playwright, server_endpoint_file=endpoint_file)
+
+        with patch.object(browser_server, "is_healthy", return_value=True):
+            browser = pool.get_browser(BrowserType.CHROMIUM)
+            browser.is_connected.return_value = False
+            pool.get_browser(BrowserType.CHROMIUM)
+
+        assert mock_playwright.chromium.connect_over_cdp.call_count == 2
@@ -0,0 +1,103 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Error as PlaywrightError, Page, Locator
+
+from framework.ui.constants.elements import ElementType
+from framework.ui.elements.checkbox_group import CheckboxGroup
+
+
+@allure.feature("Framework")
+@allure.story("Checkbox Group")
+@pytest.mark.unit
+class TestCheckboxGroup:
+
+    @pytest.fixture
+    def mock_page(self):
+        return Mock(spec=Page)
+
+    @pytest.fixture
+    def mock_locator(self):
+        locator = Mock(spec=Locator)
+        locator.evaluate_all.return_value = [["read", True], ["write", False], ["delete", True]]
+        return locator
+
+    @pytest.fixture
+    def group(self, mock_page, mock_locator):
+        mock_page.locator.return_value = mock_locator
+        return CheckboxGroup(mock_page, "input[name='permission']", "Permissions")
+
+    @allure.title("Test checkbox group initialization")
+    def test_initialization(self, group):
+        assert group._type == ElementType.CHECKBOX_GROUP
+
+    @allure.title("Test states are read in one evaluation")
+    def test_get_states(self, group, mock_locator):
+        assert group.get_states() == [True, False, True]
+        assert group.get_bitmask() == 0b101
+        assert group.get_state_map() == {"read": True, "write": False, "delete": True}
+        assert mock_locator.evaluate_all.call_count == 3
+
+    @allure.title("Test bitmask target is sent as explicit states")
+    def test_set_states_bitmask(self, group, mock_locator):
+        mock_locator.evaluate_all.return_value = {"clicked": [1], "blocked": []}
+
+        clicked = group.set_states(0b110)
+
+        assert clicked == 1
+        _, arg = mock_locator.evaluate_all.call_args.args
+        assert arg == {"states": [False, True, True], "fallback": False, "keyAttribute": None}
+
+    @allure.title("Test dict target is matched by key attribute")
+    def test_set_states_dict(self, group, mock_locator):
+        mock_locator.evaluate_all.return_value = {"clicked": [1], "blocked": []}
+
+        group.set_states({"write": True})
+
+        _, arg = mock_locator.evaluate_all.call_args.args
+        assert arg == {"states": {"write": True}, "fallback": None, "keyAttribute": "value"}
+
+    @allure.title("Test disabled or untoggled boxes fail the action")
+    def test_set_states_blocked(self, group, mock_locator):
+        mock_locator.evaluate_all.return_value = {"clicked": [0], "blocked": [2]}
+
+        with pytest.raises(RuntimeError, match=r"Boxes \[2\]"):
+            group.set_states(0b010)
+
+    @allure.title("Test matching target states")
+    @pytest.mark.parametrize("states, expected", [
+        (0b101, True),
+        (0b001, False),
+        ([True, False], True),
+        ({"write": False}, True),
+        ({"write": True}, False),
+    ])
+    def test_matches(self, group, states, expected):
+        assert group.matches(states) is expected
+
+    @allure.title("Test waiting for states that are never reached")
+    def test_wait_for_states_timeout(self, group, mock_page, mock_locator):
+        handle = Mock()
+        mock_locator.element_handles.return_value = [handle]
+        mock_page.wait_for_function.side_effect = PlaywrightError("Timeout 1ms exceeded")
+
+        with pytest.raises(TimeoutError, match="current states"):
+            group.wait_for_states(0b111, timeout=0)
+
+        assert group.wait_for_states(0b111, timeout=0, no_throw=True) is False
+        _, kwargs = mock_page.wait_for_function.call_args
+        assert kwargs["arg"]["elements"] == [handle]
+        assert kwargs["timeout"] == 1
+        assert handle.dispose.call_count == 2
+
+    @allure.title("Test waiting for states in the page")
+    def test_wait_for_states(self, group, mock_page, mock_locator):
+        mock_locator.element_handles.return_value = []
+
+        assert group.wait_for_states({"write": True}) is True
+        mock_page.wait_for_function.assert_called_once()
+
+    @allure.title("Test invalid target state")
+    def test_invalid_state(self, group):
+        with pytest.raises(ValueError):
+            group.set_states(-1)
@@ -0,0 +1,157 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Frame, Page
+
+from framework.ui.browser.context_reset import (BLANK_PAGE_URL, CLEAR_ORIGIN_STORAGE_JS, ContextResetter,
+                                                ContextResidue)
+from framework.ui.browser.loaders import LOADER_BINDING_NAME
+
+
+@allure.feature("Framework")
+@allure.story("Context Reset")
+@pytest.mark.unit
+class TestContextResidue:
+
+    @allure.title("Test fresh context residue is clean")
+    def test_clean(self):
+        assert ContextResidue().is_clean() is True
+
+    @allure.title("Test residue with cookies is not clean")
+    def test_cookies_not_clean(self):
+        assert ContextResidue(cookies=2).is_clean() is False
+
+    @allure.title("Test residue with page left on a site is not clean")
+    def test_page_url_not_clean(self):
+        assert ContextResidue(page_url="https://example.com/").is_clean() is False
+
+    @allure.title("Test residue with storage, workers, routes or bindings left is not clean")
+    def test_leftovers_not_clean(self):
+        assert ContextResidue(uncleared_origins=["https://example.com (sessionStorage)"]).is_clean() is False
+        assert ContextResidue(service_workers=1).is_clean() is False
+        assert ContextResidue(routes=1).is_clean() is False
+        assert ContextResidue(bindings=["sendEvent"]).is_clean() is False
+
+
+@allure.feature("Framework")
+@allure.story("Context Reset")
+@pytest.mark.unit
+class TestContextResetter:
+
+    @staticmethod
+    def mock_internals(owner, routes=(), bindings=()):
+        """Route handlers and bindings of the Playwright implementation object."""
+        owner._impl_obj = Mock()
+        owner._impl_obj._routes = list(routes)
+        owner._impl_obj._web_socket_routes = []
+        owner._impl_obj._bindings = {name: Mock() for name in bindings}
+
+    @pytest.fixture
+    def first_page(self):
+        page = Mock(spec=Page)
+        page.url = BLANK_PAGE_URL
+        page.evaluate.return_value = []
+        self.mock_internals(page)
+        return page
+
+    @pytest.fixture
+    def extra_page(self):
+        page = Mock(spec=Page)
+        self.mock_internals(page, routes=[Mock()], bindings=["sendEvent"])
+        return page
+
+    @pytest.fixture
+    def mock_context(self, first_page, extra_page):
+        context = Mock(spec=BrowserContext)
+        context.pages = [first_page, extra_page]
+        context.service_workers = []
+        context.cookies.return_value = [{"name": "session"}]
+        context.storage_state.return_value = {"origins": [{"origin": "https://example.com", "localStorage": [{}]}]}
+        self.mock_internals(context, bindings=[LOADER_BINDING_NAME])
+        return context
+
+    @staticmethod
+    def clean_up(context, first_page):
+        """State of the mocked context after its reset."""
+        context.pages = [first_page]
+        context.cookies.return_value = []
+        context.storage_state.return_value = {"origins": []}
+
+    @pytest.fixture
+    def resetter(self, mock_context):
+        return ContextResetter(mock_context)
+
+    @allure.title("Test inspect reports residue left by a test")
+    def test_inspect(self, resetter):
+        residue = resetter.inspect()
+
+        assert residue.cookies == 1
+        assert residue.storage_origins == ["https://example.com"]
+        assert residue.extra_pages == 1
+        assert residue.routes == 1
+        assert residue.bindings == ["sendEvent"]
+        assert residue.is_clean() is False
+
+    @allure.title("Test reset clears context state and closes extra pages")
+    def test_reset(self, resetter, mock_context, first_page, extra_page):
+        page = resetter.reset()
+
+        assert page == first_page
+        extra_page.close.assert_called_once()
+        mock_context.clear_cookies.assert_called_once()
+        mock_context.clear_permissions.assert_called_once()
+        mock_context.set_extra_http_headers.assert_called_once_with({})
+        mock_context.unroute_all.assert_called_once()
+        first_page.goto.assert_called_once_with(BLANK_PAGE_URL)
+
+    @allure.title("Test reset clears storage of visited origins")
+    def test_reset_clears_visited_origins(self, resetter, first_page):
+        frame = Mock(spec=Frame)
+        frame.url = "https://example.com/login"
+        resetter._track_frame(frame)
+
+        resetter.reset()
+
+        first_page.goto.assert_any_call("https://example.com/__framework_context_reset__")
+        first_page.evaluate.assert_called_once_with(CLEAR_ORIGIN_STORAGE_JS)
+
+    @allure.title("Test verify after reset reports a clean context")
+    def test_verify_clean(self, resetter, mock_context, first_page):
+        frame = Mock(spec=Frame)
+        frame.url = "https://example.com/login"
+        resetter._track_frame(frame)
+
+        resetter.reset()
+        self.clean_up(mock_context, first_page)
+
+        assert resetter.verify().is_clean() is True
+
+    @allure.title("Test verify reports storage, service workers, routes and bindings left after reset")
+    def test_verify_leftovers(self, resetter, mock_context, first_page):
+        frame = Mock(spec=Frame)
+        frame.url = "https://example.com/login"
+        resetter._track_frame(frame)
+        first_page.evaluate.return_value = ["sessionStorage", "IndexedDB"]
+
+        resetter.reset()
+        self.clean_up(mock_context, first_page)
+        mock_context.service_workers = [Mock()]
+        mock_context._impl_obj._web_socket_routes = [Mock()]
+        first_page._impl_obj._bindings["sendEvent"] = Mock()
+        residue = resetter.verify()
+
+        assert residue.uncleared_origins == ["https://example.com (sessionStorage, IndexedDB)"]
+        assert (residue.service_workers, residue.routes, residue.bindings) == (1, 1, ["sendEvent"])
+        assert residue.is_clean() is False
+
+    @allure.title("Test origins that failed to clear are reported by verify")
+    def test_verify_clear_failed(self, resetter, mock_context, first_page):
+        frame = Mock(spec=Frame)
+        frame.url = "https://example.com/login"
+        resetter._track_frame(frame)
+        first_page.evaluate.side_effect = PlaywrightError("Execution context was destroyed")
+
+        resetter.reset()
+        self.clean_up(mock_context, first_page)
+
+        assert resetter.verify().uncleared_origins == ["https://example.com (not cleared)"]
@@ -0,0 +1,132 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Dialog, Page, TimeoutError as PlaywrightTimeoutError
+
+from framework.ui.browser.dialog import DialogAction, DialogHandler, DialogJournal
+from framework.ui.constants.page_events import ContextEvent
+from framework.ui.constants.timeouts import WaitTimeoutsMs
+
+
+@allure.feature("Framework")
+@allure.story("Dialog Journal")
+@pytest.mark.unit
+class TestDialogJournal:
+
+    @pytest.fixture
+    def mock_context(self):
+        context = Mock(spec=BrowserContext)
+        context.handlers = {}
+        context.on.side_effect = lambda event, handler: context.handlers.setdefault(event, handler)
+        # Listeners of the Playwright implementation object: only the journal
+        context._impl_obj = Mock()
+        context._impl_obj.listeners.side_effect = lambda event: list(context.handlers)
+        return context
+
+    @pytest.fixture
+    def mock_page(self, mock_context):
+        page = Mock(spec=Page)
+        page.context = mock_context
+        page.listeners = []
+        page.on.side_effect = lambda event, handler: page.listeners.append(handler)
+        page.remove_listener.side_effect = lambda event, handler: page.listeners.remove(handler)
+        page._impl_obj = Mock()
+        page._impl_obj.listeners.side_effect = lambda event: list(page.listeners)
+        return page
+
+    @pytest.fixture
+    def handler(self, mock_page):
+        return DialogHandler(mock_page)
+
+    def show_dialog(self, context, page, dialog_type="alert", message="Saved"):
+        dialog = Mock(spec=Dialog)
+        dialog.type = dialog_type
+        dialog.message = message
+        dialog.page = page
+        context.handlers[ContextEvent.DIALOG.value](dialog)
+        return dialog
+
+    @allure.title("Test dialogs without handlers are recorded and dismissed")
+    def test_auto_dismiss(self, handler, mock_context, mock_page):
+        dialog = self.show_dialog(mock_context, mock_page)
+
+        dialog.dismiss.assert_called_once()
+        record = handler.journal.records[0]
+        assert (record.type, record.message, record.action) == ("alert", "Saved", DialogAction.AUTO_DISMISSED)
+
+    @allure.title("Test dialogs are left to registered handlers")
+    def test_registered_handler(self, handler, mock_context, mock_page):
+        handler.register_dialog_handler(DialogHandler.accept)
+
+        dialog = self.show_dialog(mock_context, mock_page, dialog_type="confirm")
+        DialogHandler.accept(dialog)
+
+        dialog.dismiss.assert_not_called()
+        assert handler.journal.records[0].action == DialogAction.ACCEPTED
+        handler.remove_dialog_handlers()
+
+    @allure.title("Test dialogs are left to listeners added directly on the page")
+    def test_direct_page_listener(self, handler, mock_context, mock_page):
+        mock_page.on("dialog", lambda dialog: dialog.accept())
+
+        dialog = self.show_dialog(mock_context, mock_page, dialog_type="beforeunload")
+
+        dialog.accept.assert_not_called()
+        dialog.dismiss.assert_not_called()
+        assert handler.journal.records[0].action is None
+
+    @allure.title("Test dialog wait is an event wait that does not keep dialogs open")
+    def test_wait_for_dialog_event(self, handler, mock_context, mock_page):
+        def wait_for_event(event, timeout):
+            mock_page.listeners.append(Mock())
+            dialog = self.show_dialog(mock_context, mock_page)
+            mock_page.listeners.pop()
+            return dialog
+        mock_page.wait_for_event.side_effect = wait_for_event
+
+        record = handler.wait_for_dialog(timeout=2000)
+
+        assert record.action == DialogAction.AUTO_DISMISSED
+        mock_page.wait_for_event.assert_called_once_with("dialog", timeout=2000)
+
+    @allure.title("Test dialog wait without a dialog")
+    def test_wait_for_dialog_timeout(self, handler, mock_page):
+        mock_page.wait_for_event.side_effect = PlaywrightTimeoutError("Timeout 1000ms exceeded")
+
+        assert handler.is_dialog_closed() is True
+        assert handler.is_dialog_opened() is False
+        assert [call.kwargs["timeout"] for call in mock_page.wait_for_event.call_args_list] == \
+            [WaitTimeoutsMs.WAIT_DIALOG_APPEAR] * 2
+
+    @allure.title("Test dialog shown before the check is found without waiting")
+    def test_dialog_shown_before_check(self, handler, mock_context, mock_page):
+        self.show_dialog(mock_context, mock_page)
+
+        assert handler.is_dialog_opened(timeout=0) is True
+        mock_page.wait_for_event.assert_not_called()
+
+    @allure.title("Test checks only see dialogs after the previous check")
+    def test_checked_dialogs_are_consumed(self, handler, mock_context, mock_page):
+        self.show_dialog(mock_context, mock_page)
+        handler.is_dialog_opened(timeout=0)
+
+        assert handler.is_dialog_closed(timeout=0) is True
+        assert handler.was_dialog_shown(since=0) is True
+
+    @allure.title("Test dialogs shown since a mark")
+    def test_since_mark(self, handler, mock_context, mock_page):
+        self.show_dialog(mock_context, mock_page, message="First")
+        mark = handler.journal.mark()
+        self.show_dialog(mock_context, mock_page, message="Second")
+
+        assert [record.message for record in handler.journal.since(mark)] == ["Second"]
+
+    @allure.title("Test journal is shared per context and can be cleared")
+    def test_for_context(self, handler, mock_context, mock_page):
+        self.show_dialog(mock_context, mock_page)
+
+        journal = DialogJournal.for_context(mock_context)
+        journal.clear()
+
+        assert journal is handler.journal
+        assert handler.was_dialog_shown(since=0) is False
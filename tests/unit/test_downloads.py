@@ -0,0 +1,146 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Download, Page
+
+from framework.execution import workers
+from framework.ui.browser.browser import Browser
+from framework.ui.browser.downloads import DownloadManager, ExpectedFile
+
+CONTENT = b"id,name\n1,Ann\n" * 1000
+
+
+@allure.feature("Framework")
+@allure.story("Downloads")
+@pytest.mark.unit
+class TestDownloadManager:
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(workers.XDIST_WORKER_ENV, raising=False)
+        return DownloadManager(Mock(spec=Page), tmp_path / "downloads")
+
+    @pytest.fixture
+    def download(self, tmp_path):
+        source = tmp_path / "browser_download"
+        source.write_bytes(CONTENT)
+        download = Mock(spec=Download)
+        download.suggested_filename = "report.csv"
+        download.url = "https://example.com/report.csv"
+        download.path.return_value = source
+        download.failure.return_value = None
+        return download
+
+    @allure.title("Test download is saved with its size and hash")
+    def test_save(self, manager, download):
+        saved = manager.save(download, ExpectedFile(size=len(CONTENT), digest=hashlib.sha256(CONTENT).hexdigest()))
+
+        assert saved.path == manager.downloads_dir / "report.csv"
+        assert saved.path.read_bytes() == CONTENT
+        assert saved.size == len(CONTENT)
+
+    @allure.title("Test downloads are saved per xdist worker")
+    def test_worker_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(workers.XDIST_WORKER_ENV, "gw1")
+
+        assert DownloadManager(Mock(spec=Page), tmp_path).downloads_dir == tmp_path / "gw1"
+
+    @allure.title("Test hash mismatch")
+    def test_save_wrong_hash(self, manager, download):
+        with pytest.raises(AssertionError, match="sha256"):
+            manager.save(download, ExpectedFile(digest="0" * 64))
+
+    @allure.title("Test size mismatch stops copying early")
+    def test_save_too_large(self, manager, download):
+        with pytest.raises(AssertionError, match="size is over"):
+            manager.save(download, ExpectedFile(size=10))
+
+    @allure.title("Test failed download")
+    def test_save_failed(self, manager, download):
+        download.failure.return_value = "canceled"
+
+        with pytest.raises(RuntimeError, match="canceled"):
+            manager.save(download)
+
+    @allure.title("Test downloads pending after the deadline are cancelled")
+    def test_save_all_deadline(self, manager, download):
+        with pytest.raises(TimeoutError):
+            manager.save_all([download], deadline=time.monotonic() - 1)
+
+        download.cancel.assert_called_once()
+
+    def make_async(self, download, finish_after):
+        """Give the download the implementation object the deadline wait runs on, finishing after a delay."""
+        async def failure():
+            await asyncio.sleep(finish_after)
+
+        download._impl_obj = Mock()
+        download._impl_obj.failure = failure
+        # A loop of its own thread: the sync Playwright fixture of other tests may hold this thread's loop
+        download._sync = lambda coroutine: ThreadPoolExecutor(1).submit(asyncio.run, coroutine).result()
+        return download
+
+    @allure.title("Test a stalled download is cancelled at the deadline, without waiting for it")
+    def test_save_all_stalled(self, manager, download, tmp_path):
+        stalled = self.make_async(Mock(spec=Download), finish_after=60)
+        stalled.suggested_filename = "stalled.csv"
+        self.make_async(download, finish_after=0)
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError, match="stalled.csv"):
+            manager.save_all([download, stalled], deadline=time.monotonic() + 0.2)
+
+        assert time.monotonic() - start < 5
+        stalled.cancel.assert_called_once()
+        download.cancel.assert_not_called()
+        stalled.path.assert_not_called()
+
+    @allure.title("Test downloads with the same file name are saved to different files")
+    def test_save_same_name(self, manager, download):
+        self.make_async(download, finish_after=0)
+
+        first, second = manager.save_all([download, download])
+
+        assert first.path.name == "report.csv"
+        assert second.path.name == "report (1).csv"
+        assert second.path.read_bytes() == CONTENT
+
+    @allure.title("Test downloads with the same file name through separate browser.downloads accesses")
+    def test_same_name_through_browser(self, download, tmp_path, monkeypatch):
+        monkeypatch.delenv(workers.XDIST_WORKER_ENV, raising=False)
+        monkeypatch.chdir(tmp_path)
+        self.make_async(download, finish_after=0)
+        page = Mock(spec=Page)
+        page.context = Mock(spec=BrowserContext)
+        page.context.pages = [page]
+        browser = Browser(page)
+
+        first = browser.downloads.save(download)
+        second = browser.downloads.save(download)
+        third = DownloadManager(page).save(download)
+
+        assert browser.downloads is browser.downloads
+        assert [file.path.name for file in (first, second, third)] == \
+            ["report.csv", "report (1).csv", "report (2).csv"]
+        assert first.path.read_bytes() == CONTENT
+
+    @allure.title("Test downloads started in the block are captured")
+    def test_expect_downloads(self, manager, download):
+        manager.page.wait_for_event.return_value = download
+
+        with manager.expect_downloads(count=1) as downloads:
+            pass
+
+        assert downloads == [download]
+        manager.page.remove_listener.assert_called_once()
+
+    @allure.title("Test downloads that do not start in time")
+    def test_expect_downloads_timeout(self, manager):
+        with pytest.raises(TimeoutError):
+            with manager.expect_downloads(count=1, timeout=0):
+                pass
@@ -0,0 +1,91 @@
+import pytest
+import allure
+
+from framework.execution.durations import DEFAULT_FALLBACK_ESTIMATE, DurationHistory, predict_makespan
+
+
+@allure.feature("Framework")
+@allure.story("Duration History")
+@pytest.mark.unit
+class TestDurationHistory:
+
+    @pytest.fixture
+    def history(self, tmp_path):
+        return DurationHistory(tmp_path / "durations.json", smoothing=0.5)
+
+    @allure.title("Test first measurement is stored as is")
+    def test_update_first_measurement(self, history):
+        history.update("test_a", 4.0)
+
+        assert history.estimate("test_a") == 4.0
+
+    @allure.title("Test measurements are exponentially smoothed")
+    def test_update_smoothing(self, history):
+        history.update("test_a", 4.0)
+        history.update("test_a", 8.0)
+
+        assert history.estimate("test_a") == 6.0
+
+    @allure.title("Test fallback estimate for unknown tests")
+    def test_fallback_estimate(self, history):
+        assert history.estimate("new_test") == DEFAULT_FALLBACK_ESTIMATE
+
+        history.update("test_a", 2.0)
+        history.update("test_b", 4.0)
+        history.update("test_c", 9.0)
+
+        assert history.estimate("new_test") == 4.0
+
+    @allure.title("Test longest tests are ordered first")
+    def test_order_longest_first(self, history):
+        history.update("short", 1.0)
+        history.update("long", 100.0)
+
+        assert history.order_longest_first(["short", "new", "long"]) == ["long", "new", "short"]
+
+    @allure.title("Test share of tests with a recorded duration")
+    def test_known_share(self, history):
+        history.update("test_a", 1.0)
+
+        assert history.known_share(["test_a", "test_b"]) == 0.5
+        assert history.known_share([]) == 0.0
+
+    @allure.title("Test history survives save and load")
+    def test_save_and_load(self, tmp_path):
+        history = DurationHistory(tmp_path / "cache" / "durations.json")
+        history.update("test_a", 3.0)
+        history.save()
+
+        loaded = DurationHistory(history.path).load()
+
+        assert "test_a" in loaded
+        assert loaded.estimate("test_a") == 3.0
+
+    @allure.title("Test corrupted history file is ignored")
+    def test_load_corrupted(self, history):
+        history.path.write_text("not json")
+
+        assert len(history.load()) == 0
+
+    @allure.title("Test invalid smoothing factor")
+    def test_invalid_smoothing(self):
+        with pytest.raises(ValueError):
+            DurationHistory(smoothing=0)
+
+
+@allure.feature("Framework")
+@allure.story("Duration History")
+@pytest.mark.unit
+class TestPredictMakespan:
+
+    @allure.title("Test makespan on a single worker is the total duration")
+    def test_single_worker(self):
+        assert predict_makespan([1.0, 2.0, 3.0]) == 6.0
+
+    @allure.title("Test makespan with list scheduling on several workers")
+    def test_several_workers(self):
+        assert predict_makespan([240.0, 60.0, 60.0, 60.0, 60.0, 2.0], workers=2) == 242.0
+
+    @allure.title("Test makespan of an empty run")
+    def test_empty(self):
+        assert predict_makespan([], workers=4) == 0.0
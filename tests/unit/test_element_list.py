@@ -0,0 +1,97 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Page, Locator
+
+from framework.ui.constants.elements import ElementType
+from framework.ui.elements.button import Button
+from framework.ui.elements.element_list import ElementList, ItemState
+from framework.ui.elements.label import Label
+
+
+@allure.feature("Framework")
+@allure.story("Element List")
+@pytest.mark.unit
+class TestElementList:
+
+    @pytest.fixture
+    def mock_page(self):
+        return Mock(spec=Page)
+
+    @pytest.fixture
+    def mock_locator(self):
+        locator = Mock(spec=Locator)
+        locator.count.return_value = 3
+        locator.nth.return_value = Mock(spec=Locator)
+        locator.evaluate_all.return_value = [
+            {"text": "Python", "attributes": {"href": "/python"}, "css": {"color": "red"},
+             "states": {"visible": True, "enabled": True, "checked": False}},
+            {"text": "Java", "attributes": {"href": None}, "css": {"color": "blue"},
+             "states": {"visible": False, "enabled": True, "checked": False}},
+            {"text": "Python 3", "attributes": {"href": "/python3"}, "css": {"color": "red"},
+             "states": {"visible": True, "enabled": False, "checked": True}},
+        ]
+        return locator
+
+    @pytest.fixture
+    def results(self, mock_page, mock_locator):
+        mock_page.locator.return_value = mock_locator
+        return ElementList(mock_page, "h3", "Search Results")
+
+    @allure.title("Test element list initialization")
+    def test_initialization(self, results):
+        assert results._type == ElementType.ELEMENT_LIST
+
+    @allure.title("Test texts, attributes, CSS and states are each read in one evaluation")
+    def test_reads(self, results, mock_locator):
+        assert results.texts() == ["Python", "Java", "Python 3"]
+        assert results.attributes("href") == ["/python", None, "/python3"]
+        assert results.css("color") == ["red", "blue", "red"]
+        assert results.states()[2] == ItemState(visible=True, enabled=False, checked=True)
+        assert mock_locator.evaluate_all.call_count == 4
+
+    @allure.title("Test requested fields are passed as an argument")
+    def test_fields_argument(self, results, mock_locator):
+        results.attributes("href")
+
+        script, fields = mock_locator.evaluate_all.call_args.args
+        assert "href" not in script
+        assert fields == {"text": False, "attributes": ["href"], "css": [], "states": False}
+
+    @allure.title("Test filter returns the matching elements by index")
+    def test_filter(self, results, mock_locator):
+        matched = results.filter(lambda item: item.state.visible and "Python" in item.text)
+
+        assert [element.locator for element in matched] == [mock_locator.nth.return_value] * 2
+        assert [call.args for call in mock_locator.nth.call_args_list] == [(0,), (2,)]
+        mock_locator.evaluate_all.assert_called_once()
+
+    @allure.title("Test indexing and iteration")
+    def test_indexing(self, results, mock_locator):
+        assert isinstance(results[0], Label)
+        results[-1]
+        mock_locator.nth.assert_called_with(2)
+        assert len(list(results)) == 3
+        with pytest.raises(IndexError):
+            results[3]
+
+    @allure.title("Test item class of indexed elements")
+    def test_item_class(self, mock_page, mock_locator):
+        mock_page.locator.return_value = mock_locator
+
+        buttons = ElementList(mock_page, "button", "Buttons", item_class=Button)
+
+        assert isinstance(buttons[1], Button)
+
+    @allure.title("Test wait for count")
+    def test_wait_for_count(self, results, mock_locator, mock_page):
+        mock_locator.count.side_effect = [1, 2, 3]
+
+        assert results.wait_for_count(3)
+        assert mock_page.wait_for_timeout.call_count == 2
+
+    @allure.title("Test wait for count timeout")
+    def test_wait_for_count_timeout(self, results):
+        assert not results.wait_for_count(5, timeout=0, no_throw=True)
+        with pytest.raises(TimeoutError):
+            results.wait_for_count(5, timeout=0)
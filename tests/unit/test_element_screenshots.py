@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Locator, Page
+
+from framework.ui.elements.base_element import BaseElement
+from framework.ui.visual.comparison import encode_png, load_image
+from framework.ui.visual.element_screenshots import ElementBox, crop, take_element_screenshots
+
+OWN_CAPTURE_PNG = encode_png(np.full((2, 2, 3), 7, dtype=np.uint8))
+
+
+def make_page_image(height: int = 200, width: int = 100) -> np.ndarray:
+    """Image whose pixel values encode their coordinates, so crops can be checked."""
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[..., 0] = np.arange(height, dtype=np.uint8)[:, None]
+    image[..., 1] = np.arange(width, dtype=np.uint8)[None, :]
+    return image
+
+
+def make_element() -> BaseElement:
+    element = Mock(spec=BaseElement)
+    element.locator = Mock(spec=Locator)
+    element.locator.screenshot.return_value = OWN_CAPTURE_PNG
+    return element
+
+
+@allure.feature("Framework")
+@allure.story("Element Screenshots")
+@pytest.mark.unit
+class TestElementScreenshots:
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.screenshot.return_value = encode_png(make_page_image())
+        return page
+
+    @staticmethod
+    def set_boxes(page, boxes, device_pixel_ratio=1):
+        page.evaluate.return_value = {"devicePixelRatio": device_pixel_ratio, "boxes": [
+            {"x": x, "y": y, "width": width, "height": height, "ownCapture": own}
+            for x, y, width, height, own in boxes
+        ]}
+
+    @allure.title("Test elements are cropped from one full-page capture")
+    def test_crop_from_single_capture(self, mock_page):
+        elements = [make_element(), make_element()]
+        self.set_boxes(mock_page, [(10, 20, 30, 40, False), (0, 150, 5, 5, False)])
+
+        screenshots = take_element_screenshots(mock_page, elements)
+
+        mock_page.screenshot.assert_called_once()
+        mock_page.evaluate.assert_called_once()
+        first = load_image(screenshots[0])
+        assert first.shape == (40, 30, 3)
+        assert tuple(first[0, 0, :2]) == (20, 10)
+        assert tuple(load_image(screenshots[1])[4, 4, :2]) == (154, 4)
+        for element in elements:
+            element.locator.screenshot.assert_not_called()
+
+    @allure.title("Test boxes are scaled by the device pixel ratio")
+    def test_device_pixel_ratio(self, mock_page):
+        self.set_boxes(mock_page, [(10.5, 20, 10, 10, False)], device_pixel_ratio=2)
+
+        screenshot = load_image(take_element_screenshots(mock_page, [make_element()])[0])
+
+        assert screenshot.shape == (20, 20, 3)
+        assert tuple(screenshot[0, 0, :2]) == (40, 21)
+
+    @allure.title("Test elements in scroll containers or outside the page are captured on their own")
+    def test_fallback(self, mock_page):
+        in_container, outside, empty, regular = [make_element() for _ in range(4)]
+        self.set_boxes(mock_page, [(0, 0, 10, 10, True), (95, 0, 10, 10, False), (0, 0, 0, 10, False),
+                                   (0, 0, 10, 10, False)])
+
+        screenshots = take_element_screenshots(mock_page, [in_container, outside, empty, regular])
+
+        assert screenshots[:3] == [OWN_CAPTURE_PNG] * 3
+        regular.locator.screenshot.assert_not_called()
+
+    @allure.title("Test no full-page capture when every element needs its own")
+    def test_no_page_capture(self, mock_page):
+        self.set_boxes(mock_page, [(0, 0, 10, 10, True)])
+
+        take_element_screenshots(mock_page, [make_element()])
+
+        mock_page.screenshot.assert_not_called()
+
+    @allure.title("Test crop bounds")
+    @pytest.mark.parametrize("box, expected_shape", [
+        (ElementBox(0, 0, 100, 200), (200, 100, 3)),
+        (ElementBox(0.4, 0.4, 1.2, 1.2), (2, 2, 3)),
+        (ElementBox(-1, 0, 10, 10), None),
+        (ElementBox(0, 195, 10, 10), None),
+    ])
+    def test_crop(self, box, expected_shape):
+        cropped = crop(make_page_image(), box, scale=1)
+
+        assert (cropped.shape if cropped is not None else None) == expected_shape
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+import allure
+
+from framework.utils.export_utils import (Compression, ExportFormat, RowsWriter, compare_rows_files, infer_compression,
+                                          infer_format, open_rows_file, read_rows)
+
+COLUMNS = ["Name", "Role"]
+ROWS = [["Ann", "admin"], ["Bob", "user, guest"]]
+
+
+def write_rows_file(path, rows=ROWS, export_format=ExportFormat.CSV):
+    with open_rows_file(path, "w") as file:
+        RowsWriter(file, COLUMNS, export_format).write_rows(rows)
+
+
+@allure.feature("Framework")
+@allure.story("Export Utils")
+@pytest.mark.unit
+class TestExportUtils:
+
+    @allure.title("Test format and compression are inferred from the file suffix")
+    @pytest.mark.parametrize("file_name, export_format, compression", [
+        ("rows.csv", ExportFormat.CSV, Compression.NONE),
+        ("rows.jsonl.gz", ExportFormat.JSONL, Compression.GZIP),
+        ("rows.v2.csv.xz", ExportFormat.CSV, Compression.XZ),
+    ])
+    def test_infer(self, file_name, export_format, compression):
+        assert infer_format(file_name) == export_format
+        assert infer_compression(file_name) == compression
+
+    @allure.title("Test unknown file format")
+    def test_infer_unknown_format(self):
+        with pytest.raises(ValueError):
+            infer_format("rows.txt")
+
+    @allure.title("Test rows written and read back")
+    @pytest.mark.parametrize("file_name", ["rows.csv", "rows.csv.gz", "rows.jsonl", "rows.jsonl.bz2"])
+    def test_write_read(self, tmp_path, file_name):
+        path = tmp_path / file_name
+
+        write_rows_file(path, export_format=infer_format(path))
+
+        assert list(read_rows(path)) == [dict(zip(COLUMNS, row)) for row in ROWS]
+
+    @allure.title("Test JSONL values of other types are read as text")
+    def test_read_jsonl_values(self, tmp_path):
+        path = tmp_path / "reference.jsonl"
+        path.write_text(json.dumps({"Name": "Ann", "Age": 42, "Role": None}) + "\n")
+
+        assert list(read_rows(path)) == [{"Name": "Ann", "Age": "42", "Role": ""}]
+
+    @allure.title("Test equal files in different formats")
+    def test_compare_equal(self, tmp_path):
+        write_rows_file(tmp_path / "actual.csv.gz")
+        write_rows_file(tmp_path / "expected.jsonl", export_format=ExportFormat.JSONL)
+
+        comparison = compare_rows_files(tmp_path / "actual.csv.gz", tmp_path / "expected.jsonl")
+
+        assert comparison.is_equal() is True
+        assert comparison.rows_compared == 2
+
+    @allure.title("Test changed and missing rows are reported")
+    def test_compare_differences(self, tmp_path):
+        write_rows_file(tmp_path / "actual.csv", rows=[["Ann", "user"]])
+        write_rows_file(tmp_path / "expected.csv")
+
+        comparison = compare_rows_files(tmp_path / "actual.csv", tmp_path / "expected.csv", max_differences=1)
+
+        assert comparison.differences_count == 2
+        assert len(comparison.differences) == 1
+        assert comparison.differences[0].actual == {"Name": "Ann", "Role": "user"}
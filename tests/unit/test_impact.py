@@ -0,0 +1,114 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Page
+
+from framework.execution.impact import ImpactMap, ImpactRecorder
+from framework.ui.elements.button import Button
+from tests.pages.login_page import LoginPage
+
+
+@allure.feature("Framework")
+@allure.story("Test Impact Selection")
+@pytest.mark.unit
+class TestImpactRecorder:
+
+    @pytest.fixture
+    def recorder(self, pytestconfig):
+        recorder = ImpactRecorder()
+        recorder.enable(pytestconfig.rootpath)
+        return recorder
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.locator.return_value = Mock()
+        return page
+
+    @allure.title("Test nothing is recorded outside of a test")
+    def test_record_without_test(self, recorder, mock_page):
+        recorder.record(Button(mock_page, "#submit", "Submit"))
+
+        assert recorder.records() == {}
+
+    @allure.title("Test page object class hierarchy is recorded")
+    def test_record_page_object(self, recorder, mock_page):
+        recorder.start_test("test_login")
+        recorder.record(LoginPage(mock_page))
+        recorder.stop_test()
+
+        record = recorder.records()["test_login"]
+        assert record["files"] == ["framework/ui/pages/base_page.py", "tests/pages/login_page.py"]
+        assert "tests.pages.login_page.LoginPage" in record["classes"]
+
+    @allure.title("Test element locator is recorded")
+    def test_record_element_locator(self, recorder, mock_page):
+        recorder.start_test("test_submit")
+        recorder.record(Button(mock_page, "#submit", "Submit"))
+
+        record = recorder.records()["test_submit"]
+        assert record["locators"] == ["#submit"]
+        assert "framework/ui/elements/button.py" in record["files"]
+
+    @allure.title("Test untouched test gets an empty record")
+    def test_empty_record(self, recorder):
+        recorder.start_test("test_noop")
+
+        assert recorder.records() == {"test_noop": {"files": [], "classes": [], "locators": []}}
+
+
+@allure.feature("Framework")
+@allure.story("Test Impact Selection")
+@pytest.mark.unit
+class TestImpactMap:
+
+    @pytest.fixture
+    def impact_map(self, tmp_path):
+        impact_map = ImpactMap(tmp_path / "impact.json")
+        impact_map.merge_and_save({
+            "tests/ui/test_login.py::test_login": {
+                "files": ["framework/ui/elements/input.py", "tests/pages/login_page.py"],
+                "classes": [], "locators": ["#username"]},
+            "tests/ui/test_search.py::test_search": {
+                "files": ["framework/ui/elements/input.py", "tests/pages/google_page.py"],
+                "classes": [], "locators": ["#q"]},
+        })
+        return ImpactMap(impact_map.path).load()
+
+    @allure.title("Test only tests touching a changed page object are selected")
+    def test_select_by_page_object(self, impact_map):
+        node_ids = ["tests/ui/test_login.py::test_login", "tests/ui/test_search.py::test_search"]
+
+        selected = impact_map.select(node_ids, ["tests/pages/google_page.py"])
+
+        assert selected == ["tests/ui/test_search.py::test_search"]
+
+    @allure.title("Test tests touching a changed framework module are selected")
+    def test_select_by_framework_module(self, impact_map):
+        node_ids = ["tests/ui/test_login.py::test_login", "tests/ui/test_search.py::test_search"]
+
+        assert impact_map.select(node_ids, ["framework/ui/elements/input.py"]) == node_ids
+
+    @allure.title("Test tests using a changed locator are selected")
+    def test_select_by_locator(self, impact_map):
+        node_ids = ["tests/ui/test_login.py::test_login", "tests/ui/test_search.py::test_search"]
+
+        assert impact_map.select(node_ids, [], ["#username"]) == ["tests/ui/test_login.py::test_login"]
+
+    @allure.title("Test new tests and changed test files are always selected")
+    def test_select_new_and_changed_tests(self, impact_map):
+        node_ids = ["tests/ui/test_login.py::test_login", "tests/ui/test_new.py::test_new"]
+
+        assert impact_map.select(node_ids, ["tests/ui/test_login.py"]) == node_ids
+
+    @allure.title("Test unmapped source change selects all tests")
+    def test_select_unmapped_change(self, impact_map):
+        node_ids = ["tests/ui/test_login.py::test_login", "tests/ui/test_search.py::test_search"]
+
+        assert impact_map.select(node_ids, ["conftest.py"]) == node_ids
+
+    @allure.title("Test documentation changes are ignored")
+    def test_select_ignored_change(self, impact_map):
+        node_ids = ["tests/ui/test_login.py::test_login"]
+
+        assert impact_map.select(node_ids, ["README.md"]) == []
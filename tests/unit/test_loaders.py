@@ -0,0 +1,89 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
+
+from framework.ui.browser.loaders import (LOADER_BINDING_NAME, LOADER_HIDDEN_JS, LOADER_VISIBLE_JS, LoaderWatcher,
+                                          get_loader_selectors, loader_wait_stats)
+from framework.ui.elements.button import Button
+
+
+@allure.feature("Framework")
+@allure.story("Loader Watcher")
+@pytest.mark.unit
+class TestLoaderWatcher:
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.locator.return_value = Mock()
+        return page
+
+    @pytest.fixture
+    def mock_context(self, mock_page):
+        context = Mock(spec=BrowserContext)
+        context.pages = [mock_page]
+        mock_page.context = context
+        return context
+
+    @pytest.fixture
+    def watcher(self, mock_context):
+        return LoaderWatcher.for_context(mock_context)
+
+    def report_state(self, mock_context, page, visible):
+        binding = mock_context.expose_binding.call_args.args[1]
+        binding({"page": page}, visible)
+
+    @allure.title("Test observer is installed for new documents and open pages")
+    def test_install(self, watcher, mock_context, mock_page):
+        assert mock_context.expose_binding.call_args.args[0] == LOADER_BINDING_NAME
+        assert '".spinner"' in mock_context.add_init_script.call_args.kwargs["script"]
+        assert mock_page.evaluate.call_args.args[1] == get_loader_selectors()
+        assert LoaderWatcher.for_context(mock_context) is watcher
+
+    @allure.title("Test no wait without a reported loader")
+    def test_no_loader(self, watcher, mock_page):
+        assert watcher.wait_for_loaders_to_hide(mock_page)
+        mock_page.wait_for_function.assert_not_called()
+
+    @allure.title("Test wait for a reported loader to disappear")
+    def test_wait_for_loader_to_hide(self, watcher, mock_context, mock_page):
+        self.report_state(mock_context, mock_page, True)
+        waits = loader_wait_stats.waits
+
+        assert watcher.is_loader_visible(mock_page)
+        assert watcher.wait_for_loaders_to_hide(mock_page)
+        mock_page.wait_for_function.assert_called_once_with(LOADER_HIDDEN_JS, timeout=10000)
+        assert loader_wait_stats.waits == waits + 1
+
+    @allure.title("Test loader still visible after the timeout")
+    def test_wait_timeout(self, watcher, mock_context, mock_page):
+        self.report_state(mock_context, mock_page, True)
+        mock_page.wait_for_function.side_effect = PlaywrightTimeoutError("Timeout")
+
+        assert not watcher.wait_for_loaders_to_hide(mock_page, no_throw=True)
+        with pytest.raises(TimeoutError):
+            watcher.wait_for_loaders_to_hide(mock_page)
+
+    @allure.title("Test wait for a loader that never appears")
+    def test_loader_not_appeared(self, watcher, mock_page):
+        mock_page.wait_for_function.side_effect = PlaywrightTimeoutError("Timeout")
+
+        assert watcher.wait_for_loader(mock_page)
+        mock_page.wait_for_function.assert_called_once_with(LOADER_VISIBLE_JS, timeout=1000)
+
+    @allure.title("Test element action waits only while a loader is reported")
+    def test_action_gate(self, watcher, mock_context, mock_page):
+        button = Button(mock_page, "#submit", "Submit")
+
+        button.click()
+        mock_page.wait_for_function.assert_not_called()
+
+        self.report_state(mock_context, mock_page, True)
+        button.click()
+        mock_page.wait_for_function.assert_called_once_with(LOADER_HIDDEN_JS, timeout=10000)
+
+        self.report_state(mock_context, mock_page, False)
+        button.click()
+        assert mock_page.wait_for_function.call_count == 1
+        assert button.locator.click.call_count == 3
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pytest
+import allure
+
+from framework.logger.logger import load_config
+
+
+@allure.feature("Framework")
+@allure.story("Logger")
+@pytest.mark.unit
+class TestLoggerConfig:
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / "log_config.yaml"
+        path.write_text("version: 1\nroot:\n  level: INFO\n")
+        return path
+
+    @allure.title("Test parsed config is cached and reused without the YAML parser")
+    def test_config_cache(self, config_file, tmp_path, monkeypatch):
+        cache_file = tmp_path / "cache" / "config.json"
+
+        assert load_config(config_file, cache_file) == {"version": 1, "root": {"level": "INFO"}}
+        assert cache_file.exists()
+
+        monkeypatch.setitem(sys.modules, "yaml", None)
+        assert load_config(config_file, cache_file) == {"version": 1, "root": {"level": "INFO"}}
+
+    @allure.title("Test stale cache is ignored when the config file changes")
+    def test_stale_cache(self, config_file, tmp_path):
+        cache_file = tmp_path / "config.json"
+        load_config(config_file, cache_file)
+
+        config_file.write_text("version: 1\nroot:\n  level: DEBUG\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config(config_file, cache_file)["root"]["level"] == "DEBUG"
+
+    @allure.title("Test unreadable cache falls back to parsing the config")
+    def test_corrupted_cache(self, config_file, tmp_path):
+        cache_file = tmp_path / "config.json"
+        cache_file.write_text("{not json")
+
+        assert load_config(config_file, cache_file)["version"] == 1
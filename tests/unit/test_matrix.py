@@ -0,0 +1,33 @@
+import pytest
+import allure
+from unittest.mock import Mock
+
+from framework.plugins.matrix import interleave_engines
+from framework.ui.constants.browsers import BrowserType
+
+
+def make_item(name, **params):
+    item = Mock(spec=["name", "callspec"] if params else ["name"])
+    item.name = name
+    if params:
+        item.callspec.params = params
+    return item
+
+
+@allure.feature("Framework")
+@allure.story("Browser Matrix")
+@pytest.mark.unit
+class TestBrowserMatrix:
+
+    @allure.title("Test ui_browser tests are interleaved by engine, other tests keep their position")
+    def test_interleave_engines(self):
+        items = [make_item("unit"),
+                 make_item("a[chromium]", ui_browser_type=BrowserType.CHROMIUM),
+                 make_item("b[chromium]", ui_browser_type=BrowserType.CHROMIUM),
+                 make_item("page[firefox]", browser_name="firefox"),
+                 make_item("a[firefox]", ui_browser_type=BrowserType.FIREFOX),
+                 make_item("b[firefox]", ui_browser_type=BrowserType.FIREFOX)]
+
+        names = [item.name for item in interleave_engines(items)]
+
+        assert names == ["unit", "a[chromium]", "a[firefox]", "page[firefox]", "b[chromium]", "b[firefox]"]
@@ -0,0 +1,98 @@
+import json
+import tracemalloc
+
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Error as PlaywrightError, Page
+
+from framework.execution.memory import (MB, MemoryMonitor, MemoryThresholds, get_browser_rss_bytes,
+                                        get_descendant_pids)
+
+
+def add_process(proc_dir, pid, ppid, command, rss_kb):
+    process_dir = proc_dir / str(pid)
+    process_dir.mkdir()
+    (process_dir / "stat").write_text(f"{pid} ({command} x) S {ppid} 1 1 0")
+    (process_dir / "status").write_text(f"Name:\t{command}\nVmRSS:\t{rss_kb} kB\n")
+    (process_dir / "cmdline").write_bytes(command.encode() + b"\0")
+
+
+@allure.feature("Framework")
+@allure.story("Memory Monitor")
+@pytest.mark.unit
+class TestMemoryMonitor:
+
+    @pytest.fixture
+    def monitor(self, tmp_path):
+        was_tracing = tracemalloc.is_tracing()
+        monitor = MemoryMonitor()
+        monitor.enable(tmp_path / "memory" / "series.jsonl", MemoryThresholds(python=MB, browser_rss=MB, js_heap=MB))
+        yield monitor
+        if not was_tracing:
+            monitor.disable()
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.is_closed.return_value = False
+        page.context.new_cdp_session.side_effect = PlaywrightError("CDP session is only available in Chromium")
+        return page
+
+    @allure.title("Test browser processes are found in /proc, without the Playwright driver")
+    def test_browser_rss(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("os.getpid", lambda: 100)
+        add_process(tmp_path, 100, 1, "python", 50_000)
+        add_process(tmp_path, 200, 100, "node cli.js run-driver", 40_000)
+        add_process(tmp_path, 300, 200, "chrome", 100_000)
+        add_process(tmp_path, 301, 300, "chrome --type=renderer", 60_000)
+        add_process(tmp_path, 400, 1, "other", 10_000)
+
+        assert get_descendant_pids(100, tmp_path) == {200, 300, 301}
+        assert get_browser_rss_bytes(tmp_path) == 160_000 * 1024
+        assert get_browser_rss_bytes(tmp_path / "missing") is None
+
+    @allure.title("Test test growing Python memory is flagged with its top allocations")
+    def test_python_growth(self, monitor, tmp_path):
+        monitor.start_test("test_leak")
+        leak = [bytes(1024) for _ in range(3000)]
+        delta = monitor.stop_test("test_leak")
+
+        assert "python" in delta.exceeded
+        assert any("test_memory.py" in allocation for allocation in delta.top_allocations)
+        assert monitor.flagged == [delta]
+        samples = [json.loads(line) for line in (tmp_path / "memory" / "series.jsonl").read_text().splitlines()]
+        assert [sample["phase"] for sample in samples] == ["start", "end"]
+        assert len(leak) == 3000
+
+    @allure.title("Test JS heap growth is compared per page")
+    def test_js_heap_growth(self, monitor, mock_page):
+        mock_page.evaluate.side_effect = [10 * MB, 15 * MB]
+
+        monitor.start_test("test_page", [mock_page])
+        delta = monitor.stop_test("test_page", [mock_page])
+
+        assert delta.js_heap == 5 * MB
+        assert "js_heap" in delta.exceeded
+
+    @allure.title("Test JS heap is read from CDP metrics on Chromium")
+    def test_js_heap_from_cdp(self, monitor):
+        page = Mock(spec=Page)
+        page.is_closed.return_value = False
+        session = page.context.new_cdp_session.return_value
+        session.send.side_effect = [None, {"metrics": [{"name": "Nodes", "value": 10},
+                                                       {"name": "JSHeapUsedSize", "value": 1234.0}]}]
+
+        assert monitor.get_js_heap_bytes(page) == 1234
+        page.evaluate.assert_not_called()
+
+    @allure.title("Test test without growth is not flagged")
+    def test_no_growth(self, monitor, mock_page, monkeypatch):
+        monkeypatch.setattr("framework.execution.memory.get_browser_rss_bytes", lambda: 500 * MB)
+        mock_page.evaluate.return_value = 10 * MB
+
+        monitor.start_test("test_ok", [mock_page])
+        delta = monitor.stop_test("test_ok", [mock_page])
+
+        assert delta.exceeded == []
+        assert delta.browser_rss == delta.js_heap == 0
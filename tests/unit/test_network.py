@@ -0,0 +1,120 @@
+import re
+import time
+
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Page, Request
+
+from framework.ui.browser.network import NetworkMonitor
+from framework.ui.constants.page_events import PageEvent
+
+
+def make_request(url, resource_type="fetch", navigation=False, response_end=12.5):
+    request = Mock(spec=Request)
+    request.url = url
+    request.resource_type = resource_type
+    request.is_navigation_request.return_value = navigation
+    request.redirected_from = None
+    request.timing = {"responseEnd": response_end}
+    return request
+
+
+@allure.feature("Framework")
+@allure.story("Network Tracking")
+@pytest.mark.unit
+class TestNetworkTracker:
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.url = "about:blank"
+        return page
+
+    @pytest.fixture
+    def monitor(self, mock_page):
+        context = Mock(spec=BrowserContext)
+        context.pages = [mock_page]
+        return NetworkMonitor(context)
+
+    @pytest.fixture
+    def tracker(self, monitor, mock_page):
+        return monitor.get_tracker(mock_page)
+
+    @pytest.fixture
+    def events(self, tracker, mock_page):
+        return {call.args[0]: call.args[1] for call in mock_page.on.call_args_list}
+
+    @allure.title("Test in-flight requests are counted from request events")
+    def test_inflight(self, tracker, events):
+        first, second = make_request("https://site/api/a"), make_request("https://site/api/b")
+        events[PageEvent.REQUEST.value](first)
+        events[PageEvent.REQUEST.value](second)
+        assert tracker.inflight == 2
+
+        events[PageEvent.REQUEST_FINISHED.value](first)
+        events[PageEvent.REQUEST_FAILED.value](second)
+        assert tracker.inflight == 0
+        assert tracker.current_navigation.finished == 1
+        assert tracker.current_navigation.failed == 1
+
+    @allure.title("Test ignored URLs and resource types are not counted")
+    def test_ignored(self, monitor, tracker, events):
+        monitor.ignore_urls("**/poll?*", re.compile(r"analytics\."))
+
+        for request in [make_request("https://site/api/poll?since=1"), make_request("https://analytics.site/hit"),
+                        make_request("https://site/events", resource_type="eventsource")]:
+            events[PageEvent.REQUEST.value](request)
+
+        assert tracker.inflight == 0
+        assert tracker.current_navigation.ignored == 3
+
+    @allure.title("Test request timings are grouped by navigation")
+    def test_navigation_stats(self, tracker, events, mock_page):
+        document = make_request("https://site/home", resource_type="document", navigation=True, response_end=80)
+        document.frame = mock_page.main_frame
+        script = make_request("https://site/app.js", response_end=200)
+        for request in [document, script]:
+            events[PageEvent.REQUEST.value](request)
+            events[PageEvent.REQUEST_FINISHED.value](request)
+
+        navigation = tracker.current_navigation
+        assert len(tracker.navigations) == 2
+        assert navigation.url == "https://site/home"
+        assert navigation.slowest(1) == [(200, "https://site/app.js")]
+        assert navigation.total_ms == 280
+
+    @allure.title("Test quiet network returns without waiting")
+    def test_already_quiet(self, tracker, mock_page):
+        tracker._last_finished -= 1
+
+        assert tracker.wait_for_network_quiet(quiet_ms=500)
+        mock_page.wait_for_timeout.assert_not_called()
+
+    @allure.title("Test wait ends once the last request has finished for the quiet period")
+    def test_wait_for_quiet(self, tracker, events, mock_page):
+        request = make_request("https://site/api/slow")
+        events[PageEvent.REQUEST.value](request)
+
+        def wait_for_timeout(timeout_ms):
+            if tracker.inflight:
+                events[PageEvent.REQUEST_FINISHED.value](request)
+            time.sleep(timeout_ms / 1000)
+
+        mock_page.wait_for_timeout.side_effect = wait_for_timeout
+
+        assert tracker.wait_for_network_quiet(quiet_ms=100, timeout=5000)
+        waits = [call.args[0] for call in mock_page.wait_for_timeout.call_args_list]
+        # Polled while the request was in flight, then slept only for the rest of the quiet period
+        assert waits[0] == 50
+        assert sum(waits[1:]) <= 100
+
+    @allure.title("Test tolerated in-flight requests and timeout")
+    def test_max_inflight_and_timeout(self, tracker, events):
+        events[PageEvent.REQUEST.value](make_request("https://site/api/long-poll"))
+        tracker._last_finished -= 1
+
+        assert tracker.wait_for_network_quiet(max_inflight=1, quiet_ms=100)
+        assert not tracker.wait_for_network_quiet(timeout=0, no_throw=True)
+        with pytest.raises(TimeoutError):
+            tracker.wait_for_network_quiet(timeout=0)
@@ -0,0 +1,167 @@
+import time
+
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Error as PlaywrightError, Page, TimeoutError as PlaywrightTimeoutError
+
+from framework.execution.retries import ACTION_TIMEOUT_POLICY, RetryEngine, RetryPolicy, retry_engine
+from framework.ui.constants.elements import ElementType
+from framework.ui.elements.button import Button
+from framework.ui.elements.input import Input
+
+
+@allure.feature("Framework")
+@allure.story("Step Retries")
+@pytest.mark.unit
+class TestRetryEngine:
+
+    @pytest.fixture
+    def engine(self):
+        engine = RetryEngine()
+        engine.enable(policies=[RetryPolicy(exceptions=(PlaywrightTimeoutError,), idempotent_only=False)])
+        return engine
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.locator.return_value = Mock()
+        return page
+
+    @pytest.fixture
+    def global_engine(self):
+        retry_engine.enable(policies=[RetryPolicy(exceptions=(PlaywrightTimeoutError,), idempotent_only=False)])
+        retry_engine.start_test()
+        yield retry_engine
+        retry_engine.stop_test()
+        retry_engine.clear()
+        retry_engine.enabled = False
+
+    @allure.title("Test failed step is retried with backoff until it passes")
+    def test_retry_until_passed(self, engine, mock_page):
+        button = Button(mock_page, "#submit", "Submit")
+        func = Mock(side_effect=[PlaywrightTimeoutError("Timeout 1"), PlaywrightTimeoutError("Timeout 2"), "done"])
+
+        assert engine.run(func, "Click on Submit", button, single_action=True) == "done"
+
+        assert func.call_count == 3
+        assert [call.args for call in mock_page.wait_for_timeout.call_args_list] == [(250,), (500,)]
+        assert [record.attempt for record in engine.stats.records] == [2, 3]
+
+    @allure.title("Test step fails after its maximum number of attempts")
+    def test_max_attempts(self, engine, mock_page):
+        func = Mock(side_effect=PlaywrightTimeoutError("Timeout"))
+
+        with pytest.raises(PlaywrightTimeoutError):
+            engine.run(func, "Click on Submit", Button(mock_page, "#submit", "Submit"), single_action=True)
+
+        assert func.call_count == 3
+
+    @allure.title("Test non-matching exceptions and disabled engine are not retried")
+    def test_not_retried(self, engine):
+        func = Mock(side_effect=ValueError("Bad value"))
+        with pytest.raises(ValueError):
+            engine.run(func, "Step", single_action=True)
+        assert func.call_count == 1
+
+        engine.enabled = False
+        func = Mock(side_effect=PlaywrightTimeoutError("Timeout"))
+        with pytest.raises(PlaywrightTimeoutError):
+            engine.run(func, "Step")
+        assert func.call_count == 1
+
+    @allure.title("Test policies are selected by element type and idempotency")
+    def test_policy_selection(self, engine):
+        engine.clear()
+        engine.register(RetryPolicy(exceptions=(PlaywrightError,), element_types=(ElementType.INPUT,)))
+        error = PlaywrightError("Element is detached")
+
+        assert engine.find_policy(error, ElementType.INPUT, idempotent=True)
+        assert engine.find_policy(error, ElementType.INPUT, idempotent=False) is None
+        assert engine.find_policy(error, ElementType.BUTTON, idempotent=True) is None
+
+    @allure.title("Test timeouts of non-idempotent steps are only retried for single element actions")
+    def test_non_idempotent_step(self, engine):
+        func = Mock(side_effect=PlaywrightTimeoutError("Timeout"))
+
+        with pytest.raises(PlaywrightTimeoutError):
+            engine.run(func, "Submit the order form")
+
+        assert func.call_count == 1
+        assert engine.find_policy(PlaywrightTimeoutError("Timeout"), single_action=True)
+
+    @allure.title("Test retries stop when the test retry budget is exhausted")
+    def test_budget(self, engine):
+        engine.budget_ms = 300
+        func = Mock(side_effect=PlaywrightTimeoutError("Timeout"))
+
+        with pytest.raises(PlaywrightTimeoutError):
+            engine.run(func, "Step", idempotent=True)
+
+        assert func.call_count == 2
+        assert engine.stats.budget_exhausted
+        assert engine.stop_test().records and not engine.stats.records
+
+    @allure.title("Test a retry needs budget for another attempt as long as the failed one")
+    def test_budget_includes_attempt(self, engine):
+        engine.budget_ms = 230
+        engine.register(RetryPolicy(exceptions=(PlaywrightTimeoutError,), backoff_ms=50), first=True)
+
+        def timeout():
+            time.sleep(0.2)
+            raise PlaywrightTimeoutError("Timeout 200ms exceeded")
+        func = Mock(side_effect=timeout)
+
+        with pytest.raises(PlaywrightTimeoutError):
+            engine.run(func, "Step", idempotent=True)
+
+        assert func.call_count == 1
+        assert engine.stats.budget_exhausted
+
+    @allure.title("Test default policies retry timeouts of non-idempotent actions only when opted in")
+    def test_default_policies(self):
+        engine = RetryEngine()
+        engine.enable()
+        timeout = PlaywrightTimeoutError("Timeout")
+
+        assert engine.find_policy(timeout, idempotent=False, single_action=True) is None
+        assert engine.find_policy(timeout, idempotent=True)
+
+        engine.register(ACTION_TIMEOUT_POLICY, first=True)
+        assert engine.find_policy(timeout, idempotent=False, single_action=True) is ACTION_TIMEOUT_POLICY
+        assert engine.find_policy(timeout, idempotent=False) is None
+
+    @allure.title("Test outer step does not retry a failure its nested step already retried")
+    def test_nested_steps(self, engine):
+        inner = Mock(side_effect=PlaywrightTimeoutError("Timeout"))
+        outer = Mock(side_effect=lambda: engine.run(inner, "Inner step", idempotent=True))
+
+        with pytest.raises(PlaywrightTimeoutError):
+            engine.run(outer, "Outer step", idempotent=True)
+
+        assert inner.call_count == 3
+        assert outer.call_count == 1
+
+    @allure.title("Test element action is retried through the registered policies")
+    def test_action_retry(self, global_engine, mock_page):
+        button = Button(mock_page, "#submit", "Submit")
+        button.locator.click.side_effect = [PlaywrightTimeoutError("Timeout"), None]
+
+        button.click()
+
+        assert button.locator.click.call_count == 2
+        assert global_engine.stats.records[0].step.startswith("Click on ")
+
+    @allure.title("Test non-idempotent action is not retried on errors that may follow the input")
+    def test_non_idempotent_action(self, global_engine, mock_page):
+        global_engine.register(RetryPolicy(exceptions=(PlaywrightError,)))
+        text_input = Input(mock_page, "#name", "Name")
+        text_input.locator.type.side_effect = PlaywrightError("Element is detached")
+        text_input.locator.fill.side_effect = [PlaywrightError("Element is detached"), None]
+
+        with pytest.raises(PlaywrightError):
+            text_input.type_text("abc")
+        text_input.type_text_with_clear("abc")
+
+        assert text_input.locator.type.call_count == 1
+        assert text_input.locator.fill.call_count == 2
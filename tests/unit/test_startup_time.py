@@ -0,0 +1,60 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+import pytest
+import allure
+
+PROJECT_ROOT_DIR = Path(__file__).parents[2]
+# Import time the framework (conftest imports and plugins) may add to the startup of a unit test run
+FRAMEWORK_STARTUP_BUDGET_MS = 150
+FRAMEWORK_PACKAGES = ("framework", "configs", "tests")
+# Modules that only some tests need, and must not be imported when a unit run starts
+DEFERRED_MODULES = ("numpy", "PIL", "yaml", "urllib.request")
+IMPORT_TIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(?P<cumulative>\d+) \| (?P<indent> *)(?P<module>\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    cumulative_us: int
+    top_level: bool
+
+
+def get_startup_imports(*pytest_args: str) -> List[ImportTime]:
+    """Collect a unit test file under `-X importtime` and return the import time of every module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider",
+         *pytest_args, "tests/unit/test_string_utils.py"],
+        cwd=PROJECT_ROOT_DIR, capture_output=True, text=True, timeout=120)
+    return [ImportTime(match["module"], int(match["cumulative"]), not match["indent"])
+            for match in map(IMPORT_TIME_LINE.match, result.stderr.splitlines()) if match]
+
+
+@allure.feature("Framework")
+@allure.story("Startup Time")
+@pytest.mark.unit
+class TestStartupTime:
+
+    @pytest.fixture(scope="class")
+    def startup_imports(self) -> List[ImportTime]:
+        return get_startup_imports()
+
+    @allure.title("Test framework imports stay within the startup budget")
+    def test_framework_startup_budget(self, startup_imports):
+        framework_imports = {entry.module: entry.cumulative_us for entry in startup_imports
+                             if entry.top_level and entry.module.split(".")[0] in FRAMEWORK_PACKAGES}
+        total_ms = sum(framework_imports.values()) / 1000
+
+        assert framework_imports, "No framework module found in the import time report"
+        slowest = sorted(framework_imports.items(), key=lambda item: item[1], reverse=True)[:5]
+        assert total_ms < FRAMEWORK_STARTUP_BUDGET_MS, \
+            f"Framework imports take {total_ms:.0f} ms (budget {FRAMEWORK_STARTUP_BUDGET_MS} ms), slowest: {slowest}"
+
+    @allure.title("Test heavy optional modules are not imported at startup")
+    def test_deferred_modules(self, startup_imports):
+        imported = {entry.module for entry in startup_imports for deferred in DEFERRED_MODULES
+                    if entry.module == deferred or entry.module.startswith(f"{deferred}.")}
+
+        assert not imported, f"Imported at startup: {sorted(imported)}"
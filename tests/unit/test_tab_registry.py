@@ -0,0 +1,109 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import BrowserContext, Frame, Page
+
+from framework.ui.browser.tab_registry import TabRegistry
+from framework.ui.browser.window import WindowManager
+from framework.ui.constants.page_events import ContextEvent, PageEvent
+
+
+def make_page(url, title, opener=None):
+    page = Mock(spec=Page)
+    page.url = url
+    page.title.return_value = title
+    page.opener.return_value = opener
+    page.is_closed.return_value = False
+    page.main_frame = Mock(spec=Frame)
+    page.handlers = {}
+    page.on.side_effect = lambda event, handler: page.handlers.setdefault(event, handler)
+    return page
+
+
+@allure.feature("Framework")
+@allure.story("Tab Registry")
+@pytest.mark.unit
+class TestTabRegistry:
+
+    @pytest.fixture
+    def main_page(self):
+        return make_page("https://example.com/", "Home")
+
+    @pytest.fixture
+    def mock_context(self, main_page):
+        context = Mock(spec=BrowserContext)
+        context.pages = [main_page]
+        context.handlers = {}
+        context.on.side_effect = lambda event, handler: context.handlers.setdefault(event, handler)
+        main_page.context = context
+        return context
+
+    @pytest.fixture
+    def registry(self, mock_context):
+        return TabRegistry(mock_context)
+
+    def open_tab(self, context, page):
+        context.handlers[ContextEvent.PAGE.value](page)
+
+    @allure.title("Test tabs are found by title, URL and opener")
+    def test_find(self, registry, mock_context, main_page):
+        popup = make_page("https://example.com/help", "Help", opener=main_page)
+        self.open_tab(mock_context, popup)
+
+        assert registry.find_by_title("Help") == popup
+        assert registry.find_by_url("https://example.com/") == main_page
+        assert registry.find_by_opener(main_page) == [popup]
+        assert registry.find("help") == popup
+        assert registry.pages == [main_page, popup]
+
+    @allure.title("Test lookups do not read titles")
+    def test_find_without_round_trips(self, registry, main_page):
+        main_page.title.reset_mock()
+
+        registry.find("Home")
+
+        main_page.title.assert_not_called()
+
+    @allure.title("Test navigation and page load update the index")
+    def test_navigation(self, registry, main_page):
+        main_page.handlers[PageEvent.FRAME_NAVIGATED.value](main_page.main_frame)
+        main_page.main_frame.url = "https://example.com/settings"
+        main_page.handlers[PageEvent.FRAME_NAVIGATED.value](main_page.main_frame)
+        main_page.title.return_value = "Settings"
+        main_page.handlers[PageEvent.DOM_CONTENT_LOADED.value](main_page)
+
+        assert registry.find_by_url("https://example.com/settings") == main_page
+        assert registry.find_by_url("https://example.com/") is None
+        assert registry.find_by_title("Settings") == main_page
+        assert registry.find_by_title("Home") is None
+
+    @allure.title("Test closed tabs are removed")
+    def test_close(self, registry, mock_context, main_page):
+        popup = make_page("https://example.com/help", "Help", opener=main_page)
+        self.open_tab(mock_context, popup)
+
+        popup.handlers[PageEvent.CLOSE.value](popup)
+
+        assert registry.pages == [main_page]
+        assert registry.find("Help") is None
+        assert registry.find_by_opener(main_page) == []
+
+    @allure.title("Test registry is shared per context")
+    def test_for_context(self, mock_context):
+        assert TabRegistry.for_context(mock_context) is TabRegistry.for_context(mock_context)
+
+    @allure.title("Test window manager switches by registry lookup")
+    def test_switch_to_window(self, registry, mock_context, main_page):
+        popup = make_page("https://example.com/help", "Help", opener=main_page)
+        self.open_tab(mock_context, popup)
+        window = WindowManager(main_page, registry)
+
+        window.switch_to_window("Help")
+        assert window.page == popup
+
+        window.switch_to_window("Home")
+        window.switch_to_child_window()
+        assert window.page == popup
+
+        with pytest.raises(ValueError):
+            window.switch_to_window("Missing")
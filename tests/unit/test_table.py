@@ -0,0 +1,102 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Page, Locator
+
+from framework.ui.elements.table import Table
+from framework.ui.elements.table_row import TableRow
+from framework.utils.export_utils import read_rows
+
+
+@allure.feature("Framework")
+@allure.story("Table Element")
+@pytest.mark.unit
+class TestTable:
+
+    @pytest.fixture
+    def mock_page(self):
+        return Mock(spec=Page)
+
+    @pytest.fixture
+    def mock_locator(self):
+        return Mock(spec=Locator)
+
+    @pytest.fixture
+    def table(self, mock_page, mock_locator):
+        mock_page.locator.return_value = mock_locator
+        return Table(mock_page, "table.users", "Users")
+
+    @allure.title("Test find rows returns handles bound to matched rows")
+    def test_find_rows(self, table, mock_locator):
+        mock_locator.evaluate.return_value = {"missing": [], "rows": [1, 3]}
+
+        rows = table.find_rows(Role="user")
+
+        assert all(isinstance(row, TableRow) for row in rows)
+        _, arg = mock_locator.evaluate.call_args.args
+        assert arg["criteria"] == {"Role": "user"}
+        assert arg["selectors"]["row"] == Table.DEFAULT_LOCATORS["row_locator"]
+        rows_locator = mock_locator.locator.return_value
+        assert [call.args for call in rows_locator.nth.call_args_list] == [(1,), (3,)]
+
+    @allure.title("Test non-string criteria are compared as cell texts")
+    def test_find_rows_non_string_criteria(self, table, mock_locator):
+        mock_locator.evaluate.return_value = {"missing": [], "found": True, "text": "admin"}
+        table.get_cell(7, "Role")
+        assert mock_locator.evaluate.call_args.args[1]["rowKey"] == "7"
+
+        mock_locator.evaluate.return_value = {"missing": [], "rows": []}
+        table.find_rows(Id=42)
+        assert mock_locator.evaluate.call_args.args[1]["criteria"] == {"Id": "42"}
+
+    @allure.title("Test find rows requires criteria")
+    def test_find_rows_without_criteria(self, table, mock_locator):
+        with pytest.raises(ValueError):
+            table.find_rows()
+
+        mock_locator.evaluate.assert_not_called()
+
+    @allure.title("Test lookup by unknown column")
+    def test_find_rows_missing_column(self, table, mock_locator):
+        mock_locator.evaluate.return_value = {"missing": ["Nope"], "rows": []}
+
+        with pytest.raises(ValueError, match="Nope"):
+            table.find_rows(Nope="x")
+
+    @allure.title("Test get cell text by row key")
+    def test_get_cell(self, table, mock_locator):
+        mock_locator.evaluate.return_value = {"missing": [], "found": True, "text": "admin"}
+
+        assert table.get_cell("Ann", "Role") == "admin"
+        _, arg = mock_locator.evaluate.call_args.args
+        assert arg["rowKey"] == "Ann"
+        assert arg["keyColumn"] is None
+
+    @allure.title("Test get cell of a missing row")
+    def test_get_cell_row_not_found(self, table, mock_locator):
+        mock_locator.evaluate.return_value = {"missing": [], "found": False, "text": None}
+
+        with pytest.raises(ValueError, match="not found"):
+            table.get_cell("Nobody", "Role")
+
+    @allure.title("Test lookups need string selectors")
+    def test_locator_options_not_supported(self, mock_page, mock_locator):
+        mock_page.locator.return_value = mock_locator
+        table = Table(mock_page, "table.users", "Users", row_locator=Mock(spec=Locator))
+
+        with pytest.raises(TypeError):
+            table.find_rows(Role="user")
+
+    @allure.title("Test export streams rows in chunks")
+    def test_export(self, table, mock_locator, tmp_path):
+        mock_locator.evaluate.side_effect = [
+            {"columns": ["Name", "Role"], "total": 3},
+            [["Ann", "admin"], ["Bob", "user"]],
+            [["Cid", "user"]],
+            None,
+        ]
+        path = tmp_path / "users.jsonl.gz"
+
+        assert table.export(path, chunk_size=2) == 3
+        assert [row["Name"] for row in read_rows(path)] == ["Ann", "Bob", "Cid"]
+        assert mock_locator.evaluate.call_count == 4
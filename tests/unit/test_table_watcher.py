@@ -0,0 +1,105 @@
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Page, Locator
+
+from framework.ui.elements.helpers.table_scripts import WATCH_START_JS, WATCH_STOP_JS
+from framework.ui.elements.helpers.table_watcher import TableWatcher
+
+
+@allure.feature("Framework")
+@allure.story("Table Watcher")
+@pytest.mark.unit
+class TestTableWatcher:
+
+    @pytest.fixture
+    def mock_page(self):
+        return Mock(spec=Page)
+
+    @pytest.fixture
+    def mock_locator(self):
+        return Mock(spec=Locator)
+
+    @pytest.fixture
+    def watcher(self, mock_page, mock_locator):
+        mock_locator.evaluate.side_effect = [
+            ["Name", "Status"],
+            {"order": [0, 1], "rows": [[0, ["Ann", "new"]], [1, ["Bob", "new"]]]},
+        ]
+        watcher = TableWatcher(mock_page, mock_locator, "Jobs", {}).start()
+        mock_locator.evaluate.side_effect = None
+        return watcher
+
+    @allure.title("Test initial snapshot")
+    def test_start(self, watcher, mock_locator):
+        assert watcher.columns == ["Name", "Status"]
+        assert watcher.snapshot == [{"Name": "Ann", "Status": "new"}, {"Name": "Bob", "Status": "new"}]
+        assert mock_locator.evaluate.call_args_list[0].args[0] == WATCH_START_JS
+
+    @allure.title("Test refresh applies only the changes")
+    def test_refresh(self, watcher, mock_locator):
+        mock_locator.evaluate.return_value = {"order": [1, 2], "rows": [[1, ["Bob", "done"]], [2, ["Cid", "new"]]]}
+
+        diff = watcher.refresh()
+
+        assert diff.removed == [{"Name": "Ann", "Status": "new"}]
+        assert diff.added == [{"Name": "Cid", "Status": "new"}]
+        assert diff.changed == [({"Name": "Bob", "Status": "new"}, {"Name": "Bob", "Status": "done"})]
+        assert watcher.snapshot == [{"Name": "Bob", "Status": "done"}, {"Name": "Cid", "Status": "new"}]
+
+    @allure.title("Test refresh without changes")
+    def test_refresh_no_changes(self, watcher, mock_locator):
+        mock_locator.evaluate.return_value = {"order": None, "rows": []}
+
+        assert watcher.refresh().is_empty() is True
+        assert len(watcher.snapshot) == 2
+
+    @allure.title("Test wait for row checks changed rows")
+    def test_wait_for_row(self, watcher, mock_locator, mock_page):
+        mock_locator.evaluate.side_effect = [
+            {"order": None, "rows": []},
+            {"order": None, "rows": [[0, ["Ann", "done"]]]},
+        ]
+
+        row = watcher.wait_for_row(lambda row: row["Status"] == "done")
+
+        assert row == {"Name": "Ann", "Status": "done"}
+        mock_page.wait_for_timeout.assert_called_once()
+
+    @allure.title("Test wait for row that never appears")
+    def test_wait_for_row_timeout(self, watcher, mock_locator):
+        mock_locator.evaluate.return_value = {"order": None, "rows": []}
+
+        with pytest.raises(TimeoutError):
+            watcher.wait_for_row(lambda row: row["Name"] == "Zed", timeout=0)
+
+    @allure.title("Test refresh of a table that is no longer watched")
+    def test_refresh_not_watched(self, watcher, mock_locator):
+        mock_locator.evaluate.return_value = None
+
+        with pytest.raises(RuntimeError):
+            watcher.refresh()
+
+    @allure.title("Test watching the same table again starts from a full snapshot")
+    def test_watch_stop_watch(self, watcher, mock_page, mock_locator):
+        watcher.stop()
+        assert mock_locator.evaluate.call_args.args[0] == WATCH_STOP_JS
+
+        # The new watch numbers the rows again and reads all of them
+        mock_locator.evaluate.side_effect = [
+            ["Name", "Status"],
+            {"order": [0, 1], "rows": [[0, ["Ann", "done"]], [1, ["Bob", "new"]]]},
+            {"order": [0, 1, 2], "rows": [[2, ["Cid", "new"]]]},
+        ]
+        second = TableWatcher(mock_page, mock_locator, "Jobs", {}).start()
+
+        assert second.snapshot == [{"Name": "Ann", "Status": "done"}, {"Name": "Bob", "Status": "new"}]
+        assert second.wait_for_row(lambda row: row["Name"] == "Cid", timeout=0) == {"Name": "Cid", "Status": "new"}
+        assert len(second.snapshot) == 3
+
+    @allure.title("Test rows in the order that were never read are reported")
+    def test_refresh_out_of_sync(self, watcher, mock_locator):
+        mock_locator.evaluate.return_value = {"order": [0, 1, 5], "rows": []}
+
+        with pytest.raises(RuntimeError, match=r"rows \[5\]"):
+            watcher.refresh()
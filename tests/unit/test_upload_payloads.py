@@ -0,0 +1,127 @@
+import pathlib
+
+import pytest
+import allure
+from unittest.mock import Mock
+from playwright.sync_api import Page, Locator
+
+from framework.ui.elements.file_uploader import FileUploader
+from framework.ui.elements.helpers.upload_payloads import (PAYLOAD_SIZE_LIMIT_BYTES, BufferPayload, MappedFilePayload,
+                                                          PayloadStager, SyntheticPayload, needs_staging,
+                                                          normalize_upload_items)
+
+
+@allure.feature("Framework")
+@allure.story("Upload Payloads")
+@pytest.mark.unit
+class TestUploadPayloads:
+
+    @allure.title("Test synthetic payload repeats the pattern up to the size")
+    @pytest.mark.parametrize("size, chunk_size", [(0, 4), (10, 4), (10, 3), (7, 100)])
+    def test_synthetic_payload(self, size, chunk_size):
+        payload = SyntheticPayload("data.bin", size, pattern=b"abc")
+
+        content = b"".join(payload.iter_chunks(chunk_size))
+
+        assert content == (b"abc" * size)[:size]
+        assert payload.size == size
+
+    @allure.title("Test MIME type is guessed from the name")
+    def test_mime_type(self):
+        assert BufferPayload("report.csv", b"a,b").mime_type == "text/csv"
+        assert SyntheticPayload("blob", 1).mime_type == "application/octet-stream"
+
+    @allure.title("Test memory-mapped file payload")
+    def test_mapped_file_payload(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+
+        payload = MappedFilePayload(path)
+
+        with payload.open_buffer() as buffer:
+            assert buffer[:] == b"0123456789"
+        assert buffer.closed
+        assert payload.get_buffer() == b"0123456789"
+        assert payload.path == path
+        assert MappedFilePayload(path, name="renamed.bin").path is None
+
+    @allure.title("Test FilePayload dicts are accepted")
+    def test_normalize_file_payload_dict(self):
+        items = normalize_upload_items({"name": "a.txt", "mimeType": "text/plain", "buffer": b"a"})
+
+        assert isinstance(items[0], BufferPayload)
+
+    @allure.title("Test invalid upload item")
+    def test_normalize_invalid_item(self):
+        with pytest.raises(TypeError):
+            normalize_upload_items([42])
+
+    @allure.title("Test staging is needed over the buffer limit or with paths")
+    @pytest.mark.parametrize("items, expected", [
+        ([SyntheticPayload("a.bin", 10)], False),
+        ([SyntheticPayload("a.bin", PAYLOAD_SIZE_LIMIT_BYTES + 1)], True),
+        ([SyntheticPayload("a.bin", 10), pathlib.Path("b.txt")], True),
+        ([pathlib.Path("b.txt")], False),
+    ])
+    def test_needs_staging(self, items, expected):
+        assert needs_staging(items) is expected
+
+    @allure.title("Test staged payload is written and cleaned up")
+    def test_stager(self, tmp_path):
+        with PayloadStager(tmp_path) as stager:
+            path = stager.stage(SyntheticPayload("data.bin", 5, pattern=b"xy"))
+            assert path.name == "data.bin"
+            assert path.read_bytes() == b"xyxyx"
+
+        assert not path.exists()
+
+
+@allure.feature("Framework")
+@allure.story("File Uploader")
+@pytest.mark.unit
+class TestFileUploader:
+
+    @pytest.fixture
+    def mock_locator(self):
+        return Mock(spec=Locator)
+
+    @pytest.fixture
+    def uploader(self, mock_locator):
+        page = Mock(spec=Page)
+        page.locator.return_value = mock_locator
+        return FileUploader(page, "input[type=file]", "Attachment")
+
+    @allure.title("Test small payload is sent as a buffer")
+    def test_upload_buffer(self, uploader, mock_locator):
+        uploader.upload_files(BufferPayload("a.txt", b"hello"))
+
+        mock_locator.set_input_files.assert_called_once_with(
+            [{"name": "a.txt", "mimeType": "text/plain", "buffer": b"hello"}])
+
+    @allure.title("Test memory-mapped payload is closed after the upload")
+    def test_upload_mapped_file(self, uploader, mock_locator, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+        sent = []
+        mock_locator.set_input_files.side_effect = lambda files: sent.append((files[0]["buffer"][:],
+                                                                             files[0]["buffer"]))
+
+        uploader.upload_files(MappedFilePayload(path))
+
+        content, buffer = sent[0]
+        assert content == b"0123456789"
+        assert buffer.closed
+
+    @allure.title("Test paths are uploaded as paths")
+    def test_upload_paths(self, uploader, mock_locator):
+        uploader.upload_files(["a.txt", pathlib.Path("b.txt")])
+
+        mock_locator.set_input_files.assert_called_once_with([pathlib.Path("a.txt"), pathlib.Path("b.txt")])
+
+    @allure.title("Test payloads mixed with paths are staged as files")
+    def test_upload_mixed(self, uploader, mock_locator):
+        uploader.upload_files(["a.txt", SyntheticPayload("b.bin", 3)])
+
+        (files,), _ = mock_locator.set_input_files.call_args
+        assert files[0] == pathlib.Path("a.txt")
+        assert files[1].name == "b.bin"
@@ -0,0 +1,185 @@
+import numpy as np
+import pytest
+import allure
+from unittest.mock import Mock, patch
+from playwright.sync_api import Page
+
+from framework.ui.visual.baselines import BaselineStore
+from framework.ui.visual.comparison import (DIFF_COLOR, ComparisonOptions, MatchMethod, compare_images, encode_png,
+                                           hash_distance, load_image, perceptual_hash)
+
+
+def make_image(height: int = 64, width: int = 96) -> np.ndarray:
+    """Gradient image with a dark square, so it has structure for the perceptual hash."""
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[..., 0] = np.linspace(0, 255, width, dtype=np.uint8)[None, :]
+    image[..., 1] = np.linspace(0, 255, height, dtype=np.uint8)[:, None]
+    image[16:40, 20:50] = 30
+    return image
+
+
+@allure.feature("Framework")
+@allure.story("Visual Comparison")
+@pytest.mark.unit
+class TestVisualComparison:
+
+    @allure.title("Test identical images match without a pixel diff")
+    def test_identical(self):
+        result = compare_images(make_image(), make_image())
+
+        assert result.matched
+        assert result.method == MatchMethod.IDENTICAL
+
+    @allure.title("Test images of different sizes do not match")
+    def test_size_mismatch(self):
+        result = compare_images(make_image(64, 96), make_image(64, 95))
+
+        assert not result.matched
+        assert result.method == MatchMethod.SIZE_MISMATCH
+
+    @allure.title("Test small color noise is within the color threshold")
+    def test_color_threshold(self):
+        actual = make_image()
+        actual[::2] = np.clip(actual[::2].astype(np.int16) + 5, 0, 255)
+
+        result = compare_images(actual, make_image(), ComparisonOptions(phash_threshold=None))
+
+        assert result.matched
+        assert result.diff_pixels == 0
+
+    @allure.title("Test a small local change is a mismatch with the default options")
+    def test_local_change_default_options(self):
+        expected = np.full((720, 1280, 3), 240, dtype=np.uint8)
+        expected[100:600, 200:1000] = np.linspace(0, 255, 800, dtype=np.uint8)[None, :, None]
+        actual = expected.copy()
+        actual[300:310, 500:540] = 0
+
+        result = compare_images(actual, expected)
+
+        assert hash_distance(perceptual_hash(actual), perceptual_hash(expected)) == 0
+        assert not result.matched
+        assert result.method == MatchMethod.PIXEL_DIFF
+        assert result.diff_pixels == 400
+
+    @allure.title("Test perceptual hash quickly accepts near-identical images")
+    def test_perceptual_hash_accept(self):
+        actual = make_image()
+        actual[0, 0] = 255
+
+        result = compare_images(actual, make_image(), ComparisonOptions(phash_threshold=4))
+
+        assert result.matched
+        assert result.method == MatchMethod.PERCEPTUAL_HASH
+
+    @allure.title("Test perceptual hash distance grows with visual changes")
+    def test_perceptual_hash_distance(self):
+        changed = make_image()
+        changed[:, 48:] = 255 - changed[:, 48:]
+
+        assert hash_distance(perceptual_hash(make_image()), perceptual_hash(make_image())) == 0
+        assert hash_distance(perceptual_hash(changed), perceptual_hash(make_image())) > 4
+
+    @allure.title("Test localized change is reported by tile with a diff image")
+    def test_pixel_diff(self):
+        actual = make_image()
+        actual[50:54, 80:84] = (0, 0, 255)
+
+        result = compare_images(actual, make_image())
+
+        assert not result.matched
+        assert result.method == MatchMethod.PIXEL_DIFF
+        assert result.diff_pixels == 16
+        assert result.diff_tiles == [(1, 2)]
+        assert tuple(result.diff_image[51, 81]) == DIFF_COLOR
+        assert result.diff_image.shape == actual.shape
+
+    @allure.title("Test diff ratios are tolerated up to the limits")
+    def test_diff_ratio_limits(self):
+        actual = make_image()
+        actual[50:54, 80:84] = (0, 0, 255)
+
+        result = compare_images(actual, make_image(), ComparisonOptions(max_diff_ratio=0.01, max_tile_diff_ratio=0.02))
+
+        assert result.matched
+        assert result.diff_pixels == 16
+
+    @allure.title("Test edge shifted by one pixel is tolerated as anti-aliasing")
+    def test_anti_aliasing(self):
+        expected = np.full((32, 32, 3), 255, dtype=np.uint8)
+        expected[8:24, 10] = 0
+        actual = np.full((32, 32, 3), 255, dtype=np.uint8)
+        actual[8:24, 11] = 0
+
+        tolerant = compare_images(actual, expected)
+        strict = compare_images(actual, expected, ComparisonOptions(anti_aliasing=False))
+
+        assert tolerant.matched
+        assert tolerant.anti_aliased_pixels == 32
+        assert not strict.matched
+        assert strict.diff_pixels == 32
+
+    @allure.title("Test PNG round trip")
+    def test_png_round_trip(self):
+        assert np.array_equal(load_image(encode_png(make_image())), make_image())
+
+
+@allure.feature("Framework")
+@allure.story("Visual Baselines")
+@pytest.mark.unit
+class TestBaselineStore:
+
+    @pytest.fixture
+    def mock_page(self):
+        page = Mock(spec=Page)
+        page.context.browser.browser_type.name = "chromium"
+        page.viewport_size = {"width": 1280, "height": 720}
+        return page
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return BaselineStore(tmp_path / "baselines", tmp_path / "results")
+
+    @allure.title("Test baselines are keyed by browser and viewport")
+    def test_get_path(self, store, mock_page, tmp_path):
+        assert store.get_path(mock_page, "home/header") == tmp_path / "baselines/chromium_1280x720/home/header.png"
+
+    @allure.title("Test missing baseline is created from the screenshot")
+    def test_new_baseline(self, store, mock_page):
+        png = encode_png(make_image())
+
+        result = store.assert_matches(mock_page, "page", png)
+
+        assert result.method == MatchMethod.NEW_BASELINE
+        assert store.get_path(mock_page, "page").read_bytes() == png
+
+    @allure.title("Test matching screenshot passes")
+    def test_matching_screenshot(self, store, mock_page):
+        png = encode_png(make_image())
+        store.assert_matches(mock_page, "page", png)
+
+        assert store.assert_matches(mock_page, "page", png).method == MatchMethod.IDENTICAL
+
+    @allure.title("Test mismatch saves actual and diff images and fails")
+    @patch("framework.ui.visual.baselines.allure.attach")
+    def test_mismatch(self, mock_attach, store, mock_page, tmp_path):
+        store.assert_matches(mock_page, "page", encode_png(make_image()))
+        changed = make_image()
+        changed[0:8, 0:8] = (0, 0, 255)
+
+        with pytest.raises(AssertionError, match="does not match baseline"):
+            store.assert_matches(mock_page, "page", encode_png(changed))
+
+        results_dir = tmp_path / "results/chromium_1280x720"
+        assert (results_dir / "page.actual.png").exists()
+        assert (results_dir / "page.diff.png").exists()
+        assert mock_attach.call_count == 3
+
+    @allure.title("Test update mode replaces the baseline")
+    def test_update(self, store, mock_page):
+        store.assert_matches(mock_page, "page", encode_png(make_image()))
+        store.configure(update=True)
+        changed = encode_png(np.zeros((64, 96, 3), dtype=np.uint8))
+
+        store.assert_matches(mock_page, "page", changed)
+
+        assert store.get_path(mock_page, "page").read_bytes() == changed
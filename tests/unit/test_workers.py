@@ -0,0 +1,107 @@
+import pytest
+import allure
+from unittest.mock import Mock
+
+from framework.execution import workers
+from framework.execution.workers import EngineSlots, SharedResources
+
+
+@allure.feature("Framework")
+@allure.story("Parallel Workers")
+@pytest.mark.unit
+class TestWorkers:
+
+    @allure.title("Test worker id without xdist")
+    def test_worker_id_master(self, monkeypatch):
+        monkeypatch.delenv(workers.XDIST_WORKER_ENV, raising=False)
+
+        assert workers.get_worker_id() == workers.MASTER_WORKER_ID
+        assert workers.is_xdist_worker() is False
+
+    @allure.title("Test per-worker directory for xdist worker")
+    def test_worker_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(workers.XDIST_WORKER_ENV, "gw3")
+
+        assert workers.get_worker_dir(tmp_path) == tmp_path / "gw3"
+
+    @allure.title("Test worker directory is the base directory without xdist")
+    def test_worker_dir_master(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(workers.XDIST_WORKER_ENV, raising=False)
+
+        assert workers.get_worker_dir(tmp_path) == tmp_path
+
+
+@allure.feature("Framework")
+@allure.story("Shared Resources")
+@pytest.mark.unit
+class TestSharedResources:
+
+    @pytest.fixture
+    def resources(self, tmp_path):
+        return SharedResources(tmp_path / "shared")
+
+    @allure.title("Test resource is built only once")
+    def test_get_or_create_builds_once(self, resources):
+        factory = Mock(return_value={"cookies": []})
+
+        first = resources.get_or_create("state", factory)
+        second = resources.get_or_create("state", factory)
+
+        assert first == second == {"cookies": []}
+        factory.assert_called_once()
+
+    @allure.title("Test resource is shared between instances on the same directory")
+    def test_get_or_create_shared(self, resources):
+        resources.get_or_create("token", lambda: "abc")
+        other_worker = SharedResources(resources.root_dir)
+
+        assert other_worker.get_or_create("token", lambda: "other") == "abc"
+
+    @allure.title("Test invalidated resource is rebuilt")
+    def test_invalidate(self, resources):
+        resources.get_or_create("token", lambda: "old")
+
+        resources.invalidate("token")
+
+        assert resources.get_or_create("token", lambda: "new") == "new"
+
+
+@allure.feature("Framework")
+@allure.story("Engine Slots")
+@pytest.mark.unit
+class TestEngineSlots:
+
+    @allure.title("Test slot is released after the block")
+    def test_acquire_release(self, tmp_path):
+        slots = EngineSlots(tmp_path, limit=1)
+
+        with slots.acquire("webkit"):
+            pass
+
+        with slots.acquire("webkit"):
+            pass
+
+    @allure.title("Test engines have independent slots")
+    def test_independent_engines(self, tmp_path):
+        slots = EngineSlots(tmp_path, limit=1)
+
+        with slots.acquire("webkit"):
+            with slots.acquire("firefox"):
+                pass
+
+    @allure.title("Test busy slots make the caller wait")
+    def test_busy_slot(self, tmp_path, monkeypatch):
+        slots = EngineSlots(tmp_path, limit=1)
+        other_worker = EngineSlots(tmp_path, limit=1)
+        sleep = Mock(side_effect=RuntimeError("waiting"))
+        monkeypatch.setattr(workers.time, "sleep", sleep)
+
+        with slots.acquire("webkit"):
+            with pytest.raises(RuntimeError, match="waiting"):
+                with other_worker.acquire("webkit"):
+                    pass
+
+    @allure.title("Test invalid slot limit")
+    def test_invalid_limit(self, tmp_path):
+        with pytest.raises(ValueError):
+            EngineSlots(tmp_path, limit=0)